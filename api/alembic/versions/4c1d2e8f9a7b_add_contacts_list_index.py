@@ -0,0 +1,31 @@
+"""add contacts list index
+
+Revision ID: 4c1d2e8f9a7b
+Revises: 93b5f5494ea6
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1d2e8f9a7b'
+down_revision: Union[str, None] = '93b5f5494ea6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_contacts_created_at_id',
+        'contacts',
+        [sa.text('created_at DESC'), 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_created_at_id', table_name='contacts')
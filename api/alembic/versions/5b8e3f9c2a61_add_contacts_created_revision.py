@@ -0,0 +1,61 @@
+"""add contacts created revision
+
+Revision ID: 5b8e3f9c2a61
+Revises: c47e9b2a5d18
+Create Date: 2026-10-18 23:10:42.286054
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e3f9c2a61'
+down_revision: Union[str, None] = 'c47e9b2a5d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DROP TRIGGER contacts_revision_insert")
+    op.add_column(
+        'contacts',
+        sa.Column(
+            'created_revision', sa.Integer(), server_default=sa.text('0'), nullable=False
+        ),
+    )
+    # a contact never updated was created at its revision. The creation of an
+    # updated one is lost, so it is put before every cursor but 0
+    op.execute(
+        """
+        UPDATE contacts
+        SET created_revision = CASE WHEN version = 1 THEN revision ELSE 1 END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_revision_insert AFTER INSERT ON contacts BEGIN
+            UPDATE contacts_revision SET revision = revision + 1;
+            UPDATE contacts SET
+                revision = (SELECT revision FROM contacts_revision),
+                created_revision = (SELECT revision FROM contacts_revision)
+            WHERE rowid = new.rowid;
+        END
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER contacts_revision_insert")
+    op.drop_column('contacts', 'created_revision')
+    op.execute(
+        """
+        CREATE TRIGGER contacts_revision_insert AFTER INSERT ON contacts BEGIN
+            UPDATE contacts_revision SET revision = revision + 1;
+            UPDATE contacts SET revision = (SELECT revision FROM contacts_revision)
+            WHERE rowid = new.rowid;
+        END
+        """
+    )
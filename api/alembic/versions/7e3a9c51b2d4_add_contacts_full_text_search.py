@@ -0,0 +1,64 @@
+"""add contacts full text search
+
+Revision ID: 7e3a9c51b2d4
+Revises: 4c1d2e8f9a7b
+Create Date: 2026-10-18 10:03:17.524810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e3a9c51b2d4'
+down_revision: Union[str, None] = '4c1d2e8f9a7b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE contacts_fts USING fts5(
+            name, email, address, content='contacts', content_rowid='rowid',
+            prefix='2 3'
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_fts_insert AFTER INSERT ON contacts BEGIN
+            INSERT INTO contacts_fts (rowid, name, email, address)
+            VALUES (new.rowid, new.name, new.email, new.address);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_fts_delete AFTER DELETE ON contacts BEGIN
+            INSERT INTO contacts_fts (contacts_fts, rowid, name, email, address)
+            VALUES ('delete', old.rowid, old.name, old.email, old.address);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_fts_update AFTER UPDATE OF name, email, address
+        ON contacts BEGIN
+            INSERT INTO contacts_fts (contacts_fts, rowid, name, email, address)
+            VALUES ('delete', old.rowid, old.name, old.email, old.address);
+            INSERT INTO contacts_fts (rowid, name, email, address)
+            VALUES (new.rowid, new.name, new.email, new.address);
+        END
+        """
+    )
+    # index the contacts that already exist
+    op.execute("INSERT INTO contacts_fts (contacts_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER contacts_fts_update")
+    op.execute("DROP TRIGGER contacts_fts_delete")
+    op.execute("DROP TRIGGER contacts_fts_insert")
+    op.execute("DROP TABLE contacts_fts")
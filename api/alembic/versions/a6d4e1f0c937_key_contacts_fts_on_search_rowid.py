@@ -0,0 +1,101 @@
+"""key contacts full text search on search_rowid
+
+Revision ID: a6d4e1f0c937
+Revises: f3c9d1a4b258
+Create Date: 2026-10-18 21:12:40.118263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d4e1f0c937'
+down_revision: Union[str, None] = 'f3c9d1a4b258'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def drop_fts() -> None:
+    op.execute("DROP TRIGGER contacts_fts_update")
+    op.execute("DROP TRIGGER contacts_fts_delete")
+    op.execute("DROP TRIGGER contacts_fts_insert")
+    op.execute("DROP TABLE contacts_fts")
+
+
+def create_fts(key: str, insert_body: str) -> None:
+    op.execute(
+        f"""
+        CREATE VIRTUAL TABLE contacts_fts USING fts5(
+            name, email, address, content='contacts', content_rowid='{key}',
+            prefix='2 3'
+        )
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER contacts_fts_insert AFTER INSERT ON contacts BEGIN
+            {insert_body}
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER contacts_fts_delete AFTER DELETE ON contacts BEGIN
+            INSERT INTO contacts_fts (contacts_fts, rowid, name, email, address)
+            VALUES ('delete', old.{key}, old.name, old.email, old.address);
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER contacts_fts_update AFTER UPDATE OF name, email, address
+        ON contacts BEGIN
+            INSERT INTO contacts_fts (contacts_fts, rowid, name, email, address)
+            VALUES ('delete', old.{key}, old.name, old.email, old.address);
+            INSERT INTO contacts_fts (rowid, name, email, address)
+            VALUES (new.{key}, new.name, new.email, new.address);
+        END
+        """
+    )
+    # index the contacts that already exist
+    op.execute("INSERT INTO contacts_fts (contacts_fts) VALUES ('rebuild')")
+
+
+def upgrade() -> None:
+    drop_fts()
+
+    op.add_column('contacts', sa.Column('search_rowid', sa.Integer(), nullable=True))
+    op.execute("UPDATE contacts SET search_rowid = rowid")
+    op.create_index(
+        'ix_contacts_search_rowid', 'contacts', ['search_rowid'], unique=True
+    )
+
+    create_fts(
+        'search_rowid',
+        """
+        UPDATE contacts
+        SET search_rowid = (SELECT coalesce(max(search_rowid), 0) + 1 FROM contacts)
+        WHERE rowid = new.rowid;
+        INSERT INTO contacts_fts (rowid, name, email, address)
+        SELECT search_rowid, name, email, address FROM contacts
+        WHERE rowid = new.rowid;
+        """,
+    )
+
+
+def downgrade() -> None:
+    drop_fts()
+
+    op.drop_index('ix_contacts_search_rowid', table_name='contacts')
+    op.drop_column('contacts', 'search_rowid')
+
+    create_fts(
+        'rowid',
+        """
+        INSERT INTO contacts_fts (rowid, name, email, address)
+        VALUES (new.rowid, new.name, new.email, new.address);
+        """,
+    )
@@ -0,0 +1,32 @@
+"""add contacts autocomplete indexes
+
+Revision ID: b81f0d6c3e25
+Revises: 7e3a9c51b2d4
+Create Date: 2026-10-18 11:26:54.071392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81f0d6c3e25'
+down_revision: Union[str, None] = '7e3a9c51b2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_contacts_name_lower', 'contacts', [sa.text('lower(name)')], unique=False
+    )
+    op.create_index(
+        'ix_contacts_email_lower', 'contacts', [sa.text('lower(email)')], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_email_lower', table_name='contacts')
+    op.drop_index('ix_contacts_name_lower', table_name='contacts')
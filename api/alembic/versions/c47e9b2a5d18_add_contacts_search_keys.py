@@ -0,0 +1,82 @@
+"""add contacts search keys
+
+Revision ID: c47e9b2a5d18
+Revises: a6d4e1f0c937
+Create Date: 2026-10-18 22:04:17.530912
+
+"""
+from typing import Sequence, Union
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47e9b2a5d18'
+down_revision: Union[str, None] = 'a6d4e1f0c937'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def search_key(value: str) -> str:
+    # frozen copy of schemas.contact.search_key, as of this revision
+    return unicodedata.normalize("NFKC", value).casefold()
+
+
+def upgrade() -> None:
+    op.add_column(
+        'contacts',
+        sa.Column('name_key', sa.String(length=255), nullable=False, server_default=''),
+    )
+    op.add_column(
+        'contacts',
+        sa.Column('email_key', sa.String(length=255), nullable=False, server_default=''),
+    )
+
+    conn = op.get_bind()
+    contacts = sa.table(
+        'contacts',
+        sa.column('id', sa.Uuid),
+        sa.column('name', sa.String),
+        sa.column('email', sa.String),
+        sa.column('name_key', sa.String),
+        sa.column('email_key', sa.String),
+    )
+    rows = [
+        {
+            'contact_id': contact_id,
+            'name_key': search_key(name),
+            'email_key': search_key(email),
+        }
+        for contact_id, name, email in conn.execute(
+            sa.select(contacts.c.id, contacts.c.name, contacts.c.email)
+        )
+    ]
+    if rows:
+        conn.execute(
+            contacts.update()
+            .where(contacts.c.id == sa.bindparam('contact_id'))
+            .values(
+                name_key=sa.bindparam('name_key'), email_key=sa.bindparam('email_key')
+            ),
+            rows,
+        )
+
+    op.drop_index('ix_contacts_email_lower', table_name='contacts')
+    op.drop_index('ix_contacts_name_lower', table_name='contacts')
+    op.create_index('ix_contacts_name_key', 'contacts', ['name_key'], unique=False)
+    op.create_index('ix_contacts_email_key', 'contacts', ['email_key'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_email_key', table_name='contacts')
+    op.drop_index('ix_contacts_name_key', table_name='contacts')
+    op.create_index(
+        'ix_contacts_name_lower', 'contacts', [sa.text('lower(name)')], unique=False
+    )
+    op.create_index(
+        'ix_contacts_email_lower', 'contacts', [sa.text('lower(email)')], unique=False
+    )
+    op.drop_column('contacts', 'email_key')
+    op.drop_column('contacts', 'name_key')
@@ -0,0 +1,57 @@
+"""add contacts revision counter
+
+Revision ID: d5f2a7c9e413
+Revises: b81f0d6c3e25
+Create Date: 2026-10-18 13:12:40.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f2a7c9e413'
+down_revision: Union[str, None] = 'b81f0d6c3e25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE contacts_revision (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            revision INTEGER NOT NULL
+        )
+        """
+    )
+    op.execute("INSERT INTO contacts_revision (id, revision) VALUES (1, 0)")
+    op.execute(
+        """
+        CREATE TRIGGER contacts_revision_insert AFTER INSERT ON contacts BEGIN
+            UPDATE contacts_revision SET revision = revision + 1;
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_revision_delete AFTER DELETE ON contacts BEGIN
+            UPDATE contacts_revision SET revision = revision + 1;
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_revision_update AFTER UPDATE ON contacts BEGIN
+            UPDATE contacts_revision SET revision = revision + 1;
+        END
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER contacts_revision_update")
+    op.execute("DROP TRIGGER contacts_revision_delete")
+    op.execute("DROP TRIGGER contacts_revision_insert")
+    op.execute("DROP TABLE contacts_revision")
@@ -0,0 +1,29 @@
+"""add contacts version
+
+Revision ID: e2b6c8d0f147
+Revises: d5f2a7c9e413
+Create Date: 2026-10-18 14:05:51.902364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b6c8d0f147'
+down_revision: Union[str, None] = 'd5f2a7c9e413'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'contacts',
+        sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('contacts', 'version')
@@ -0,0 +1,128 @@
+"""add contacts change feed
+
+Revision ID: f3c9d1a4b258
+Revises: e2b6c8d0f147
+Create Date: 2026-10-18 15:02:17.640391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c9d1a4b258'
+down_revision: Union[str, None] = 'e2b6c8d0f147'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def drop_revision_triggers() -> None:
+    op.execute("DROP TRIGGER contacts_revision_update")
+    op.execute("DROP TRIGGER contacts_revision_delete")
+    op.execute("DROP TRIGGER contacts_revision_insert")
+
+
+def upgrade() -> None:
+    drop_revision_triggers()
+
+    op.add_column(
+        'contacts',
+        sa.Column('revision', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    )
+    op.add_column('contacts', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.create_index('ix_contacts_revision', 'contacts', ['revision'], unique=False)
+    op.create_table(
+        'contact_tombstones',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('revision', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        op.f('ix_contact_tombstones_revision'), 'contact_tombstones', ['revision'], unique=False
+    )
+
+    # existing contacts enter the feed oldest first, each at its own revision, as
+    # the feed cursor must not split contacts sharing a revision across pages
+    op.execute(
+        """
+        UPDATE contacts SET
+            revision = (SELECT revision FROM contacts_revision) + ordered.position,
+            updated_at = contacts.created_at
+        FROM (
+            SELECT rowid AS contact_rowid,
+                row_number() OVER (ORDER BY created_at, id) AS position
+            FROM contacts
+        ) AS ordered
+        WHERE contacts.rowid = ordered.contact_rowid
+        """
+    )
+    op.execute(
+        """
+        UPDATE contacts_revision
+        SET revision = max(revision, (SELECT coalesce(max(revision), 0) FROM contacts))
+        """
+    )
+
+    op.execute(
+        """
+        CREATE TRIGGER contacts_revision_insert AFTER INSERT ON contacts BEGIN
+            UPDATE contacts_revision SET revision = revision + 1;
+            UPDATE contacts SET revision = (SELECT revision FROM contacts_revision)
+            WHERE rowid = new.rowid;
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_revision_delete AFTER DELETE ON contacts BEGIN
+            UPDATE contacts_revision SET revision = revision + 1;
+            INSERT OR REPLACE INTO contact_tombstones (id, revision, deleted_at)
+            VALUES (old.id, (SELECT revision FROM contacts_revision), CURRENT_TIMESTAMP);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_revision_update
+        AFTER UPDATE OF name, email, phone, address, version ON contacts BEGIN
+            UPDATE contacts_revision SET revision = revision + 1;
+            UPDATE contacts SET revision = (SELECT revision FROM contacts_revision)
+            WHERE rowid = new.rowid;
+        END
+        """
+    )
+
+
+def downgrade() -> None:
+    drop_revision_triggers()
+
+    op.drop_index(op.f('ix_contact_tombstones_revision'), table_name='contact_tombstones')
+    op.drop_table('contact_tombstones')
+    op.drop_index('ix_contacts_revision', table_name='contacts')
+    op.drop_column('contacts', 'updated_at')
+    op.drop_column('contacts', 'revision')
+
+    op.execute(
+        """
+        CREATE TRIGGER contacts_revision_insert AFTER INSERT ON contacts BEGIN
+            UPDATE contacts_revision SET revision = revision + 1;
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_revision_delete AFTER DELETE ON contacts BEGIN
+            UPDATE contacts_revision SET revision = revision + 1;
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_revision_update AFTER UPDATE ON contacts BEGIN
+            UPDATE contacts_revision SET revision = revision + 1;
+        END
+        """
+    )
@@ -0,0 +1,152 @@
+"""
+Throughput of the contact list endpoint under many concurrent requests, served
+by a sync route on the threadpool versus the app's async route. Run from the api
+directory, with DB_ASYNC=true to load the async route on aiosqlite sessions
+rather than the default sync sessions in the threadpool:
+
+    python -m benchmarks.async_routes_bench --concurrency 200 --threads 40
+
+The sync route is the list endpoint as it was before the async path, a def route
+on ContactService and a sync session. Both routes run in process through httpx's
+ASGI transport against the same database file, tuned by the default EngineProfile.
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Annotated
+import anyio.to_thread
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from core.db import (
+    EngineProfile,
+    create_async_profile_engine,
+    create_profile_engine,
+    engine_profile,
+    get_async_session,
+    get_session,
+)
+from main import app as async_app
+from services.contact import ContactService
+from benchmarks.sqlite_profile_bench import seed
+
+
+def sync_app(session_factory: sessionmaker) -> FastAPI:
+    """An app serving the list endpoint from a sync def route"""
+
+    def get_sync_session():
+        with session_factory() as sess:
+            yield sess
+
+    app = FastAPI()
+
+    @app.get("/api/v1/contacts/")
+    def contact_list_route(
+        service: Annotated[ContactService, Depends(ContactService)],
+        session: Annotated[Session, Depends(get_sync_session)],
+        limit: int = 50,
+    ):
+        contacts, next_cursor = service.get_contacts_page(session, limit)
+        return {"items": contacts, "next_cursor": next_cursor}
+
+    return app
+
+
+async def load(app: FastAPI, concurrency: int, requests: int) -> dict:
+    """Send requests from concurrency clients at once and time every response"""
+
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def worker(count: int):
+            for _ in range(count):
+                start = time.perf_counter()
+                response = await client.get("/api/v1/contacts/", params={"limit": 20})
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(worker(requests // concurrency) for _ in range(concurrency))
+        )
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": latencies[len(latencies) // 2] * 1000,
+        "p99": latencies[int(len(latencies) * 0.99)] * 1000,
+    }
+
+
+async def run(args, directory: str):
+    """Seed the database, then load the sync route and the async route in turn"""
+
+    anyio.to_thread.current_default_thread_limiter().total_tokens = args.threads
+
+    profile = EngineProfile(url=f"sqlite:///{Path(directory) / 'bench.db'}")
+    engine = create_profile_engine(profile)
+    async_engine = create_async_profile_engine(profile)
+    seed(engine, args.rows)
+
+    bench_session = sessionmaker(autoflush=False, bind=engine)
+    bench_async_session = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    def get_bench_session():
+        with bench_session() as sess:
+            yield sess
+
+    async def get_bench_async_session():
+        async with bench_async_session() as sess:
+            yield sess
+
+    async_app.dependency_overrides[get_session] = get_bench_session
+    async_app.dependency_overrides[get_async_session] = get_bench_async_session
+    apps = {
+        "sync": sync_app(bench_session),
+        "aiosqlite" if engine_profile.async_sessions else "async": async_app,
+    }
+
+    print(
+        f"{args.concurrency} concurrent clients, {args.requests} requests, "
+        f"{args.threads} threadpool workers, {args.rows} rows"
+    )
+    for name, app in apps.items():
+        await load(app, args.concurrency, args.concurrency)  # warm up
+        result = await load(app, args.concurrency, args.requests)
+        print(
+            f"{name:>9}: {result['rps']:7.0f} req/s "
+            f"p50 {result['p50']:7.1f} ms p99 {result['p99']:7.1f} ms"
+        )
+
+    async_app.dependency_overrides.clear()
+    await async_engine.dispose()
+    engine.dispose()
+
+
+def main():
+    """Compare the sync and async list routes"""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--threads", type=int, default=40)
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(args, directory))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Rows per second of the contact list and export read paths, loading ORM contacts
+versus the plain column rows ContactService returns. Run from the api directory:
+
+    python -m benchmarks.read_path_bench --rows 100000 --repeat 3
+
+Each path reads every contact from a fresh database file and serialises it the
+way its endpoint does, so both query and serialisation time are measured.
+"""
+
+import argparse
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from faker import Faker
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from core.export import stream_export
+from core.responses import dump_rows
+from models.contact import ContactModel, StoredContactModel
+from schemas.contact import Base, Contact
+from services.contact import LIST_ORDER, ContactService
+
+fake = Faker()
+
+# How lists were serialised when the service returned ORM contacts
+ORM_LIST_ADAPTER = TypeAdapter(list[StoredContactModel])
+
+
+def seed(engine, rows: int):
+    """Fill the database with rows contacts"""
+
+    Base.metadata.create_all(engine)
+    data = [
+        {
+            "id": uuid.uuid4(),
+            "name": fake.name(),
+            "email": fake.email(),
+            "phone": fake.phone_number(),
+            "address": fake.address(),
+        }
+        for _ in range(rows)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Contact), data)
+
+
+def orm_list(session: Session) -> bytes:
+    """The list as it was read before: identity mapped contacts, then validated"""
+
+    contacts = session.scalars(select(Contact).order_by(*LIST_ORDER)).all()
+    validated = ORM_LIST_ADAPTER.validate_python(contacts, from_attributes=True)
+    return ORM_LIST_ADAPTER.dump_json(validated)
+
+
+def row_list(session: Session) -> bytes:
+    """The list as it is read now: column rows dumped as they are"""
+
+    return dump_rows(ContactService().get_all_contacts(session))
+
+
+def orm_export(session: Session) -> int:
+    """The NDJSON export as it was read before, from partitions of contacts"""
+
+    stmt = select(Contact).order_by(*LIST_ORDER).execution_options(yield_per=1000)
+    size = 0
+    for chunk in session.scalars(stmt).partitions():
+        for contact in chunk:
+            data = ContactModel.model_validate(contact, from_attributes=True)
+            size += len(data.model_dump_json().encode() + b"\n")
+    return size
+
+
+def row_export(session: Session) -> int:
+    """The NDJSON export as it is read now, from partitions of column rows"""
+
+    chunks = ContactService().iter_contacts(session, 1000)
+    return sum(len(chunk) for chunk in stream_export(chunks, "ndjson"))
+
+
+def timed(engine, fn, repeat: int) -> float:
+    """Best time of repeat runs on a new session each, in seconds"""
+
+    best = float("inf")
+    for _ in range(repeat):
+        with Session(engine) as session:
+            start = time.perf_counter()
+            fn(session)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Compare the ORM and the column row read paths"""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'bench.db'}")
+        seed(engine, args.rows)
+
+        for name, orm, rows in (
+            ("list", orm_list, row_list),
+            ("export", orm_export, row_export),
+        ):
+            before = args.rows / timed(engine, orm, args.repeat)
+            after = args.rows / timed(engine, rows, args.repeat)
+            print(
+                f"{name:>6}: orm {before:9.0f} rows/s  rows {after:9.0f} rows/s "
+                f"({after / before:4.1f}x)"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+CPU cost of serialising contact responses, through FastAPI's default path
+versus the cached TypeAdapters in core/responses.py. Run from the api directory:
+
+    python -m benchmarks.serialization_bench --rows 10000 --repeat 20
+
+The default path is what FastAPI does with a route that returns contacts and no
+response model: jsonable_encoder, then json.dumps in JSONResponse. Contacts are
+built in memory, so no database time is measured; read_path_bench covers that.
+"""
+
+import argparse
+import time
+import uuid
+from datetime import datetime
+from faker import Faker
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from core.responses import dump_contact, dump_rows
+from schemas.contact import Contact
+
+fake = Faker()
+
+
+def make_contacts(rows: int) -> list[Contact]:
+    """Transient contacts with every column set, as if loaded from the database"""
+
+    contacts = []
+    for _ in range(rows):
+        contact = Contact(
+            name=fake.name(),
+            email=fake.email(),
+            phone=fake.phone_number(),
+            address=fake.address(),
+            id=uuid.uuid4(),
+        )
+        contact.created_at = contact.updated_at = datetime.now().replace(microsecond=0)
+        contact.version = 1
+        contacts.append(contact)
+    return contacts
+
+
+def default_path(content) -> bytes:
+    """Serialise the way FastAPI does without a response model"""
+
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def timed(fn, content, repeat: int) -> float:
+    """Best time of repeat runs, in milliseconds"""
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(content)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    """Compare the default and the adapter serialisation of contacts"""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # lists are read as dicts of the columns, details as copies of the instance
+    rows = [
+        {
+            key: value
+            for key, value in contact.__dict__.items()
+            if key != "_sa_instance_state"
+        }
+        for contact in make_contacts(args.rows)
+    ]
+    scenarios = {
+        f"list of {args.rows}": (rows, dump_rows),
+        "detail": (rows[0], dump_contact),
+    }
+
+    for name, (content, fast) in scenarios.items():
+        default = timed(default_path, content, args.repeat)
+        adapter = timed(fast, content, args.repeat)
+        print(
+            f"{name:>16}: default {default:9.3f} ms adapter {adapter:9.3f} ms "
+            f"({default / adapter:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Concurrent read/write throughput of the SQLite engine before and after the
+tuned EngineProfile in core/db.py. Run from the api directory:
+
+    python -m benchmarks.sqlite_profile_bench --seconds 5 --readers 8 --writers 2
+
+Readers page through the contact list and writers create contacts, all through
+ContactService, each on its own thread and session, against a fresh database file.
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from faker import Faker
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from core.db import EngineProfile, create_profile_engine, enable_savepoints
+from models.contact import InsertContactModel
+from schemas.contact import Base, Contact
+from services.contact import ContactService
+
+fake = Faker()
+
+
+def baseline_engine(url: str):
+    """The engine as it was configured before the profile, without SQL echo"""
+
+    return enable_savepoints(create_engine(url))
+
+
+def seed(engine, rows: int):
+    """Fill the database with rows contacts"""
+
+    Base.metadata.create_all(engine)
+    data = [
+        {
+            "id": uuid.uuid4(),
+            "name": fake.name(),
+            "email": fake.email(),
+            "phone": fake.phone_number(),
+            "address": fake.address(),
+        }
+        for _ in range(rows)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Contact), data)
+
+
+def run(engine, seconds: float, readers: int, writers: int) -> dict:
+    """Run readers and writers concurrently and count what they got done"""
+
+    session_factory = sessionmaker(autoflush=False, bind=engine)
+    service = ContactService()
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+
+    def count(key):
+        with lock:
+            counts[key] += 1
+
+    def reader():
+        while not stop.is_set():
+            with session_factory() as session:
+                try:
+                    service.get_contacts_page(session, 50)
+                    count("reads")
+                except Exception:  # pylint: disable=broad-exception-caught
+                    count("errors")
+
+    def writer():
+        while not stop.is_set():
+            new_contact = InsertContactModel(
+                name=fake.name(),
+                email=fake.email(),
+                phone=fake.phone_number(),
+                address=fake.address(),
+            )
+            with session_factory() as session:
+                try:
+                    service.create_contact(new_contact, session)
+                    count("writes")
+                except Exception:  # pylint: disable=broad-exception-caught
+                    count("errors")
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return {key: value / seconds for key, value in counts.items()}
+
+
+def main():
+    """Compare the baseline engine with the tuned profile"""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        scenarios = {
+            "baseline": baseline_engine(f"sqlite:///{Path(directory) / 'base.db'}"),
+            "profile": create_profile_engine(
+                EngineProfile(url=f"sqlite:///{Path(directory) / 'profile.db'}")
+            ),
+        }
+        print(
+            f"{args.readers} readers, {args.writers} writers, {args.rows} rows, "
+            f"{args.seconds}s per run"
+        )
+        for name, engine in scenarios.items():
+            seed(engine, args.rows)
+            result = run(engine, args.seconds, args.readers, args.writers)
+            print(
+                f"{name:>8}: {result['reads']:8.0f} reads/s "
+                f"{result['writes']:8.0f} writes/s {result['errors']:6.1f} errors/s"
+            )
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""In-process cache for hot records"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class LRUCache:
+    """
+    Thread-safe cache holding at most maxsize entries for up to ttl seconds each,
+    dropping the least recently used entry when it is full
+    Every invalidation bumps a generation counter. A reader that captured the
+    generation before loading from the database can pass it to set, so a value
+    read before a concurrent write committed is not stored after it
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 0 or ttl < 0:
+            raise ValueError("Cache maxsize and ttl must not be negative")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live entry for key, or default when it is missing or expired"""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self.clock():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> bool:
+        """
+        Store value under key, evicting the least recently used entry if full
+        Returns False without storing when anything was invalidated since generation
+        """
+
+        with self._lock:
+            if self.maxsize == 0 or (
+                generation is not None and generation != self.generation
+            ):
+                return False
+
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+            return True
+
+    def invalidate(self, *keys: Hashable):
+        """Drop the entries for keys"""
+
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> dict:
+        """Counters for sizing the cache"""
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Contacts by id, sized through CONTACT_CACHE_SIZE (0 disables it) and CONTACT_CACHE_TTL
+contact_cache = LRUCache(
+    maxsize=int(os.getenv("CONTACT_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("CONTACT_CACHE_TTL", "60")),
+)
@@ -0,0 +1,262 @@
+"""Compression of responses, negotiated through Accept-Encoding"""
+
+import os
+import zlib
+from dataclasses import dataclass
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional, br is only offered when it is installed
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional, zstd is only offered when it is installed
+    zstandard = None
+
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+
+class GzipCompressor:
+    """Incremental gzip stream"""
+
+    def __init__(self, level: int):
+        self._stream = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, more: bool) -> bytes:
+        """Compress data, flushing it so the client can decode it right away"""
+
+        flush = zlib.Z_SYNC_FLUSH if more else zlib.Z_FINISH
+        return self._stream.compress(data) + self._stream.flush(flush)
+
+
+class BrotliCompressor:
+    """Incremental brotli stream"""
+
+    def __init__(self, _level: int):
+        self._stream = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes, more: bool) -> bytes:
+        """Compress data, flushing it so the client can decode it right away"""
+
+        tail = self._stream.flush() if more else self._stream.finish()
+        return self._stream.process(data) + tail
+
+
+class ZstdCompressor:
+    """Incremental zstd stream"""
+
+    def __init__(self, _level: int):
+        self._stream = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def compress(self, data: bytes, more: bool) -> bytes:
+        """Compress data, flushing it so the client can decode it right away"""
+
+        flush = (
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            if more
+            else zstandard.COMPRESSOBJ_FLUSH_FINISH
+        )
+        return self._stream.compress(data) + self._stream.flush(flush)
+
+
+# Every encoding the middleware knows, by Accept-Encoding token
+COMPRESSORS = {
+    "br": BrotliCompressor,
+    "zstd": ZstdCompressor,
+    "gzip": GzipCompressor,
+}
+
+# Encodings whose library is installed
+AVAILABLE_ENCODINGS = {
+    "br": brotli is not None,
+    "zstd": zstandard is not None,
+    "gzip": True,
+}
+
+
+@dataclass(frozen=True)
+class CompressionProfile:
+    """
+    Settings for response compression, overridable through environment variables
+    encodings are in order of preference; those whose library is not installed
+    are skipped. Bodies under minimum_size bytes are sent as they are, as are
+    Server-Sent Events, which must reach the browser one event at a time
+    """
+
+    encodings: tuple[str, ...] = ("br", "zstd", "gzip")
+    minimum_size: int = 500  # bytes
+    gzip_level: int = 6
+    excluded_media_types: tuple[str, ...] = ("text/event-stream",)
+
+    def __post_init__(self):
+        for encoding in self.encodings:
+            if encoding not in COMPRESSORS:
+                raise ValueError(f"Unknown compression encoding: {encoding}")
+        if not 0 <= self.gzip_level <= 9:
+            raise ValueError(f"Invalid gzip level: {self.gzip_level}")
+
+    @classmethod
+    def from_env(cls) -> "CompressionProfile":
+        """Build a profile from the COMPRESSION_* environment variables"""
+
+        default = cls()
+        encodings = os.getenv("COMPRESSION_ENCODINGS", ",".join(default.encodings))
+        return cls(
+            encodings=tuple(
+                encoding.strip()
+                for encoding in encodings.split(",")
+                if encoding.strip()
+            ),
+            minimum_size=int(
+                os.getenv("COMPRESSION_MINIMUM_SIZE", str(default.minimum_size))
+            ),
+            gzip_level=int(
+                os.getenv("COMPRESSION_GZIP_LEVEL", str(default.gzip_level))
+            ),
+        )
+
+    @property
+    def available_encodings(self) -> tuple[str, ...]:
+        """The configured encodings that can be used here"""
+
+        return tuple(
+            encoding for encoding in self.encodings if AVAILABLE_ENCODINGS[encoding]
+        )
+
+
+def negotiate_encoding(accept_encoding: str, encodings: tuple[str, ...]) -> str | None:
+    """The first of encodings that Accept-Encoding allows, honouring q=0 and *"""
+
+    weights = {}
+    for item in accept_encoding.split(","):
+        token, _, params = item.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[token.strip().lower()] = weight
+
+    for encoding in encodings:
+        if weights.get(encoding, weights.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing response bodies, streamed ones chunk by chunk
+    Each chunk of a streaming response is flushed as soon as it is compressed,
+    so exports keep streaming instead of waiting on the compressor's buffer.
+    A strong ETag is made weak on an encoded body, as it would otherwise name
+    the bytes of every encoding at once. If-None-Match compares weakly, so
+    conditional GETs still match in any encoding
+    """
+
+    def __init__(self, app: ASGIApp, profile: CompressionProfile | None = None):
+        self.app = app
+        self.profile = profile or CompressionProfile()
+        self.encodings = self.profile.available_encodings
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("Accept-Encoding", "")
+        encoding = negotiate_encoding(accept_encoding, self.encodings)
+        responder = CompressionResponder(send, encoding, self.profile)
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    """Compresses the messages of one response before passing them to send"""
+
+    def __init__(self, send: Send, encoding: str | None, profile: CompressionProfile):
+        self._send = send
+        self.encoding = encoding
+        self.profile = profile
+        self.start_message: Message = {}
+        self.started = False
+        self.compressor = None
+
+    async def send(self, message: Message):
+        """
+        Hold back the response start until the first body chunk decides whether
+        and how the body is compressed
+        """
+
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            media_type = headers.get("Content-Type", "").split(";")[0].strip()
+            if (
+                "content-encoding" in headers
+                or media_type in self.profile.excluded_media_types
+            ):
+                # nothing to decide, so an event stream opens before its first event
+                self.started = True
+                await self._send(message)
+                return
+
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.started:
+            if self.compressor is not None:
+                message["body"] = self.compressor.compress(
+                    message.get("body", b""), message.get("more_body", False)
+                )
+            await self._send(message)
+            return
+
+        self.started = True
+        await self.start(message)
+
+    async def start(self, message: Message):
+        """Send the response start and first chunk, compressed when worth it"""
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not more_body and len(body) < self.profile.minimum_size:
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers.add_vary_header("Accept-Encoding")
+        if self.encoding is None:
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        compressor = COMPRESSORS[self.encoding](self.profile.gzip_level)
+        compressed = compressor.compress(body, more_body)
+        if not more_body and len(compressed) >= len(body):
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        etag = headers.get("ETag")
+        if etag and etag.startswith('"'):
+            headers["ETag"] = "W/" + etag
+        if more_body:
+            del headers["Content-Length"]
+            self.compressor = compressor
+        else:
+            headers["Content-Length"] = str(len(compressed))
+        message["body"] = compressed
+
+        await self._send(self.start_message)
+        await self._send(message)
@@ -1,10 +1,161 @@
 """Database module"""
 
+import os
+from dataclasses import dataclass
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine, StaticPool
+from sqlalchemy import create_engine, event, make_url, Engine, NullPool, StaticPool, URL
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """
+    Settings for the production engine, overridable through environment variables
+    The defaults suit SQLite serving concurrent requests: WAL so that readers do
+    not block on the writer, NORMAL sync (safe with WAL), a larger page cache,
+    memory-mapped reads and a busy timeout instead of failing on a locked database.
+    Routes query through sync sessions in the threadpool unless async_sessions
+    is set, when they await aiosqlite sessions on the event loop instead
+    """
+
+    url: str = "sqlite:///db.sqlite3"
+    echo: bool = False
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 256 * 1024 * 1024  # bytes
+    cache_size: int = -64 * 1024  # negative is KiB, so 64 MiB per connection
+    busy_timeout: int = 5000  # milliseconds
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30  # seconds
+    async_sessions: bool = False
+
+    def __post_init__(self):
+        if self.journal_mode.upper() not in JOURNAL_MODES:
+            raise ValueError(f"Unknown SQLite journal mode: {self.journal_mode}")
+        if self.synchronous.upper() not in SYNCHRONOUS_MODES:
+            raise ValueError(f"Unknown SQLite synchronous mode: {self.synchronous}")
+
+    @classmethod
+    def from_env(cls) -> "EngineProfile":
+        """Build a profile from DATABASE_URL and the DB_* environment variables"""
+
+        default = cls()
+        return cls(
+            url=os.getenv("DATABASE_URL", default.url),
+            echo=os.getenv("DB_ECHO", str(default.echo)).lower() == "true",
+            journal_mode=os.getenv("DB_JOURNAL_MODE", default.journal_mode),
+            synchronous=os.getenv("DB_SYNCHRONOUS", default.synchronous),
+            mmap_size=int(os.getenv("DB_MMAP_SIZE", str(default.mmap_size))),
+            cache_size=int(os.getenv("DB_CACHE_SIZE", str(default.cache_size))),
+            busy_timeout=int(os.getenv("DB_BUSY_TIMEOUT", str(default.busy_timeout))),
+            pool_size=int(os.getenv("DB_POOL_SIZE", str(default.pool_size))),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", str(default.max_overflow))),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", str(default.pool_timeout))),
+            async_sessions=(
+                os.getenv("DB_ASYNC", str(default.async_sessions)).lower() == "true"
+            ),
+        )
+
+    @property
+    def async_url(self) -> URL:
+        """The database url with an async driver, aiosqlite for SQLite"""
+
+        url = make_url(self.url)
+        if url.get_backend_name() == "sqlite" and url.get_driver_name() != "aiosqlite":
+            return url.set(drivername="sqlite+aiosqlite")
+
+        return url
+
+    @property
+    def pool_options(self) -> dict[str, int | float]:
+        """Pool sizing shared by the sync and async engines"""
+
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+        }
+
+    @property
+    def pragmas(self) -> dict[str, str | int]:
+        """SQLite pragmas applied to every new connection, in order"""
+
+        return {
+            "busy_timeout": self.busy_timeout,
+            "journal_mode": self.journal_mode.upper(),
+            "synchronous": self.synchronous.upper(),
+            "mmap_size": self.mmap_size,
+            "cache_size": self.cache_size,
+        }
+
+
+def enable_savepoints(target_engine: Engine) -> Engine:
+    """
+    Let SQLAlchemy emit BEGIN instead of the pysqlite driver, so that SAVEPOINT
+    (Session.begin_nested) stays inside the outer transaction. See
+    https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#serializable-isolation-savepoints-transactional-ddl
+    """
+
+    @event.listens_for(target_engine, "connect")
+    def disable_driver_transactions(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(target_engine, "begin")
+    def emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    return target_engine
+
+
+def apply_pragmas(target_engine: Engine, pragmas: dict[str, str | int]) -> Engine:
+    """Run the given SQLite pragmas on every new connection of the engine"""
+
+    @event.listens_for(target_engine, "connect")
+    def set_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    return target_engine
+
+
+def create_profile_engine(profile: EngineProfile) -> Engine:
+    """Create an engine with an explicitly sized pool, tuned when it is SQLite"""
+
+    target_engine = create_engine(
+        url=profile.url, echo=profile.echo, **profile.pool_options
+    )
+
+    if target_engine.dialect.name == "sqlite":
+        enable_savepoints(target_engine)
+        apply_pragmas(target_engine, profile.pragmas)
+
+    return target_engine
+
+
+def create_async_profile_engine(profile: EngineProfile) -> AsyncEngine:
+    """Async counterpart of create_profile_engine, on the profile's async driver"""
+
+    target_engine = create_async_engine(
+        url=profile.async_url, echo=profile.echo, **profile.pool_options
+    )
+
+    if target_engine.dialect.name == "sqlite":
+        # connection events are emitted by the sync engine the async one wraps
+        enable_savepoints(target_engine.sync_engine)
+        apply_pragmas(target_engine.sync_engine, profile.pragmas)
+
+    return target_engine
+
 
 # Production engine and session
-engine = create_engine(url="sqlite:///db.sqlite3", echo=True)
+engine_profile = EngineProfile.from_env()
+engine = create_profile_engine(engine_profile)
 Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -18,12 +169,40 @@ def get_session():
             sess.close()
 
 
-# Unit test engine and session
-TEST_DB_URL = "sqlite:///:memory:"
-test_engine = create_engine(
-    TEST_DB_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool
+# Production async engine and session. Objects are not expired on commit, as
+# reloading them lazily would need I/O outside of the session's await points
+async_engine = create_async_profile_engine(engine_profile)
+async_session = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+async def get_async_session():
+    """Production async session generator function"""
+
+    async with async_session() as sess:
+        try:
+            yield sess
+        finally:
+            await sess.close()
+
+
+# Unit test engines and sessions. Both engines open the same shared-cache
+# in-memory database, which lives as long as the sync engine's static connection
+TEST_DB_URL = "sqlite:///file:contacts_test?mode=memory&cache=shared&uri=true"
+test_engine = enable_savepoints(
+    create_engine(
+        TEST_DB_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
 )
 TestSession = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+async_test_engine = create_async_engine(
+    make_url(TEST_DB_URL).set(drivername="sqlite+aiosqlite"), poolclass=NullPool
+)
+enable_savepoints(async_test_engine.sync_engine)
+async_test_session = async_sessionmaker(
+    bind=async_test_engine, autoflush=False, expire_on_commit=False
+)
 
 
 def get_test_session():
@@ -34,3 +213,13 @@ def get_test_session():
             yield sess
         finally:
             sess.close()
+
+
+async def get_async_test_session():
+    """Unit test async session generator function"""
+
+    async with async_test_session() as sess:
+        try:
+            yield sess
+        finally:
+            await sess.close()
@@ -0,0 +1,49 @@
+"""Entity tag helpers for conditional GETs"""
+
+import hashlib
+import re
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag for a response body fully determined by parts"""
+
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Whether an If-None-Match header matches etag, using the weak comparison"""
+
+    if if_none_match is None:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def version_etag(version: int) -> str:
+    """Strong ETag of a single contact, which changes with every write"""
+
+    return f'"{version}"'
+
+
+def parse_if_match(if_match: str | None) -> list[int] | None:
+    """
+    Versions listed in an If-Match header, or None when any version will do
+    Unknown tags are dropped. A weak version tag is kept: the compression
+    middleware only weakens the tag of an encoded body, and it still names
+    the version the client read
+    """
+
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    return [
+        int(match.group(1))
+        for tag in if_match.split(",")
+        if (match := re.fullmatch(r'(?:W/)?"(\d+)"', tag.strip()))
+    ]
@@ -0,0 +1,70 @@
+"""Wake-ups for streams waiting on contact writes"""
+
+import asyncio
+import json
+import threading
+from typing import Any
+
+
+class ChangeNotifier:
+    """
+    Wakes every subscribed stream after a write is committed
+    Subscribers are asyncio events on their own loop, set through
+    call_soon_threadsafe so that writers on any thread can notify them.
+    A wake-up carries no payload: the stream reads what changed from the change
+    feed, so writes that land while it is busy coalesce into one wake-up
+    """
+
+    def __init__(self):
+        self._subscribers: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> asyncio.Event:
+        """Return an event that is set after every write, for the running loop"""
+
+        wake = asyncio.Event()
+        with self._lock:
+            self._subscribers.add((asyncio.get_running_loop(), wake))
+        return wake
+
+    def unsubscribe(self, wake: asyncio.Event):
+        """Stop waking the event returned by subscribe"""
+
+        with self._lock:
+            self._subscribers = {
+                subscriber
+                for subscriber in self._subscribers
+                if subscriber[1] is not wake
+            }
+
+    def notify(self):
+        """Wake every subscriber, dropping those whose loop has closed"""
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for loop, wake in subscribers:
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                self.unsubscribe(wake)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+
+def format_sse(event: str, data: Any, event_id: int | None = None) -> str:
+    """Serialise data as one Server-Sent Event, as JSON unless it is a string"""
+
+    if not isinstance(data, str):
+        data = json.dumps(data, separators=(",", ":"))
+
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines.append(f"event: {event}")
+    lines += [f"data: {line}" for line in data.splitlines() or [""]]
+    return "\n".join(lines) + "\n\n"
+
+
+# Streams of contact changes, notified by ContactService after every commit
+contact_changes = ChangeNotifier()
@@ -0,0 +1,53 @@
+"""Encoders for streaming contact exports"""
+
+import csv
+import io
+from typing import Iterable, Iterator, Mapping, Sequence
+from core.responses import ANY_ADAPTER
+from models.contact import ContactModel
+
+EXPORT_FIELDS = list(ContactModel.model_fields)
+
+
+def encode_ndjson(contacts: Sequence[Mapping]) -> bytes:
+    """Encode a chunk of contact rows as newline delimited JSON"""
+
+    return b"".join(
+        ANY_ADAPTER.dump_json({field: contact[field] for field in EXPORT_FIELDS})
+        + b"\n"
+        for contact in contacts
+    )
+
+
+def encode_csv(contacts: Sequence[Mapping]) -> bytes:
+    """Encode a chunk of contact rows as CSV rows, without the header"""
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for contact in contacts:
+        writer.writerow([contact[field] for field in EXPORT_FIELDS])
+    return buffer.getvalue().encode()
+
+
+def csv_header() -> bytes:
+    """CSV header row matching the exported contact fields"""
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(EXPORT_FIELDS)
+    return buffer.getvalue().encode()
+
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", encode_ndjson, b""),
+    "csv": ("text/csv", encode_csv, csv_header()),
+}
+
+
+def stream_export(chunks: Iterable[Sequence], export_format: str) -> Iterator[bytes]:
+    """Encode chunks of contacts one at a time so the export never sits in memory"""
+
+    _, encode, header = EXPORT_FORMATS[export_format]
+    if header:
+        yield header
+    for chunk in chunks:
+        yield encode(chunk)
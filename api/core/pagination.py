@@ -0,0 +1,26 @@
+"""Cursor helpers for keyset pagination"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from uuid import UUID
+from models.errors import InvalidCursorError
+
+
+def encode_cursor(created_at: datetime, contact_id: UUID) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor"""
+
+    payload = json.dumps([created_at.isoformat(), str(contact_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode an opaque cursor back into its (created_at, id) sort key"""
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, contact_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(contact_id)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
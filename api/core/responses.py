@@ -0,0 +1,36 @@
+"""JSON responses for contacts, serialised in one pass"""
+
+from typing import Any, Sequence
+from fastapi import Response
+from pydantic import TypeAdapter
+from models.contact import StoredContactModel
+
+# Built once, as building the validator and serialiser of an adapter is costly.
+# A contact is validated from an ORM object or dict, then dumped straight to
+# bytes by pydantic-core instead of through jsonable_encoder and json.dumps
+CONTACT_ADAPTER = TypeAdapter(StoredContactModel)
+# Lists are rows read by ContactService as dicts of their columns, already of the
+# column types, so they are dumped without a schema and without validation
+ANY_ADAPTER = TypeAdapter(Any)
+
+
+class JSONBytesResponse(Response):
+    """JSON response for a body that is already serialised"""
+
+    media_type = "application/json"
+
+
+def dump_contact(contact: Any, fields: Sequence[str] | None = None) -> bytes:
+    """Serialise one contact, or only its fields when they are given"""
+
+    if fields is not None:
+        return ANY_ADAPTER.dump_json({field: contact[field] for field in fields})
+
+    validated = CONTACT_ADAPTER.validate_python(contact, from_attributes=True)
+    return CONTACT_ADAPTER.dump_json(validated)
+
+
+def dump_rows(content: Any) -> bytes:
+    """Serialise contact rows, or a page of them, as they were read"""
+
+    return ANY_ADAPTER.dump_json(content)
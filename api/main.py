@@ -1,6 +1,7 @@
 """Main module"""
 
 from fastapi import FastAPI
+from core.compression import CompressionMiddleware, CompressionProfile
 from routes.v1.router import v1_router
 
 app = FastAPI(
@@ -10,4 +11,6 @@ app = FastAPI(
     docs_url="/",
 )
 
+app.add_middleware(CompressionMiddleware, profile=CompressionProfile.from_env())
+
 app.include_router(v1_router, prefix="/api")
@@ -0,0 +1,16 @@
+"""Models for caches"""
+
+from pydantic import BaseModel
+
+
+class CacheStatsModel(BaseModel):
+    """Counters of an in-process cache, for sizing it"""
+
+    size: int
+    maxsize: int
+    ttl: float
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    hit_ratio: float
@@ -1,6 +1,9 @@
 """Models for contact"""
 
-from pydantic import BaseModel, UUID4
+from datetime import datetime
+from uuid import UUID
+from pydantic import BaseModel, UUID4, field_validator, model_validator
+from models.errors import BulkItemErrorModel
 
 
 class ContactModel(BaseModel):
@@ -11,6 +14,14 @@ class ContactModel(BaseModel):
     email: str
     phone: str
     address: str
+    version: int = 1
+
+
+class StoredContactModel(ContactModel):
+    """Contact pydantic model as it is stored, with its timestamps"""
+
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
 
 
 class InsertContactModel(BaseModel):
@@ -23,3 +34,104 @@ class InsertContactModel(BaseModel):
     email: str
     phone: str
     address: str
+
+
+class PatchContactModel(BaseModel):
+    """
+    Patch contact pydantic model for partial updates
+    Only the fields that are sent are written, so they can be left out but not null
+    """
+
+    name: str | None = None
+    email: str | None = None
+    phone: str | None = None
+    address: str | None = None
+
+    @field_validator("*")
+    @classmethod
+    def reject_null(cls, value):
+        """Defaults are not validated, so this only catches an explicit null"""
+        if value is None:
+            raise ValueError("must not be null, leave the field out to keep it")
+        return value
+
+    @model_validator(mode="after")
+    def require_a_field(self):
+        """An empty patch would only bump the version"""
+        if not self.model_fields_set:
+            raise ValueError("at least one field must be set")
+        return self
+
+
+class ContactPageModel(BaseModel):
+    """
+    A single page of contacts for keyset pagination
+    next_cursor is None when there are no more contacts after this page
+    """
+
+    items: list[StoredContactModel]
+    next_cursor: str | None = None
+
+
+class ContactSearchPageModel(BaseModel):
+    """
+    A single page of search results, best match first
+    next_offset is None when there are no more matches after this page
+    """
+
+    items: list[ContactModel]
+    next_offset: int | None = None
+
+
+class ChangedContactModel(ContactModel):
+    """Contact pydantic model for the change feed, with when it was last written"""
+
+    updated_at: datetime | None = None
+
+
+class ContactChangesModel(BaseModel):
+    """
+    Contacts created, updated or deleted after a change feed cursor, oldest first
+    Pass next_since back as since to continue, until has_more is False. Items
+    whose ids are in created did not exist yet at the cursor
+    """
+
+    items: list[ChangedContactModel]
+    created: list[UUID]
+    deleted: list[UUID]
+    next_since: int
+    has_more: bool
+
+
+class ContactSuggestionModel(BaseModel):
+    """Contact pydantic model for autocomplete suggestions"""
+
+    id: UUID4
+    name: str
+    email: str
+
+
+class BulkCreateResultModel(BaseModel):
+    """
+    Result of a bulk create
+    ids are in request order, skipping the items reported in errors
+    """
+
+    ids: list[UUID4]
+    errors: list[BulkItemErrorModel]
+    created: int
+    elapsed_seconds: float
+    rows_per_second: float
+
+
+class BulkDeleteContactsModel(BaseModel):
+    """Ids of the contacts to delete in one request"""
+
+    ids: list[UUID]
+
+
+class BulkOperationResultModel(BaseModel):
+    """Result of a bulk update or delete, split by whether each id existed"""
+
+    found: list[UUID]
+    missing: list[UUID]
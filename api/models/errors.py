@@ -9,9 +9,28 @@ class ErrorModel(BaseModel):
     detail: str
 
 
+class BulkItemErrorModel(BaseModel):
+    """Error for a single item of a bulk request, identified by its position"""
+
+    index: int
+    detail: str
+
+
 class DatabaseOperationError(Exception):
     """Custom exception for database operations"""
 
 
 class DatabaseNotFoundError(Exception):
     """Custom exception for database cannot find a record"""
+
+
+class InvalidCursorError(Exception):
+    """Custom exception for a malformed pagination cursor"""
+
+
+class InvalidFieldsError(Exception):
+    """Custom exception for a field selection naming unknown fields"""
+
+
+class VersionConflictError(Exception):
+    """Custom exception for a conditional write on an out of date version"""
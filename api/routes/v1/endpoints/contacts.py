@@ -1,13 +1,52 @@
 """Endpoints for contacts"""
 
-from typing import Annotated
+import asyncio
+from typing import Annotated, Literal
 from uuid import UUID
-from fastapi import APIRouter, status, Depends, HTTPException
+from fastapi import APIRouter, status, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from services.contact import ContactService
-from core.db import get_session
-from models.contact import ContactModel, InsertContactModel
-from models.errors import ErrorModel, DatabaseOperationError, DatabaseNotFoundError
+from services.contact import (
+    AsyncContactService,
+    ContactService,
+    ThreadedContactService,
+    CONTACT_FIELDS,
+    parse_fields,
+)
+from core.cache import contact_cache
+from core.db import engine_profile, get_async_session, get_session
+from core.events import contact_changes, format_sse
+from core.etag import etag_matches, make_etag, parse_if_match, version_etag
+from core.export import EXPORT_FORMATS, stream_export
+from core.responses import (
+    JSONBytesResponse,
+    dump_contact,
+    dump_rows,
+)
+from models.contact import (
+    StoredContactModel,
+    InsertContactModel,
+    PatchContactModel,
+    ContactPageModel,
+    ContactSearchPageModel,
+    ContactSuggestionModel,
+    ChangedContactModel,
+    ContactChangesModel,
+    BulkCreateResultModel,
+    BulkDeleteContactsModel,
+    BulkOperationResultModel,
+)
+from models.cache import CacheStatsModel
+from models.errors import (
+    ErrorModel,
+    DatabaseOperationError,
+    DatabaseNotFoundError,
+    InvalidCursorError,
+    InvalidFieldsError,
+    VersionConflictError,
+)
 
 router = APIRouter(
     prefix="/contacts",
@@ -20,26 +59,109 @@ router = APIRouter(
     },
 )
 
-Service = Annotated[ContactService, Depends(ContactService)]
-DBSession = Annotated[Session, Depends(get_session)]
+
+async def get_async_service() -> AsyncContactService:
+    """Resolve the service on the event loop rather than in the threadpool"""
+
+    return AsyncContactService()
+
+
+async def get_threaded_service() -> ThreadedContactService:
+    """Resolve the service on the event loop rather than in the threadpool"""
+
+    return ThreadedContactService()
+
+
+# The routes query through sync sessions in the threadpool, or await aiosqlite
+# sessions on the event loop when the engine profile asks for async sessions
+if engine_profile.async_sessions:
+    Service = Annotated[AsyncContactService, Depends(get_async_service)]
+    DBSession = Annotated[AsyncSession, Depends(get_async_session)]
+else:
+    Service = Annotated[ThreadedContactService, Depends(get_threaded_service)]
+    DBSession = Annotated[Session, Depends(get_session)]
+
+IfNoneMatch = Annotated[str | None, Header()]
+IfMatch = Annotated[str | None, Header()]
+Fields = Annotated[
+    str | None,
+    Query(
+        description=(
+            "Comma separated fields to return, out of "
+            f"{', '.join(CONTACT_FIELDS)}. Every field by default"
+        ),
+    ),
+]
+
+# A comment line keeps idle event streams open through proxies and finds closed ones
+SSE_KEEPALIVE_SECONDS = 15
+SSE_BATCH_SIZE = 100
+
+# The export body is a sync generator, which Starlette iterates in the threadpool
+SyncService = Annotated[ContactService, Depends(ContactService)]
+SyncDBSession = Annotated[Session, Depends(get_session)]
 
 
 @router.get(
     "/",
-    description="Get all contacts",
+    description=(
+        "Get a page of contacts, newest first. Pass the returned next_cursor to get "
+        "the following page, or all=true to get every contact in one response. "
+        "Narrow each contact with fields, e.g. fields=id,name. "
+        "Responds 304 when If-None-Match holds the ETag of an unchanged list. "
+        "X-Contacts-Revision is the change feed revision the list was read at, "
+        "to pass as since to /events"
+    ),
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_200_OK: {
-            "description": "Return the list of contacts",
-            "model": list[ContactModel],
+            "description": "Return a page of contacts, or the full list when all=true",
+            "model": ContactPageModel | list[StoredContactModel],
+        },
+        status.HTTP_304_NOT_MODIFIED: {
+            "description": "No contact was written since the ETag was issued",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Invalid cursor or fields",
+            "model": ErrorModel,
         },
     },
 )
-def contact_list_route(service: Service, session: DBSession):
-    """List all contacts endpoint"""
+async def contact_list_route(
+    service: Service,
+    session: DBSession,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    cursor: Annotated[str | None, Query()] = None,
+    fetch_all: Annotated[bool, Query(alias="all")] = False,
+    fields: Fields = None,
+    if_none_match: IfNoneMatch = None,
+):
+    """List contacts endpoint"""
     try:
-        contacts = service.get_all_contacts(session)
-        return contacts
+        selected = parse_fields(fields)
+        # the body only depends on the table revision and the query, so the
+        # ETag is known without reading a single contact
+        revision = await service.get_contacts_revision(session)
+        etag = make_etag("contacts", revision, limit, cursor, fetch_all, selected)
+        headers = {"ETag": etag, "X-Contacts-Revision": str(revision)}
+        if etag_matches(etag, if_none_match):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        if fetch_all:
+            content = await service.get_all_contacts(session, selected)
+            # the whole table would stall every other request on the event loop
+            body = await run_in_threadpool(dump_rows, content)
+        else:
+            contacts, next_cursor = await service.get_contacts_page(
+                session, limit, cursor, selected
+            )
+            body = dump_rows({"items": contacts, "next_cursor": next_cursor})
+
+        return JSONBytesResponse(body, headers=headers)
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
     except DatabaseOperationError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -47,14 +169,265 @@ def contact_list_route(service: Service, session: DBSession):
         ) from e
 
 
+@router.get(
+    "/export",
+    description=(
+        "Stream every contact as newline delimited JSON (default) or CSV, "
+        "reading chunk_size rows from the database at a time"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Stream of contacts",
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        },
+    },
+)
+def export_contacts_route(
+    service: SyncService,
+    session: SyncDBSession,
+    export_format: Annotated[Literal["ndjson", "csv"], Query(alias="format")] = (
+        "ndjson"
+    ),
+    chunk_size: Annotated[int, Query(ge=1, le=10000)] = 1000,
+):
+    """Export all contacts endpoint"""
+    media_type = EXPORT_FORMATS[export_format][0]
+
+    def body():
+        try:
+            yield from stream_export(
+                service.iter_contacts(session, chunk_size), export_format
+            )
+        finally:
+            # the session dependency has already exited by the time the body streams
+            session.close()
+
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="contacts.{export_format}"'
+        },
+    )
+
+
+@router.get(
+    "/search",
+    description=(
+        "Full-text search contacts by name, email and address. Every word in q "
+        "must match the start of a word in the contact, best matches first"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Return a page of matching contacts",
+            "model": ContactSearchPageModel,
+        },
+    },
+)
+async def search_contacts_route(
+    service: Service,
+    session: DBSession,
+    q: Annotated[str, Query(min_length=1, max_length=255)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    offset: Annotated[int, Query(ge=0)] = 0,
+):
+    """Search contacts endpoint"""
+    try:
+        contacts, next_offset = await service.search_contacts(q, session, limit, offset)
+        return JSONBytesResponse(
+            dump_rows({"items": contacts, "next_offset": next_offset})
+        )
+    except DatabaseOperationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        ) from e
+
+
+@router.get(
+    "/autocomplete",
+    description=(
+        "Suggest up to limit contacts whose name or email starts with prefix, "
+        "ignoring case. Name matches come before email matches"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Return the matching contacts",
+            "model": list[ContactSuggestionModel],
+        },
+    },
+)
+async def autocomplete_contacts_route(
+    service: Service,
+    session: DBSession,
+    prefix: Annotated[str, Query(min_length=1, max_length=255)],
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+):
+    """Autocomplete contacts endpoint"""
+    try:
+        return await service.autocomplete_contacts(prefix, session, limit)
+    except DatabaseOperationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        ) from e
+
+
+@router.get(
+    "/changes",
+    description=(
+        "Get the contacts created, updated or deleted after the since cursor, "
+        "oldest change first. Start from 0 and pass the returned next_since back "
+        "until has_more is false"
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Return the written contacts and the deleted ids",
+            "model": ContactChangesModel,
+        },
+    },
+)
+async def contact_changes_route(
+    service: Service,
+    session: DBSession,
+    since: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+):
+    """Contact change feed endpoint"""
+    try:
+        return await service.get_changes(session, since, limit)
+    except DatabaseOperationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        ) from e
+
+
+@router.get(
+    "/events",
+    description=(
+        "Stream contact changes as Server-Sent Events: created and updated with "
+        "the contact, deleted with its id. Starts from now, or after the "
+        "Last-Event-ID header or since cursor, which are change feed revisions"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Stream of contact changes",
+            "content": {"text/event-stream": {}},
+        },
+    },
+)
+async def contact_events_route(
+    service: Service,
+    session: DBSession,
+    since: Annotated[int | None, Query(ge=0)] = None,
+    last_event_id: Annotated[int | None, Header()] = None,
+):
+    """Contact change events endpoint"""
+    try:
+        if last_event_id is not None:
+            since = last_event_id
+        elif since is None:
+            since = await service.get_contacts_revision(session)
+    except DatabaseOperationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        ) from e
+
+    async def events():
+        # changes are read from the feed, so a wake-up only says there is news
+        # and a reconnecting client resumes from the id of the last batch it got
+        wake = contact_changes.subscribe()
+        cursor = since
+        try:
+            while True:
+                wake.clear()
+                changes = await service.get_changes(session, cursor, SSE_BATCH_SIZE)
+                # end the read transaction so the next batch sees newer commits
+                await service.close(session)
+
+                updates = [
+                    ChangedContactModel.model_validate(contact, from_attributes=True)
+                    for contact in changes["items"]
+                ]
+                # a contact created after the cursor is new to the client, even
+                # when it was updated again before this batch was read
+                created = set(changes["created"])
+                messages = [
+                    (
+                        "created" if contact.id in created else "updated",
+                        contact.model_dump_json(),
+                    )
+                    for contact in updates
+                ] + [
+                    ("deleted", {"id": str(contact_id)})
+                    for contact_id in changes["deleted"]
+                ]
+                # only the last event of a batch carries its id, as that is where
+                # a reconnect has to resume
+                for index, (event, data) in enumerate(messages, start=1):
+                    event_id = changes["next_since"] if index == len(messages) else None
+                    yield format_sse(event, data, event_id)
+                cursor = changes["next_since"]
+
+                if changes["has_more"]:
+                    continue
+                try:
+                    await asyncio.wait_for(wake.wait(), SSE_KEEPALIVE_SECONDS)
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+        except DatabaseOperationError:
+            # the client reconnects with the id of the last batch it received
+            return
+        finally:
+            contact_changes.unsubscribe(wake)
+            await service.close(session)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/cache/stats",
+    description="Get the hit, miss and eviction counters of the contact cache",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Return the contact cache counters",
+            "model": CacheStatsModel,
+        },
+    },
+)
+async def contact_cache_stats_route():
+    """Contact cache counters endpoint"""
+    return contact_cache.stats()
+
+
 @router.get(
     "/{contact_id}",
-    description="Get a contact by id",
+    description=(
+        "Get a contact by id, narrowed to fields when they are given. Responds 304 "
+        "when If-None-Match holds the ETag of the unchanged contact"
+    ),
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_200_OK: {
             "description": "Return the contact",
-            "model": ContactModel,
+            "model": StoredContactModel,
+        },
+        status.HTTP_304_NOT_MODIFIED: {
+            "description": "The contact did not change since the ETag was issued",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Invalid fields",
+            "model": ErrorModel,
         },
         status.HTTP_404_NOT_FOUND: {
             "description": "Invalid contact id",
@@ -62,14 +435,35 @@ def contact_list_route(service: Service, session: DBSession):
         },
     },
 )
-def get_contact_by_id_route(service: Service, contact_id: UUID, session: DBSession):
+async def get_contact_by_id_route(
+    service: Service,
+    contact_id: UUID,
+    session: DBSession,
+    fields: Fields = None,
+    if_none_match: IfNoneMatch = None,
+):
     """Get a contact by id endpoint"""
     try:
-        response = service.get_contact_by_id(contact_id, session)
+        selected = parse_fields(fields)
+        # the whole contact is read and cached, then narrowed, so every selection
+        # of the same contact is served from one cache entry
+        response = await service.get_contact_by_id(contact_id, session)
         if response is None:
             raise DatabaseNotFoundError(f"record with id {contact_id} does not exist")
 
-        return response
+        etag = version_etag(response["version"])
+        if etag_matches(etag, if_none_match):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+        return JSONBytesResponse(
+            dump_contact(response, selected), headers={"ETag": etag}
+        )
+    except InvalidFieldsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
     except DatabaseOperationError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -85,17 +479,51 @@ def get_contact_by_id_route(service: Service, contact_id: UUID, session: DBSessi
     responses={
         status.HTTP_201_CREATED: {
             "description": "Successfully created new contact",
-            "model": ContactModel,
+            "model": StoredContactModel,
         },
     },
 )
-def create_contact_route(
+async def create_contact_route(
     service: Service, contact_data: InsertContactModel, session: DBSession
 ):
     """Create a new contact endpoint"""
     try:
-        new_contact = service.create_contact(contact_data, session)
-        return new_contact
+        new_contact = await service.create_contact(contact_data, session)
+        return JSONBytesResponse(
+            dump_contact(new_contact), status_code=status.HTTP_201_CREATED
+        )
+    except DatabaseOperationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        ) from e
+
+
+@router.post(
+    "/bulk",
+    description=(
+        "Create many contacts in one transaction, inserting chunk_size rows at a "
+        "time. Each item is a contact to create; items that are invalid or that "
+        "the database rejects are reported in errors without rolling back the rest"
+    ),
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_201_CREATED: {
+            "description": "Ids of the new contacts, per item errors and throughput",
+            "model": BulkCreateResultModel,
+        },
+    },
+)
+async def bulk_create_contacts_route(
+    service: Service,
+    # validated item by item in the service, so one bad item is not a 422
+    contacts_data: list[dict],
+    session: DBSession,
+    chunk_size: Annotated[int, Query(ge=1, le=10000)] = 500,
+):
+    """Create many contacts endpoint"""
+    try:
+        return await service.bulk_create_contacts(contacts_data, session, chunk_size)
     except DatabaseOperationError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -103,32 +531,100 @@ def create_contact_route(
         ) from e
 
 
+@router.post(
+    "/bulk/delete",
+    description="Delete many contacts by id in one transaction",
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "description": "Ids that were deleted and ids that did not exist",
+            "model": BulkOperationResultModel,
+        },
+    },
+)
+async def bulk_delete_contacts_route(
+    service: Service, delete_data: BulkDeleteContactsModel, session: DBSession
+):
+    """Delete many contacts endpoint"""
+    try:
+        return await service.bulk_delete_contacts(delete_data.ids, session)
+    except DatabaseOperationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        ) from e
+
+
+@router.put(
+    "/bulk",
+    description="Update many contacts in one transaction, given a map of id to data",
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "description": "Ids that were updated and ids that did not exist",
+            "model": BulkOperationResultModel,
+        },
+    },
+)
+async def bulk_update_contacts_route(
+    service: Service,
+    contacts_data: dict[UUID, InsertContactModel],
+    session: DBSession,
+):
+    """Update many contacts endpoint"""
+    try:
+        return await service.bulk_update_contacts(contacts_data, session)
+    except DatabaseOperationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        ) from e
+
+
 @router.delete(
     "/{contact_id}",
-    description="Delete a contact by id",
+    description=(
+        "Delete a contact by id. With If-Match, only while the contact is still at "
+        "the version of that ETag"
+    ),
     status_code=status.HTTP_202_ACCEPTED,
     responses={
         status.HTTP_202_ACCEPTED: {
             "description": "Successfully deleted a contact",
-            "model": ContactModel,
+            "model": StoredContactModel,
         },
         status.HTTP_404_NOT_FOUND: {
             "description": "Invalid contact id",
             "model": ErrorModel,
         },
+        status.HTTP_412_PRECONDITION_FAILED: {
+            "description": "If-Match does not hold the current version of the contact",
+            "model": ErrorModel,
+        },
     },
 )
-def delete_contact_route(service: Service, contact_id: UUID, session: DBSession):
+async def delete_contact_route(
+    service: Service,
+    contact_id: UUID,
+    session: DBSession,
+    if_match: IfMatch = None,
+):
     """Delete a contact by id endpoint"""
     try:
-        response = service.delete_contact(contact_id, session)
+        response = await service.delete_contact(
+            contact_id, session, parse_if_match(if_match)
+        )
 
         if response is None:
             raise DatabaseNotFoundError(f"record with id {contact_id} does not exist")
 
-        return response
+        return JSONBytesResponse(
+            dump_contact(response), status_code=status.HTTP_202_ACCEPTED
+        )
     except DatabaseNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except VersionConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED, detail=str(e)
+        ) from e
     except DatabaseOperationError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -137,35 +633,107 @@ def delete_contact_route(service: Service, contact_id: UUID, session: DBSession)
 
 @router.put(
     "/{contact_id}",
-    description="Update a contact by id",
+    description=(
+        "Update a contact by id. With If-Match, only while the contact is still at "
+        "the version of that ETag"
+    ),
     status_code=status.HTTP_202_ACCEPTED,
     responses={
         status.HTTP_202_ACCEPTED: {
             "description": "Successfully updated a contact",
-            "model": ContactModel,
+            "model": StoredContactModel,
         },
         status.HTTP_404_NOT_FOUND: {
             "description": "Invalid contact id",
             "model": ErrorModel,
         },
+        status.HTTP_412_PRECONDITION_FAILED: {
+            "description": "If-Match does not hold the current version of the contact",
+            "model": ErrorModel,
+        },
     },
 )
-def update_contact_route(
+async def update_contact_route(
     service: Service,
     contact_id: UUID,
     contact_data: InsertContactModel,
     session: DBSession,
+    if_match: IfMatch = None,
 ):
     """Update a contact by id endpoint"""
     try:
-        response = service.update_contact(contact_id, contact_data, session)
+        response = await service.update_contact(
+            contact_id, contact_data, session, parse_if_match(if_match)
+        )
         if response is None:
             raise DatabaseNotFoundError(f"record with id {contact_id} does not exist")
 
-        return response
+        return JSONBytesResponse(
+            dump_contact(response),
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"ETag": version_etag(response["version"])},
+        )
     except DatabaseOperationError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
         ) from e
     except DatabaseNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except VersionConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED, detail=str(e)
+        ) from e
+
+
+@router.patch(
+    "/{contact_id}",
+    description=(
+        "Update only the given fields of a contact by id. With If-Match, only while "
+        "the contact is still at the version of that ETag"
+    ),
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "description": "Successfully updated a contact",
+            "model": StoredContactModel,
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Invalid contact id",
+            "model": ErrorModel,
+        },
+        status.HTTP_412_PRECONDITION_FAILED: {
+            "description": "If-Match does not hold the current version of the contact",
+            "model": ErrorModel,
+        },
+    },
+)
+async def patch_contact_route(
+    service: Service,
+    contact_id: UUID,
+    contact_data: PatchContactModel,
+    session: DBSession,
+    if_match: IfMatch = None,
+):
+    """Partially update a contact by id endpoint"""
+    try:
+        response = await service.update_contact(
+            contact_id, contact_data, session, parse_if_match(if_match)
+        )
+        if response is None:
+            raise DatabaseNotFoundError(f"record with id {contact_id} does not exist")
+
+        return JSONBytesResponse(
+            dump_contact(response),
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"ETag": version_etag(response["version"])},
+        )
+    except DatabaseOperationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        ) from e
+    except DatabaseNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except VersionConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED, detail=str(e)
+        ) from e
@@ -1,19 +1,79 @@
 """Sqlalchemy schemas for contact model"""
 
+import unicodedata
 import uuid
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column, DeclarativeBase, MappedAsDataclass
-from sqlalchemy import Text, String, func
+from sqlalchemy import (
+    DDL,
+    Column,
+    Integer,
+    Text,
+    String,
+    Index,
+    event,
+    func,
+    table,
+    column,
+    text,
+)
 
 
 class Base(MappedAsDataclass, DeclarativeBase):
     """Base class for all models"""
 
 
+def search_key(value: str) -> str:
+    """
+    Form of a name or email that prefix lookups compare, ignoring case in every
+    script. SQLite's lower() only folds ASCII, so the keys are written by the
+    application instead
+    """
+
+    return unicodedata.normalize("NFKC", value).casefold()
+
+
+def name_key_default(context) -> str:
+    """Search key of the name of a contact being inserted"""
+
+    return search_key(context.get_current_parameters()["name"])
+
+
+def email_key_default(context) -> str:
+    """Search key of the email of a contact being inserted"""
+
+    return search_key(context.get_current_parameters()["email"])
+
+
 class Contact(Base):
     """Contact sqlalchemy model"""
 
     __tablename__ = "contacts"
+    __table_args__ = (
+        # Change feed cursor, stamped by the revision triggers below. It is left
+        # unmapped because RETURNING cannot see what an AFTER trigger writes
+        Column("revision", Integer, nullable=False, server_default=text("0")),
+        # Revision the contact was created at, stamped alongside it, so the feed
+        # can tell a reader whether it could have seen the contact before
+        Column("created_revision", Integer, nullable=False, server_default=text("0")),
+        # Key of the contact in contacts_fts, stamped by the full-text triggers
+        # below and unmapped for the same reason. It is never renumbered, unlike
+        # the implicit rowid of a table without an INTEGER PRIMARY KEY
+        Column("search_rowid", Integer),
+        # Autocomplete keys, filled in on insert from name and email, and set by
+        # ContactService whenever those are updated. Internal, so left unmapped
+        Column("name_key", String(255), nullable=False, default=name_key_default),
+        Column("email_key", String(255), nullable=False, default=email_key_default),
+    )
+    __mapper_args__ = {
+        "exclude_properties": [
+            "revision",
+            "created_revision",
+            "search_rowid",
+            "name_key",
+            "email_key",
+        ]
+    }
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     email: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -21,6 +81,147 @@ class Contact(Base):
     address: Mapped[str] = mapped_column(Text, nullable=False)
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default_factory=uuid.uuid4)
     created_at: Mapped[datetime] = mapped_column(init=False, server_default=func.now())
+    # bumped by every update, for optimistic concurrency through If-Match
+    version: Mapped[int] = mapped_column(init=False, server_default=text("1"))
+    # set by the application on every insert and update. Null for contacts that
+    # predate the column
+    updated_at: Mapped[datetime | None] = mapped_column(
+        init=False, insert_default=func.now(), onupdate=func.now()
+    )
 
     def __repr__(self) -> str:
         return f"<Contact: {self.name} created at {self.created_at}>"
+
+
+# Covers the list ordering (newest first, id as tie-breaker) so that listing and
+# keyset pagination walk the index instead of sorting the whole table
+Index("ix_contacts_created_at_id", Contact.created_at.desc(), Contact.id)
+
+# Case-insensitive prefix lookups for autocomplete, as range scans on the keys
+Index("ix_contacts_name_key", Contact.__table__.c.name_key)
+Index("ix_contacts_email_key", Contact.__table__.c.email_key)
+
+# Change feed reads, as range scans on revision > since
+Index("ix_contacts_revision", Contact.__table__.c.revision)
+
+# Full-text matches are joined back to their contact, and the next free
+# search_rowid is read, through this index
+Index("ix_contacts_search_rowid", Contact.__table__.c.search_rowid, unique=True)
+
+
+class ContactTombstone(Base):
+    """Deleted contact, kept for the change feed and written by a trigger"""
+
+    __tablename__ = "contact_tombstones"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    revision: Mapped[int] = mapped_column(index=True)
+    deleted_at: Mapped[datetime] = mapped_column(init=False, server_default=func.now())
+
+
+# Full-text index over name, email and address. It is an external content FTS5
+# table that reads rows from contacts by search_rowid and is kept in sync by
+# triggers. It is not a mapped table, so its DDL runs whenever contacts is
+# created. A new contact takes the next search_rowid, found through its unique
+# index, and keeps it, so a VACUUM that renumbers rowids leaves the index valid
+contacts_fts = table("contacts_fts", column("rowid"), column("rank"))
+
+CONTACTS_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+        name, email, address, content='contacts', content_rowid='search_rowid',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER contacts_fts_insert AFTER INSERT ON contacts BEGIN
+        UPDATE contacts
+        SET search_rowid = (SELECT coalesce(max(search_rowid), 0) + 1 FROM contacts)
+        WHERE rowid = new.rowid;
+        INSERT INTO contacts_fts (rowid, name, email, address)
+        SELECT search_rowid, name, email, address FROM contacts
+        WHERE rowid = new.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER contacts_fts_delete AFTER DELETE ON contacts BEGIN
+        INSERT INTO contacts_fts (contacts_fts, rowid, name, email, address)
+        VALUES ('delete', old.search_rowid, old.name, old.email, old.address);
+    END
+    """,
+    """
+    CREATE TRIGGER contacts_fts_update AFTER UPDATE OF name, email, address
+    ON contacts BEGIN
+        INSERT INTO contacts_fts (contacts_fts, rowid, name, email, address)
+        VALUES ('delete', old.search_rowid, old.name, old.email, old.address);
+        INSERT INTO contacts_fts (rowid, name, email, address)
+        VALUES (new.search_rowid, new.name, new.email, new.address);
+    END
+    """,
+)
+
+for statement in CONTACTS_FTS_DDL:
+    event.listen(
+        Contact.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
+event.listen(
+    Contact.__table__,
+    "after_drop",
+    DDL("DROP TABLE IF EXISTS contacts_fts").execute_if(dialect="sqlite"),
+)
+
+# Change counter for the whole contacts table, bumped by triggers on every row
+# written, so that a list response can be validated without reading the rows.
+# Like contacts_fts it is not mapped and is created alongside contacts.
+# The triggers also stamp the new revision on the written row, or on a tombstone
+# for a deleted one, which orders the change feed. The update trigger is limited
+# to the user-facing columns so that stamping the revision does not fire it again
+contacts_revision = table("contacts_revision", column("revision"))
+
+CONTACTS_REVISION_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS contacts_revision (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        revision INTEGER NOT NULL
+    )
+    """,
+    "INSERT OR IGNORE INTO contacts_revision (id, revision) VALUES (1, 0)",
+    """
+    CREATE TRIGGER contacts_revision_insert AFTER INSERT ON contacts BEGIN
+        UPDATE contacts_revision SET revision = revision + 1;
+        UPDATE contacts SET
+            revision = (SELECT revision FROM contacts_revision),
+            created_revision = (SELECT revision FROM contacts_revision)
+        WHERE rowid = new.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER contacts_revision_delete AFTER DELETE ON contacts BEGIN
+        UPDATE contacts_revision SET revision = revision + 1;
+        INSERT OR REPLACE INTO contact_tombstones (id, revision, deleted_at)
+        VALUES (old.id, (SELECT revision FROM contacts_revision), CURRENT_TIMESTAMP);
+    END
+    """,
+    """
+    CREATE TRIGGER contacts_revision_update
+    AFTER UPDATE OF name, email, phone, address, version ON contacts BEGIN
+        UPDATE contacts_revision SET revision = revision + 1;
+        UPDATE contacts SET revision = (SELECT revision FROM contacts_revision)
+        WHERE rowid = new.rowid;
+    END
+    """,
+)
+
+for statement in CONTACTS_REVISION_DDL:
+    event.listen(
+        Contact.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
+event.listen(
+    Contact.__table__,
+    "after_drop",
+    DDL("DROP TABLE IF EXISTS contacts_revision").execute_if(dialect="sqlite"),
+)
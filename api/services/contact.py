@@ -1,30 +1,451 @@
 """Services for contact model"""
 
-from typing import Sequence
+import re
+import sys
+import time
+import uuid
+from typing import Any, Callable, Collection, Iterable, Iterator, Mapping, Sequence
 from uuid import UUID
-from sqlalchemy import select, desc, delete, update
+from pydantic import TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import (
+    select,
+    desc,
+    delete,
+    update,
+    insert,
+    or_,
+    literal,
+    text,
+    String,
+    bindparam,
+    Select,
+    Subquery,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from schemas.contact import Contact
-from models.contact import InsertContactModel
-from models.errors import DatabaseOperationError
+from schemas.contact import (
+    Contact,
+    ContactTombstone,
+    contacts_fts,
+    contacts_revision,
+    search_key,
+)
+from core.cache import contact_cache
+from core.events import contact_changes
+from core.pagination import encode_cursor, decode_cursor
+from models.contact import InsertContactModel, PatchContactModel
+from models.errors import (
+    DatabaseOperationError,
+    InvalidFieldsError,
+    VersionConflictError,
+)
+
+# Newest first, with id as a tie-breaker so that the order is total and stable
+LIST_ORDER = (desc(Contact.created_at), Contact.id)
+
+# Columns a client can select with fields=, in the order they are returned
+CONTACT_FIELDS = tuple(Contact.__mapper__.columns.keys())
+
+# Ids per IN (...) clause, well below SQLite's limit on bound parameters
+ID_CHUNK_SIZE = 500
+
+# Columns of each VALUES row of a bulk update, the id it matches on first
+BULK_UPDATE_COLUMNS = (
+    "id",
+    "name",
+    "email",
+    "phone",
+    "address",
+    "name_key",
+    "email_key",
+)
+
+# Validates the items of a bulk create one at a time, built once as it is costly
+INSERT_CONTACT_ADAPTER = TypeAdapter(InsertContactModel)
+
+
+def chunked(items: Sequence, size: int) -> Iterator[Sequence]:
+    """Split a sequence into consecutive chunks of at most size items"""
+
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def values_subquery(
+    name: str, columns: Mapping[str, Any], rows: Sequence[Mapping[str, Any]]
+) -> Subquery:
+    """
+    Subquery named name over rows as a VALUES list, one bound parameter per cell
+    SQLite names VALUES columns column1, column2 and so on and takes no column
+    list after the alias, so they are renamed to the keys of columns in a select
+    """
+
+    params = []
+    tuples = []
+    for index, row in enumerate(rows):
+        cells = []
+        for key, type_ in columns.items():
+            params.append(bindparam(f"{key}_{index}", row[key], type_=type_))
+            cells.append(f":{key}_{index}")
+        tuples.append(f"({', '.join(cells)})")
+
+    selected = ", ".join(
+        f"column{position} AS {key}" for position, key in enumerate(columns, 1)
+    )
+    return (
+        text(f"SELECT {selected} FROM (VALUES {', '.join(tuples)})")
+        .bindparams(*params)
+        .columns(**columns)
+        .subquery(name)
+    )
+
+
+def fts_match_expression(query: str) -> str | None:
+    """
+    Turn free text into an FTS5 query where every word must match as a prefix
+    Words are quoted so that FTS5 syntax in user input is treated as plain text
+    """
+
+    words = re.findall(r"\w+", query.lower())
+    if not words:
+        return None
+
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    """
+    Smallest string that sorts after every string starting with prefix
+    None when there is no such string, as the prefix is only U+10FFFF characters
+    """
+
+    prefix = prefix.rstrip(chr(sys.maxunicode))
+    if not prefix:
+        return None
+
+    code_point = ord(prefix[-1]) + 1
+    if 0xD800 <= code_point <= 0xDFFF:
+        # surrogates cannot be stored as text, the next character is U+E000
+        code_point = 0xE000
+
+    return prefix[:-1] + chr(code_point)
+
+
+def parse_fields(fields: str | None) -> tuple[str, ...] | None:
+    """
+    Parse a comma separated field selection into contact columns, in column order
+    None selects every field
+    """
+
+    if fields is None:
+        return None
+
+    names = {name.strip() for name in fields.split(",")} - {""}
+    if not names or not names <= set(CONTACT_FIELDS):
+        raise InvalidFieldsError(
+            f"Invalid fields: {fields}, choose from {', '.join(CONTACT_FIELDS)}"
+        )
+
+    return tuple(name for name in CONTACT_FIELDS if name in names)
+
+
+def select_fields(fields: Sequence[str] | None, *keys: str) -> Select:
+    """
+    Select every contact column, or only the columns in fields and keys when it
+    is set. keys are the columns the query itself needs, such as the sort key
+    """
+
+    if fields is None:
+        fields = CONTACT_FIELDS
+
+    names = [*fields, *(key for key in keys if key not in fields)]
+    return select(*(getattr(Contact, name) for name in names))
+
+
+def as_dicts(keys: Sequence[str], rows: Iterable[Sequence]) -> list[dict]:
+    """Turn rows of a column select into dicts keyed by column name"""
+
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def fetch_rows(session: Session, stmt: Select) -> list[dict]:
+    """
+    Run a column select and return its rows as plain dicts
+    Read-only list queries go through here rather than select(Contact), so no
+    ORM instance is built, identity mapped or tracked for each row
+    """
+
+    result = session.execute(stmt)
+    return as_dicts(list(result.keys()), result)
+
+
+def project(rows: list[dict], fields: Sequence[str] | None) -> list[dict]:
+    """Narrow rows of a select_fields statement to only the fields"""
+
+    if fields is None:
+        return rows
+
+    return [{field: row[field] for field in fields} for row in rows]
+
+
+def search_keys(values: Mapping[str, Any]) -> dict:
+    """Autocomplete keys to write alongside the name and email among values"""
+
+    keys = {}
+    if "name" in values:
+        keys["name_key"] = search_key(values["name"])
+    if "email" in values:
+        keys["email_key"] = search_key(values["email"])
+    return keys
+
+
+def validation_detail(error: ValidationError) -> str:
+    """One line describing every problem of a validation error, field by field"""
+
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'item'}: {item['msg']}"
+        for item in error.errors()
+    )
+
+
+def split_found(contact_ids: Sequence[UUID], found: set[UUID]) -> dict:
+    """Split ids, in request order, by whether they were found in database"""
+
+    return {
+        "found": [contact_id for contact_id in contact_ids if contact_id in found],
+        "missing": [
+            contact_id for contact_id in contact_ids if contact_id not in found
+        ],
+    }
 
 
 class ContactService:
     """Service for contact model"""
 
-    def get_all_contacts(self, session: Session) -> Sequence[Contact]:
-        """Get all contacts from database"""
+    def get_all_contacts(
+        self, session: Session, fields: Sequence[str] | None = None
+    ) -> list[dict]:
+        """
+        Get all contacts from database, each as a dict of its columns
+        With fields, only those columns are read
+        """
 
         try:
-            stmt = select(Contact).order_by(desc(Contact.created_at))
-            data = session.scalars(stmt).all()
-            return data
+            return fetch_rows(session, select_fields(fields).order_by(*LIST_ORDER))
         except Exception as e:
             raise DatabaseOperationError(f"Failed to get all contacts: {str(e)}") from e
 
-    def get_contact_by_id(self, contact_id: UUID, session: Session) -> Contact | None:
-        """Get a contact by id from database"""
+    def get_contacts_revision(self, session: Session) -> int:
+        """Get the change counter of the contacts table, bumped by every row write"""
+
+        try:
+            stmt = select(contacts_revision.c.revision)
+            return session.scalars(stmt).one()
+        except Exception as e:
+            raise DatabaseOperationError(
+                f"Failed to get contacts revision: {str(e)}"
+            ) from e
+
+    def get_changes(self, session: Session, since: int, limit: int) -> dict:
+        """
+        Get up to limit contacts written and ids deleted after revision since,
+        oldest change first, walking the revision indexes of both tables
+        A contact written several times is reported once, at its latest revision,
+        and listed in created too when it did not exist yet at since
+        """
+
+        revision = Contact.__table__.c.revision
+        created_revision = Contact.__table__.c.created_revision
+        contacts_stmt = (
+            select(Contact, revision, created_revision)
+            .where(revision > since)
+            .order_by(revision)
+            .limit(limit + 1)
+        )
+        tombstones_stmt = (
+            select(ContactTombstone.revision, ContactTombstone.id)
+            .where(ContactTombstone.revision > since)
+            .order_by(ContactTombstone.revision)
+            .limit(limit + 1)
+        )
+
+        try:
+            contacts = session.execute(contacts_stmt).all()
+            tombstones = session.execute(tombstones_stmt).all()
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to get changes: {str(e)}") from e
+
+        created = {
+            contact.id for contact, _, created_at in contacts if created_at > since
+        }
+        changes = sorted(
+            [(rev, contact, None) for contact, rev, _ in contacts]
+            + [(rev, None, contact_id) for rev, contact_id in tombstones],
+            key=lambda change: change[0],
+        )
+        batch = changes[:limit]
+
+        return {
+            "items": [contact for _, contact, _ in batch if contact is not None],
+            "created": [
+                contact.id
+                for _, contact, _ in batch
+                if contact is not None and contact.id in created
+            ],
+            "deleted": [contact_id for _, _, contact_id in batch if contact_id],
+            "next_since": batch[-1][0] if batch else since,
+            "has_more": len(changes) > limit,
+        }
+
+    def get_contacts_page(
+        self,
+        session: Session,
+        limit: int,
+        cursor: str | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """
+        Get a page of contacts using keyset pagination on (created_at, id)
+        Returns the contacts, each as a dict of its columns, and the cursor for the
+        next page, if there is one. With fields, only those columns and the sort
+        key are read
+        """
+
+        stmt = (
+            select_fields(fields, "created_at", "id")
+            .order_by(*LIST_ORDER)
+            .limit(limit + 1)
+        )
+
+        if cursor is not None:
+            created_at, contact_id = decode_cursor(cursor)
+            # compare against the stored text form so equal timestamps match exactly
+            created_at_key = literal(created_at.isoformat(sep=" "), String)
+            # the leading range lets SQLite seek into the index instead of scanning it
+            stmt = stmt.where(
+                Contact.created_at <= created_at_key,
+                or_(Contact.created_at < created_at_key, Contact.id > contact_id),
+            )
+
+        try:
+            data = fetch_rows(session, stmt)
+        except Exception as e:
+            raise DatabaseOperationError(
+                f"Failed to get contacts page: {str(e)}"
+            ) from e
+
+        if len(data) <= limit:
+            return project(data, fields), None
+
+        data = data[:limit]
+        last = data[-1]
+        return project(data, fields), encode_cursor(last["created_at"], last["id"])
+
+    def iter_contacts(
+        self, session: Session, chunk_size: int = 1000
+    ) -> Iterator[list[dict]]:
+        """
+        Stream every contact from database in chunks of chunk_size rows, each as a
+        dict of its columns
+        Rows are fetched with yield_per, so only one chunk is held in memory at a time
+        """
+
+        stmt = (
+            select_fields(None)
+            .order_by(*LIST_ORDER)
+            .execution_options(yield_per=chunk_size)
+        )
+
+        try:
+            result = session.execute(stmt)
+            keys = list(result.keys())
+            for partition in result.partitions():
+                yield as_dicts(keys, partition)
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to export contacts: {str(e)}") from e
+
+    def search_contacts(
+        self, query: str, session: Session, limit: int, offset: int = 0
+    ) -> tuple[list[dict], int | None]:
+        """
+        Full-text search contacts by name, email and address, best match first
+        Returns the contacts, each as a dict of its columns, and the offset of the
+        next page, if there is one
+        """
+
+        match = fts_match_expression(query)
+        if match is None:
+            return [], None
+
+        stmt = (
+            select_fields(None)
+            .join(
+                contacts_fts,
+                contacts_fts.c.rowid == Contact.__table__.c.search_rowid,
+            )
+            .where(text("contacts_fts MATCH :match").bindparams(match=match))
+            .order_by(contacts_fts.c.rank)
+            .limit(limit + 1)
+            .offset(offset)
+        )
+
+        try:
+            data = fetch_rows(session, stmt)
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to search contacts: {str(e)}") from e
+
+        if len(data) <= limit:
+            return data, None
+
+        return data[:limit], offset + limit
+
+    def autocomplete_contacts(
+        self, prefix: str, session: Session, limit: int = 10
+    ) -> list[dict]:
+        """
+        Get up to limit contacts whose name or email starts with prefix, ignoring case
+        Each column is a range scan on the index of its search key; name matches
+        come first
+        """
+
+        key = search_key(prefix.strip())
+        if not key:
+            return []
+
+        matches = {}
+        columns = Contact.__table__.c
+
+        try:
+            upper_bound = prefix_upper_bound(key)
+            for normalised in (columns.name_key, columns.email_key):
+                stmt = select(Contact.id, Contact.name, Contact.email).where(
+                    normalised >= key
+                )
+                if upper_bound is not None:
+                    stmt = stmt.where(normalised < upper_bound)
+                stmt = stmt.order_by(normalised).limit(limit)
+                for row in session.execute(stmt).mappings():
+                    matches.setdefault(row["id"], dict(row))
+        except Exception as e:
+            raise DatabaseOperationError(
+                f"Failed to autocomplete contacts: {str(e)}"
+            ) from e
+
+        return list(matches.values())[:limit]
+
+    def get_contact_by_id(self, contact_id: UUID, session: Session) -> dict | None:
+        """
+        Get a contact by id, from the contact cache when it holds a live copy
+        Writes invalidate the ids they touch, so the cache is read-through only
+        """
 
+        cached = contact_cache.get(contact_id)
+        if cached is not None:
+            return dict(cached)
+
+        generation = contact_cache.generation
         try:
             stmt = select(Contact).where(Contact.id == contact_id)
             data = session.scalars(stmt).one_or_none()
@@ -32,68 +453,484 @@ class ContactService:
             if data is None:
                 return None
 
-            return data.__dict__
+            contact = {
+                key: value
+                for key, value in data.__dict__.items()
+                if key != "_sa_instance_state"
+            }
+            contact_cache.set(contact_id, contact, generation)
+            return dict(contact)
         except Exception as e:
             raise DatabaseOperationError(
                 f"Failed to get contact by id: {str(e)}"
             ) from e
 
     def create_contact(self, new_contact_data: InsertContactModel, session: Session):
-        """Create a new contact into database"""
+        """
+        Create a new contact into database
+        Returns a copy of the stored row, as the session may be closed before the
+        caller reads it and a closed session cannot load the expired instance
+        """
 
         new_data = Contact(**new_contact_data.model_dump())  # to create uuid
 
         try:
             session.add(new_data)
             session.commit()
-            session.flush()
-            return new_data
+            # load the server defaults while the instance is still attached
+            session.refresh(new_data)
+            new_contact = {
+                key: value
+                for key, value in new_data.__dict__.items()
+                if key != "_sa_instance_state"
+            }
+            contact_cache.invalidate(new_contact["id"])
+            contact_changes.notify()
+            return new_contact
         except Exception as e:
             session.rollback()
             raise DatabaseOperationError(
                 f"Failed to create new contact: {str(e)}"
             ) from e
 
-    def delete_contact(self, contact_id: UUID, session: Session):
-        """Service: delete a contact by id from database"""
+    def bulk_create_contacts(
+        self,
+        new_contacts: Sequence[Mapping[str, Any] | InsertContactModel],
+        session: Session,
+        chunk_size: int = 500,
+    ):
+        """
+        Create many contacts in a single transaction, chunk_size rows per executemany
+        Each item is validated on its own, so an invalid one is reported instead of
+        failing the request. A chunk that fails is retried row by row inside
+        savepoints, so only the offending contacts are reported and the rest of
+        the batch is kept
+        """
+
+        started = time.perf_counter()
+        indexes = []
+        rows = []
+        errors = []
+        for index, item in enumerate(new_contacts):
+            try:
+                contact = INSERT_CONTACT_ADAPTER.validate_python(item)
+            except ValidationError as e:
+                errors.append({"index": index, "detail": validation_detail(e)})
+                continue
+            indexes.append(index)
+            rows.append({"id": uuid.uuid4(), **contact.model_dump()})
+        ids = []
+
+        try:
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                try:
+                    with session.begin_nested():
+                        session.execute(insert(Contact), chunk)
+                    ids.extend(row["id"] for row in chunk)
+                    continue
+                except SQLAlchemyError:
+                    pass
+
+                for index, row in zip(indexes[start : start + chunk_size], chunk):
+                    try:
+                        with session.begin_nested():
+                            session.execute(insert(Contact), [row])
+                        ids.append(row["id"])
+                    except SQLAlchemyError as e:
+                        errors.append({"index": index, "detail": str(e)})
+
+            session.commit()
+            contact_changes.notify()
+        except Exception as e:
+            session.rollback()
+            raise DatabaseOperationError(
+                f"Failed to bulk create contacts: {str(e)}"
+            ) from e
+
+        elapsed = time.perf_counter() - started
+        return {
+            "ids": ids,
+            "errors": sorted(errors, key=lambda error: error["index"]),
+            "created": len(ids),
+            "elapsed_seconds": elapsed,
+            "rows_per_second": len(ids) / elapsed if elapsed else 0.0,
+        }
+
+    def check_version_conflict(
+        self,
+        contact_id: UUID,
+        expected_versions: Collection[int] | None,
+        session: Session,
+    ):
+        """
+        Tell a missing contact from a stale version after a conditional write
+        matched no row. Only runs on that failure path, never on a successful write
+        """
+
+        if expected_versions is None:
+            return
+
+        stmt = select(Contact.version).where(Contact.id == contact_id)
+        version = session.scalars(statement=stmt).one_or_none()
+        if version is not None:
+            raise VersionConflictError(
+                f"record with id {contact_id} is at version {version}"
+            )
+
+    def delete_contact(
+        self,
+        contact_id: UUID,
+        session: Session,
+        expected_versions: Collection[int] | None = None,
+    ):
+        """
+        Service: delete a contact by id from database
+        With expected_versions, the row is only deleted while its version is one of
+        them, in the same statement, and VersionConflictError is raised otherwise
+        """
 
         stmt = delete(Contact).where(Contact.id == contact_id).returning(Contact)
+        if expected_versions is not None:
+            stmt = stmt.where(Contact.version.in_(expected_versions))
 
         try:
             response = session.scalars(statement=stmt).one_or_none()
 
             if response is None:
+                self.check_version_conflict(contact_id, expected_versions, session)
                 return None
 
             # copy contact to another memory slot before commiting
             deleted_contact = {**response.__dict__}
             session.commit()
+            contact_cache.invalidate(contact_id)
+            contact_changes.notify()
             return deleted_contact
+        except VersionConflictError:
+            raise
         except Exception as e:
             session.rollback()
             raise DatabaseOperationError(f"Failed to delete a contact: {str(e)}") from e
 
     def update_contact(
-        self, contact_id: UUID, update_data: InsertContactModel, session: Session
+        self,
+        contact_id: UUID,
+        update_data: InsertContactModel | PatchContactModel,
+        session: Session,
+        expected_versions: Collection[int] | None = None,
     ):
-        """Service: update a contact by id from database"""
+        """
+        Service: update a contact by id from database, bumping its version
+        Only the fields set on update_data are written, so a patch leaves the rest.
+        With expected_versions, the row is only written while its version is one of
+        them, in the same statement, and VersionConflictError is raised otherwise
+        """
 
+        changes = update_data.model_dump(exclude_unset=True)
+        keys = {Contact.__table__.c[k]: v for k, v in search_keys(changes).items()}
         stmt = (
             update(Contact)
             .where(Contact.id == contact_id)
-            .values(**update_data.model_dump())
+            .values({**changes, **keys, "version": Contact.version + 1})
             .returning(Contact)
         )
+        if expected_versions is not None:
+            stmt = stmt.where(Contact.version.in_(expected_versions))
 
         try:
             response = session.scalars(statement=stmt).one_or_none()
             if response is None:
+                self.check_version_conflict(contact_id, expected_versions, session)
                 return None
 
             # copy contact to another memory slot before commiting
             updated_contact = {**response.__dict__}
             session.commit()
+            contact_cache.invalidate(contact_id)
+            contact_changes.notify()
             return updated_contact
+        except VersionConflictError:
+            raise
         except Exception as e:
             session.rollback()
             raise DatabaseOperationError(f"Failed to update contact: {str(e)}") from e
+
+    def bulk_delete_contacts(self, contact_ids: Sequence[UUID], session: Session):
+        """
+        Service: delete many contacts by id in one transaction
+        Each chunk of ids is removed with a single DELETE ... WHERE id IN (...)
+        """
+
+        contact_ids = list(dict.fromkeys(contact_ids))
+        found = set()
+
+        try:
+            for chunk in chunked(contact_ids, ID_CHUNK_SIZE):
+                stmt = (
+                    delete(Contact).where(Contact.id.in_(chunk)).returning(Contact.id)
+                )
+                found.update(session.scalars(statement=stmt).all())
+
+            session.commit()
+            contact_cache.invalidate(*found)
+            contact_changes.notify()
+        except Exception as e:
+            session.rollback()
+            raise DatabaseOperationError(
+                f"Failed to bulk delete contacts: {str(e)}"
+            ) from e
+
+        return split_found(contact_ids, found)
+
+    def bulk_update_contacts(
+        self, updates: Mapping[UUID, InsertContactModel], session: Session
+    ):
+        """
+        Service: update many contacts by id in one transaction
+        Each chunk of contacts is written, and their versions bumped, by a single
+        UPDATE ... FROM (VALUES ...) RETURNING id, whose returned ids tell which
+        exist. Nothing is read first: under WAL a transaction that reads and then
+        writes cannot take the write lock once another writer has committed, and
+        fails at once instead of waiting
+        """
+
+        contact_ids = list(updates)
+        found = set()
+        table = Contact.__table__
+        columns = {name: table.c[name].type for name in BULK_UPDATE_COLUMNS}
+
+        try:
+            for chunk in chunked(contact_ids, ID_CHUNK_SIZE):
+                rows = []
+                for contact_id in chunk:
+                    values = updates[contact_id].model_dump()
+                    rows.append({"id": contact_id, **values, **search_keys(values)})
+
+                new_values = values_subquery("new_values", columns, rows)
+                stmt = (
+                    update(table)
+                    .where(table.c.id == new_values.c.id)
+                    .values(
+                        {
+                            **{
+                                name: new_values.c[name]
+                                for name in BULK_UPDATE_COLUMNS
+                                if name != "id"
+                            },
+                            "version": table.c.version + 1,
+                        }
+                    )
+                    .returning(table.c.id)
+                )
+                found.update(session.execute(stmt).scalars().all())
+
+            session.commit()
+            contact_cache.invalidate(*found)
+            contact_changes.notify()
+        except Exception as e:
+            session.rollback()
+            raise DatabaseOperationError(
+                f"Failed to bulk update contacts: {str(e)}"
+            ) from e
+
+        return split_found(contact_ids, found)
+
+
+class AsyncContactService:
+    """
+    Service for contact model on an AsyncSession
+    Every method runs the matching ContactService method through run_sync, so
+    the queries are shared while database I/O is awaited on the event loop
+    instead of holding a threadpool worker for the whole request
+    """
+
+    def __init__(self):
+        self.service = ContactService()
+
+    async def run(self, session: AsyncSession, call: Callable, *args):
+        """Run call with the sync session behind session, then args"""
+
+        return await session.run_sync(call, *args)
+
+    async def close(self, session: AsyncSession):
+        """End the session's transaction and hand its connection back to the pool"""
+
+        await session.close()
+
+    async def get_all_contacts(
+        self, session: AsyncSession, fields: Sequence[str] | None = None
+    ) -> list[dict]:
+        """Get all contacts from database, or only fields of each of them"""
+
+        return await self.run(session, self.service.get_all_contacts, fields)
+
+    async def get_contacts_revision(self, session: AsyncSession) -> int:
+        """Get the change counter of the contacts table, bumped by every row write"""
+
+        return await self.run(session, self.service.get_contacts_revision)
+
+    async def get_changes(self, session: AsyncSession, since: int, limit: int) -> dict:
+        """Get up to limit contacts written and ids deleted after revision since"""
+
+        return await self.run(
+            session,
+            lambda sync_session: self.service.get_changes(sync_session, since, limit),
+        )
+
+    async def get_contacts_page(
+        self,
+        session: AsyncSession,
+        limit: int,
+        cursor: str | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """Get a page of contacts using keyset pagination on (created_at, id)"""
+
+        return await self.run(
+            session, self.service.get_contacts_page, limit, cursor, fields
+        )
+
+    async def search_contacts(
+        self, query: str, session: AsyncSession, limit: int, offset: int = 0
+    ) -> tuple[list[dict], int | None]:
+        """Full-text search contacts by name, email and address, best match first"""
+
+        return await self.run(
+            session,
+            lambda sync_session: self.service.search_contacts(
+                query, sync_session, limit, offset
+            ),
+        )
+
+    async def autocomplete_contacts(
+        self, prefix: str, session: AsyncSession, limit: int = 10
+    ) -> list[dict]:
+        """Get up to limit contacts whose name or email starts with prefix"""
+
+        return await self.run(
+            session,
+            lambda sync_session: self.service.autocomplete_contacts(
+                prefix, sync_session, limit
+            ),
+        )
+
+    async def get_contact_by_id(self, contact_id: UUID, session: AsyncSession):
+        """Get a contact by id from database"""
+
+        return await self.run(
+            session,
+            lambda sync_session: self.service.get_contact_by_id(
+                contact_id, sync_session
+            ),
+        )
+
+    async def create_contact(
+        self, new_contact_data: InsertContactModel, session: AsyncSession
+    ):
+        """Create a new contact into database"""
+
+        return await self.run(
+            session,
+            lambda sync_session: self.service.create_contact(
+                new_contact_data, sync_session
+            ),
+        )
+
+    async def bulk_create_contacts(
+        self,
+        new_contacts: Sequence[Mapping[str, Any] | InsertContactModel],
+        session: AsyncSession,
+        chunk_size: int = 500,
+    ):
+        """Service: create many contacts in one transaction"""
+
+        return await self.run(
+            session,
+            lambda sync_session: self.service.bulk_create_contacts(
+                new_contacts, sync_session, chunk_size
+            ),
+        )
+
+    async def delete_contact(
+        self,
+        contact_id: UUID,
+        session: AsyncSession,
+        expected_versions: Collection[int] | None = None,
+    ):
+        """Service: delete a contact by id from database"""
+
+        return await self.run(
+            session,
+            lambda sync_session: self.service.delete_contact(
+                contact_id, sync_session, expected_versions
+            ),
+        )
+
+    async def update_contact(
+        self,
+        contact_id: UUID,
+        update_data: InsertContactModel | PatchContactModel,
+        session: AsyncSession,
+        expected_versions: Collection[int] | None = None,
+    ):
+        """Service: update a contact by id from database, bumping its version"""
+
+        return await self.run(
+            session,
+            lambda sync_session: self.service.update_contact(
+                contact_id, update_data, sync_session, expected_versions
+            ),
+        )
+
+    async def bulk_delete_contacts(
+        self, contact_ids: Sequence[UUID], session: AsyncSession
+    ):
+        """Service: delete many contacts by id in one transaction"""
+
+        return await self.run(
+            session,
+            lambda sync_session: self.service.bulk_delete_contacts(
+                contact_ids, sync_session
+            ),
+        )
+
+    async def bulk_update_contacts(
+        self, updates: Mapping[UUID, InsertContactModel], session: AsyncSession
+    ):
+        """Service: update many contacts by id in one transaction"""
+
+        return await self.run(
+            session,
+            lambda sync_session: self.service.bulk_update_contacts(
+                updates, sync_session
+            ),
+        )
+
+
+class ThreadedContactService(AsyncContactService):
+    """
+    Service for contact model on a sync Session, for the async routes
+    Every method runs the matching ContactService method in the threadpool, so
+    a request only holds a worker and a connection while it queries
+    """
+
+    async def run(self, session: Session, call: Callable, *args):
+        """
+        Run call with session, then args, in the threadpool. The session hands its
+        connection back before the worker is freed, as a request holding one while
+        it waits for a worker could starve the workers waiting for a connection
+        """
+
+        def call_and_release():
+            try:
+                return call(session, *args)
+            finally:
+                session.close()
+
+        return await run_in_threadpool(call_and_release)
+
+    async def close(self, session: Session):
+        """End the session's transaction and hand its connection back to the pool"""
+
+        await run_in_threadpool(session.close)
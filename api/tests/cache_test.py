@@ -0,0 +1,99 @@
+"""Unit tests for the in-process cache"""
+
+import pytest
+from core.cache import LRUCache
+
+
+class FakeClock:
+    """Clock that only moves when told to"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    """Test class for LRUCache"""
+
+    def test_evict_least_recently_used(self):
+        """Should drop the least recently used entry once it is full"""
+
+        cache = LRUCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        stats = cache.stats()
+        assert stats["size"] == 2
+        assert stats["hits"] == 3
+        assert stats["misses"] == 1
+        assert stats["evictions"] == 1
+        assert stats["hit_ratio"] == 0.75
+
+    def test_expire_entries(self):
+        """Should treat entries older than ttl as missing"""
+
+        clock = FakeClock()
+        cache = LRUCache(maxsize=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10
+        assert cache.get("a", "default") == "default"
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["size"] == 0
+
+    def test_invalidate(self):
+        """Should drop the given keys and refuse values loaded before it"""
+
+        cache = LRUCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        generation = cache.generation
+
+        cache.invalidate("a")
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.set("a", "stale", generation) is False
+        assert cache.get("a") is None
+        assert cache.set("a", "fresh", cache.generation) is True
+        assert cache.get("a") == "fresh"
+
+    def test_clear(self):
+        """Should drop every entry and reset the counters"""
+
+        cache = LRUCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        cache.clear()
+
+        assert cache.stats() == {
+            "size": 0,
+            "maxsize": 10,
+            "ttl": 60,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "hit_ratio": 0.0,
+        }
+
+    def test_disabled(self):
+        """Should store nothing when maxsize is 0 and reject negative settings"""
+
+        cache = LRUCache(maxsize=0, ttl=60)
+        assert cache.set("a", 1) is False
+        assert cache.get("a") is None
+
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=-1, ttl=60)
@@ -0,0 +1,149 @@
+"""Unit tests for response compression"""
+
+import gzip
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from core.compression import (
+    CompressionMiddleware,
+    CompressionProfile,
+    negotiate_encoding,
+)
+
+LARGE_BODY = "contact " * 200
+
+
+def make_client(profile: CompressionProfile | None = None) -> TestClient:
+    """Client for an app with a small, a large, a streamed and an event response"""
+
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, profile=profile)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("contact")
+
+    @app.get("/large")
+    def large():
+        return PlainTextResponse(LARGE_BODY, headers={"ETag": '"1"'})
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            iter([b"first\n" * 100, b"second\n" * 100]),
+            media_type="application/x-ndjson",
+        )
+
+    @app.get("/events")
+    def events():
+        return StreamingResponse(
+            iter([b"event: contact\ndata: {}\n\n"] * 100),
+            media_type="text/event-stream",
+        )
+
+    return TestClient(app)
+
+
+class TestCompressionMiddleware:
+    """Test class for CompressionMiddleware"""
+
+    def test_compress_large_body(self):
+        """Should gzip a body over the minimum size and make its ETag weak"""
+
+        response = make_client().get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.headers["ETag"] == 'W/"1"'
+        assert int(response.headers["Content-Length"]) < len(LARGE_BODY)
+        assert response.text == LARGE_BODY
+
+    def test_skip_small_body(self):
+        """Should send a body under the minimum size as it is"""
+
+        response = make_client().get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+        assert response.text == "contact"
+
+    def test_skip_without_accept_encoding(self):
+        """Should send the body as it is, varying on Accept-Encoding"""
+
+        response = make_client().get(
+            "/large", headers={"Accept-Encoding": "identity, gzip;q=0"}
+        )
+
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.headers["ETag"] == '"1"'
+        assert response.text == LARGE_BODY
+
+    def test_compress_stream(self):
+        """Should compress a streaming response chunk by chunk"""
+
+        with make_client().stream(
+            "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+        ) as response:
+            raw = b"".join(response.iter_raw())
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in response.headers
+        assert gzip.decompress(raw) == b"first\n" * 100 + b"second\n" * 100
+
+    def test_skip_event_stream(self):
+        """Should never compress Server-Sent Events"""
+
+        response = make_client().get("/events", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+        assert response.text.count("event: contact") == 100
+
+    def test_minimum_size_and_disabled(self):
+        """Should follow the profile's minimum size, and do nothing without encodings"""
+
+        profile = CompressionProfile(minimum_size=1)
+        small = make_client(profile).get("/small", headers={"Accept-Encoding": "gzip"})
+        disabled = make_client(CompressionProfile(encodings=())).get(
+            "/large", headers={"Accept-Encoding": "gzip"}
+        )
+
+        # compressing "contact" would make it longer
+        assert "Content-Encoding" not in small.headers
+        assert "Content-Encoding" not in disabled.headers
+        assert "Vary" not in disabled.headers
+
+
+class TestCompressionProfile:
+    """Test class for CompressionProfile"""
+
+    def test_from_env(self, monkeypatch):
+        """Should read the encodings, minimum size and gzip level from environment"""
+
+        monkeypatch.setenv("COMPRESSION_ENCODINGS", "gzip, br")
+        monkeypatch.setenv("COMPRESSION_MINIMUM_SIZE", "1024")
+        monkeypatch.setenv("COMPRESSION_GZIP_LEVEL", "9")
+
+        profile = CompressionProfile.from_env()
+        assert profile.encodings == ("gzip", "br")
+        assert profile.minimum_size == 1024
+        assert profile.gzip_level == 9
+        assert "gzip" in profile.available_encodings
+
+    def test_reject_invalid_settings(self):
+        """Should reject unknown encodings and gzip levels"""
+
+        with pytest.raises(ValueError):
+            CompressionProfile(encodings=("deflate",))
+        with pytest.raises(ValueError):
+            CompressionProfile(gzip_level=10)
+
+    def test_negotiate_encoding(self):
+        """Should pick the first preferred encoding the client accepts"""
+
+        encodings = ("br", "gzip")
+        assert negotiate_encoding("gzip, deflate, br", encodings) == "br"
+        assert negotiate_encoding("br;q=0, gzip;q=0.5", encodings) == "gzip"
+        assert negotiate_encoding("*", encodings) == "br"
+        assert negotiate_encoding("*, br;q=0", encodings) == "gzip"
+        assert negotiate_encoding("", encodings) is None
@@ -3,7 +3,14 @@
 import pytest
 from fastapi.testclient import TestClient
 from main import app
-from core.db import get_test_session, get_session, test_engine
+from core.cache import contact_cache
+from core.db import (
+    get_async_session,
+    get_async_test_session,
+    get_session,
+    get_test_session,
+    test_engine,
+)
 from schemas.contact import Base
 
 
@@ -22,7 +29,9 @@ def setup_database():
     """
 
     app.dependency_overrides[get_session] = get_test_session
+    app.dependency_overrides[get_async_session] = get_async_test_session
     Base.metadata.create_all(bind=test_engine)
+    contact_cache.clear()
     yield
     Base.metadata.drop_all(bind=test_engine)
     app.dependency_overrides.clear()
@@ -1,8 +1,18 @@
 """Integration tests for contacts"""
 
+import asyncio
+import csv
+import io
+import json
 from pprint import pprint
+from uuid import uuid4
 from fastapi.testclient import TestClient
 from faker import Faker
+from sqlalchemy import event
+from core.db import async_test_session, test_engine
+from models.contact import ContactModel
+from routes.v1.endpoints.contacts import contact_events_route
+from services.contact import AsyncContactService
 
 BASE_CONTACT_URL = "/api/v1/contacts"
 
@@ -13,9 +23,58 @@ def test_get_contacts(client: TestClient):
     """
     response = client.get(BASE_CONTACT_URL)
     assert response.status_code == 200
+    assert response.json() == {"items": [], "next_cursor": None}
+
+
+def test_get_all_contacts(client: TestClient):
+    """
+    Should return 200 status code and the plain list of contacts when all=true
+    """
+    response = client.get(BASE_CONTACT_URL, params={"all": "true"})
+    assert response.status_code == 200
     assert response.json() == []
 
 
+def test_paginate_contacts(client: TestClient):
+    """
+    Should walk through every contact exactly once, newest first, following next_cursor
+    """
+    created_ids = set()
+    for _ in range(5):
+        new_data = {
+            "name": Faker().name(),
+            "address": Faker().address(),
+            "email": Faker().email(),
+            "phone": Faker().phone_number(),
+        }
+        created_ids.add(client.post(BASE_CONTACT_URL, json=new_data).json()["id"])
+
+    seen_ids = []
+    params = {"limit": 2}
+    while True:
+        response = client.get(BASE_CONTACT_URL, params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["items"]) <= 2
+        seen_ids.extend(contact["id"] for contact in page["items"])
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    all_contacts = client.get(BASE_CONTACT_URL, params={"all": "true"}).json()
+    assert len(seen_ids) == len(created_ids)
+    assert set(seen_ids) == created_ids
+    assert seen_ids == [contact["id"] for contact in all_contacts]
+
+
+def test_get_contacts_with_invalid_cursor(client: TestClient):
+    """
+    Should return 400 status code when the cursor is malformed
+    """
+    response = client.get(BASE_CONTACT_URL, params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
 def test_create_contact(client: TestClient):
     """
     Should return 201 status code and the new contact
@@ -55,6 +114,201 @@ def test_get_contact_by_id(client: TestClient):
     assert response.json() == contact
 
 
+def test_select_contact_fields(client: TestClient):
+    """
+    Should read and return only the selected fields from the list and detail
+    """
+    new_data = {
+        "name": Faker().name(),
+        "address": Faker().address(),
+        "email": Faker().email(),
+        "phone": Faker().phone_number(),
+    }
+    contact = client.post(BASE_CONTACT_URL, json=new_data).json()
+
+    statements = []
+
+    def record_select(_conn, _cursor, statement, _parameters, _context, _executemany):
+        if "FROM contacts" in statement and "contacts_revision" not in statement:
+            statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", record_select)
+    try:
+        page = client.get(BASE_CONTACT_URL, params={"fields": "id,name"}).json()
+        everything = client.get(
+            BASE_CONTACT_URL, params={"all": "true", "fields": "name"}
+        ).json()
+    finally:
+        event.remove(test_engine, "before_cursor_execute", record_select)
+
+    assert page == {
+        "items": [{"id": contact["id"], "name": new_data["name"]}],
+        "next_cursor": None,
+    }
+    assert everything == [{"name": new_data["name"]}]
+    assert len(statements) == 2
+    assert all("address" not in statement for statement in statements)
+
+    detail = client.get(
+        f"{BASE_CONTACT_URL}/{contact['id']}", params={"fields": "email,version"}
+    )
+    assert detail.json() == {"email": new_data["email"], "version": 1}
+
+    invalid = client.get(BASE_CONTACT_URL, params={"fields": "name,secret"})
+    assert invalid.status_code == 400
+
+
+def test_cached_contact_follows_writes(client: TestClient):
+    """
+    Should serve repeated reads from the cache and never a stale contact after writes
+    """
+    new_data = {
+        "name": Faker().name(),
+        "address": Faker().address(),
+        "email": Faker().email(),
+        "phone": Faker().phone_number(),
+    }
+    contact = client.post(BASE_CONTACT_URL, json=new_data).json()
+    contact_url = f"{BASE_CONTACT_URL}/{contact['id']}"
+
+    client.get(contact_url)
+    assert client.get(contact_url).json() == contact
+
+    stats = client.get(f"{BASE_CONTACT_URL}/cache/stats").json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+    update_data = {**new_data, "name": Faker().name()}
+    client.put(contact_url, json=update_data)
+    assert client.get(contact_url).json()["name"] == update_data["name"]
+
+    client.post(f"{BASE_CONTACT_URL}/bulk/delete", json={"ids": [contact["id"]]})
+    assert client.get(contact_url).status_code == 404
+
+
+def test_conditional_get_contacts(client: TestClient):
+    """
+    Should return 304 for an unchanged list or contact and 200 once it is written
+    """
+    new_data = {
+        "name": Faker().name(),
+        "address": Faker().address(),
+        "email": Faker().email(),
+        "phone": Faker().phone_number(),
+    }
+    contact = client.post(BASE_CONTACT_URL, json=new_data).json()
+    contact_url = f"{BASE_CONTACT_URL}/{contact['id']}"
+
+    list_response = client.get(BASE_CONTACT_URL)
+    list_etag = list_response.headers["ETag"]
+    contact_etag = client.get(contact_url).headers["ETag"]
+
+    not_modified = client.get(BASE_CONTACT_URL, headers={"If-None-Match": list_etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == list_etag
+    assert not_modified.content == b""
+    assert (
+        client.get(contact_url, headers={"If-None-Match": contact_etag}).status_code
+        == 304
+    )
+    assert (
+        client.get(
+            BASE_CONTACT_URL,
+            params={"all": "true"},
+            headers={"If-None-Match": list_etag},
+        ).status_code
+        == 200
+    )
+
+    client.put(contact_url, json={**new_data, "name": Faker().name()})
+
+    modified = client.get(BASE_CONTACT_URL, headers={"If-None-Match": list_etag})
+    assert modified.status_code == 200
+    assert modified.headers["ETag"] != list_etag
+    assert (
+        client.get(contact_url, headers={"If-None-Match": contact_etag}).status_code
+        == 200
+    )
+
+
+def test_optimistic_concurrency(client: TestClient):
+    """
+    Should bump the version on every update and refuse writes on an old version
+    """
+    new_data = {
+        "name": Faker().name(),
+        "address": Faker().address(),
+        "email": Faker().email(),
+        "phone": Faker().phone_number(),
+    }
+    contact = client.post(BASE_CONTACT_URL, json=new_data).json()
+    contact_url = f"{BASE_CONTACT_URL}/{contact['id']}"
+    assert contact["version"] == 1
+
+    etag = client.get(contact_url).headers["ETag"]
+    first = client.put(
+        contact_url, json={**new_data, "name": "First"}, headers={"If-Match": etag}
+    )
+    assert first.status_code == 202
+    assert first.json()["version"] == 2
+    assert first.headers["ETag"] != etag
+
+    second = client.put(
+        contact_url, json={**new_data, "name": "Second"}, headers={"If-Match": etag}
+    )
+    assert second.status_code == 412
+    assert client.get(contact_url).json()["name"] == "First"
+    assert client.delete(contact_url, headers={"If-Match": etag}).status_code == 412
+
+    client.put(f"{BASE_CONTACT_URL}/bulk", json={contact["id"]: new_data})
+    current = client.get(contact_url)
+    assert current.json()["version"] == 3
+
+    assert (
+        client.put(
+            f"{BASE_CONTACT_URL}/{uuid4()}", json=new_data, headers={"If-Match": etag}
+        ).status_code
+        == 404
+    )
+    assert (
+        client.delete(
+            contact_url, headers={"If-Match": current.headers["ETag"]}
+        ).status_code
+        == 202
+    )
+
+
+def test_patch_contact(client: TestClient):
+    """
+    Should only change the fields that are sent and reject nulls and empty patches
+    """
+    new_data = {
+        "name": Faker().name(),
+        "address": Faker().address(),
+        "email": Faker().email(),
+        "phone": Faker().phone_number(),
+    }
+    contact = client.post(BASE_CONTACT_URL, json=new_data).json()
+    contact_url = f"{BASE_CONTACT_URL}/{contact['id']}"
+
+    response = client.patch(contact_url, json={"phone": "07700900123"})
+    assert response.status_code == 202
+    assert response.json() == {**contact, "phone": "07700900123", "version": 2}
+    assert client.get(contact_url).json()["phone"] == "07700900123"
+
+    client.patch(contact_url, json={"name": "Grace Hopper"})
+    results = client.get(f"{BASE_CONTACT_URL}/search", params={"q": "hopper"}).json()
+    assert [item["id"] for item in results["items"]] == [contact["id"]]
+
+    assert client.patch(contact_url, json={"name": None}).status_code == 422
+    assert client.patch(contact_url, json={}).status_code == 422
+    assert (
+        client.patch(f"{BASE_CONTACT_URL}/{uuid4()}", json={"name": "x"}).status_code
+        == 404
+    )
+
+
 def test_delete_contact(client: TestClient):
     """
     Should return the deleted contact
@@ -112,3 +366,571 @@ def test_update_contact(client: TestClient):
     assert update_response.status_code == 202
     assert updated_contact["id"] == new_contact["id"]
     assert updated_contact["name"] == update_data["name"]
+
+
+def test_list_queries_walk_the_index(client: TestClient):
+    """
+    Should list and paginate contacts without sorting them in a temporary b-tree
+    """
+    for _ in range(3):
+        new_data = {
+            "name": Faker().name(),
+            "address": Faker().address(),
+            "email": Faker().email(),
+            "phone": Faker().phone_number(),
+        }
+        client.post(BASE_CONTACT_URL, json=new_data)
+
+    statements = []
+
+    def record_select(_conn, _cursor, statement, parameters, _context, _executemany):
+        # the revision lookup for the ETag reads no contact
+        if statement.lstrip().upper().startswith("SELECT") and (
+            "contacts_revision" not in statement
+        ):
+            statements.append((statement, parameters))
+
+    event.listen(test_engine, "before_cursor_execute", record_select)
+    try:
+        first_page = client.get(BASE_CONTACT_URL, params={"limit": 1}).json()
+        client.get(
+            BASE_CONTACT_URL,
+            params={"limit": 1, "cursor": first_page["next_cursor"]},
+        )
+        client.get(BASE_CONTACT_URL, params={"all": "true"})
+    finally:
+        event.remove(test_engine, "before_cursor_execute", record_select)
+
+    assert len(statements) == 3
+    with test_engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).fetchall()
+            details = " ".join(row[-1] for row in plan)
+            assert "USE TEMP B-TREE FOR ORDER BY" not in details
+            assert "ix_contacts_created_at_id" in details
+            if "WHERE" in statement:
+                assert "SEARCH contacts USING INDEX" in details
+
+
+def test_contact_changes(client: TestClient):
+    """
+    Should feed the contacts written and the ids deleted after a cursor, by index
+    """
+    new_data = [
+        {
+            "name": Faker().name(),
+            "address": Faker().address(),
+            "email": Faker().email(),
+            "phone": Faker().phone_number(),
+        }
+        for _ in range(3)
+    ]
+    ids = client.post(f"{BASE_CONTACT_URL}/bulk", json=new_data).json()["ids"]
+
+    feed = client.get(f"{BASE_CONTACT_URL}/changes").json()
+    assert [contact["id"] for contact in feed["items"]] == ids
+    assert feed["created"] == ids
+    assert feed["deleted"] == []
+    assert feed["has_more"] is False
+    assert all(contact["updated_at"] for contact in feed["items"])
+
+    since = feed["next_since"]
+    client.patch(f"{BASE_CONTACT_URL}/{ids[0]}", json={"phone": "0123456789"})
+    client.delete(f"{BASE_CONTACT_URL}/{ids[1]}")
+
+    statements = []
+
+    def record_select(_conn, _cursor, statement, parameters, _context, _executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(test_engine, "before_cursor_execute", record_select)
+    try:
+        first = client.get(
+            f"{BASE_CONTACT_URL}/changes", params={"since": since, "limit": 1}
+        ).json()
+    finally:
+        event.remove(test_engine, "before_cursor_execute", record_select)
+
+    assert [contact["id"] for contact in first["items"]] == [ids[0]]
+    assert first["items"][0]["phone"] == "0123456789"
+    assert first["created"] == []
+    assert first["deleted"] == []
+    assert first["has_more"] is True
+
+    second = client.get(
+        f"{BASE_CONTACT_URL}/changes", params={"since": first["next_since"]}
+    ).json()
+    assert second["items"] == []
+    assert second["deleted"] == [ids[1]]
+    assert second["has_more"] is False
+
+    empty = client.get(
+        f"{BASE_CONTACT_URL}/changes", params={"since": second["next_since"]}
+    ).json()
+    assert empty == {
+        "items": [],
+        "created": [],
+        "deleted": [],
+        "next_since": second["next_since"],
+        "has_more": False,
+    }
+
+    assert len(statements) == 2
+    with test_engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).fetchall()
+            details = " ".join(row[-1] for row in plan)
+            assert "USING INDEX ix_contact" in details
+            assert "USE TEMP B-TREE" not in details
+
+
+def test_contact_changes_created_after_since(client: TestClient):
+    """
+    Should list a contact as created when it did not exist at since, even after
+    it was updated, and only as written when it did
+    """
+    new_data = {
+        "name": Faker().name(),
+        "address": Faker().address(),
+        "email": Faker().email(),
+        "phone": Faker().phone_number(),
+    }
+    old_id = client.post(f"{BASE_CONTACT_URL}/", json=new_data).json()["id"]
+    since = client.get(f"{BASE_CONTACT_URL}/changes").json()["next_since"]
+    new_id = client.post(f"{BASE_CONTACT_URL}/", json=new_data).json()["id"]
+    for contact_id in (old_id, new_id):
+        client.patch(f"{BASE_CONTACT_URL}/{contact_id}", json={"phone": "0123456789"})
+
+    feed = client.get(f"{BASE_CONTACT_URL}/changes", params={"since": since}).json()
+    assert [contact["id"] for contact in feed["items"]] == [old_id, new_id]
+    assert [contact["version"] for contact in feed["items"]] == [2, 2]
+    assert feed["created"] == [new_id]
+
+
+def test_contact_events(client: TestClient, monkeypatch):
+    """
+    Should push an event for every write committed while the stream is open
+    """
+    monkeypatch.setattr("routes.v1.endpoints.contacts.SSE_KEEPALIVE_SECONDS", 0.01)
+    new_data = {
+        "name": Faker().name(),
+        "address": Faker().address(),
+        "email": Faker().email(),
+        "phone": Faker().phone_number(),
+    }
+
+    async def scenario():
+        async with async_test_session() as session:
+            response = await contact_events_route(AsyncContactService(), session)
+            stream = response.body_iterator
+            try:
+                # a keep-alive means the stream has read the feed and let go of
+                # the shared in-memory database, which would refuse the writes
+                # with "table is locked" during a read
+                assert await anext(stream) == ": keep-alive\n\n"
+
+                # the writes go through the app on the test client's own thread
+                created = await asyncio.to_thread(
+                    client.post, BASE_CONTACT_URL, json=new_data
+                )
+                contact_id = created.json()["id"]
+                created_event = await asyncio.wait_for(anext(stream), 5)
+
+                await asyncio.to_thread(
+                    client.delete, f"{BASE_CONTACT_URL}/{contact_id}"
+                )
+                deleted_event = await asyncio.wait_for(anext(stream), 5)
+            finally:
+                await stream.aclose()
+        return contact_id, created_event, deleted_event
+
+    contact_id, created_event, deleted_event = asyncio.run(scenario())
+    assert created_event.split("\n")[1] == "event: created"
+    assert json.loads(created_event.split("data: ")[1])["id"] == contact_id
+    assert created_event.startswith("id: ")
+    assert deleted_event.split("\n")[1:3] == [
+        "event: deleted",
+        f'data: {{"id":"{contact_id}"}}',
+    ]
+
+
+def test_export_contacts_as_ndjson(client: TestClient):
+    """
+    Should stream every contact as one JSON document per line
+    """
+    created = []
+    for _ in range(3):
+        new_data = {
+            "name": Faker().name(),
+            "address": Faker().address(),
+            "email": Faker().email(),
+            "phone": Faker().phone_number(),
+        }
+        created.append(client.post(BASE_CONTACT_URL, json=new_data).json())
+
+    response = client.get(f"{BASE_CONTACT_URL}/export", params={"chunk_size": 2})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(contact["id"] for contact in exported) == sorted(
+        contact["id"] for contact in created
+    )
+    for contact in exported:
+        assert set(contact) == set(ContactModel.model_fields)
+
+
+def test_export_contacts_as_csv(client: TestClient):
+    """
+    Should stream every contact as CSV with a header row
+    """
+    new_data = {
+        "name": Faker().name(),
+        "address": Faker().address(),
+        "email": Faker().email(),
+        "phone": Faker().phone_number(),
+    }
+    contact = client.post(BASE_CONTACT_URL, json=new_data).json()
+
+    response = client.get(f"{BASE_CONTACT_URL}/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert rows == [{field: str(contact[field]) for field in ContactModel.model_fields}]
+
+
+def test_bulk_create_contacts(client: TestClient):
+    """
+    Should return 201 status code and create every contact in chunks
+    """
+    new_data = [
+        {
+            "name": Faker().name(),
+            "address": Faker().address(),
+            "email": Faker().email(),
+            "phone": Faker().phone_number(),
+        }
+        for _ in range(5)
+    ]
+    response = client.post(
+        f"{BASE_CONTACT_URL}/bulk", params={"chunk_size": 2}, json=new_data
+    )
+
+    assert response.status_code == 201
+    result = response.json()
+    assert result["created"] == 5
+    assert result["errors"] == []
+    assert result["rows_per_second"] > 0
+
+    contacts = client.get(BASE_CONTACT_URL, params={"all": "true"}).json()
+    assert {contact["id"] for contact in contacts} == set(result["ids"])
+
+
+def test_bulk_create_contacts_keeps_valid_items(client: TestClient):
+    """
+    Should report the contact the database rejects and still create the others
+    """
+    with test_engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TRIGGER reject_contact BEFORE INSERT ON contacts "
+            "WHEN NEW.name = 'rejected' BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+        )
+
+    new_data = [
+        {
+            "name": name,
+            "address": Faker().address(),
+            "email": Faker().email(),
+            "phone": Faker().phone_number(),
+        }
+        for name in ["first", "rejected", "third", "fourth"]
+    ]
+    response = client.post(
+        f"{BASE_CONTACT_URL}/bulk", params={"chunk_size": 3}, json=new_data
+    )
+
+    assert response.status_code == 201
+    result = response.json()
+    assert result["created"] == 3
+    assert [error["index"] for error in result["errors"]] == [1]
+
+    contacts = client.get(BASE_CONTACT_URL, params={"all": "true"}).json()
+    assert sorted(contact["name"] for contact in contacts) == [
+        "first",
+        "fourth",
+        "third",
+    ]
+
+
+def test_bulk_create_contacts_reports_invalid_items(client: TestClient):
+    """
+    Should create the valid contacts of a mixed batch and report the invalid ones
+    """
+    new_data = [
+        {
+            "name": Faker().name(),
+            "address": Faker().address(),
+            "email": Faker().email(),
+            "phone": Faker().phone_number(),
+        }
+        for _ in range(1200)
+    ]
+    new_data.insert(700, {"name": "bad"})
+    new_data.append({"name": "worse", "email": None})
+
+    response = client.post(f"{BASE_CONTACT_URL}/bulk", json=new_data)
+
+    assert response.status_code == 201
+    result = response.json()
+    assert result["created"] == 1200
+    assert [error["index"] for error in result["errors"]] == [700, 1201]
+    assert result["errors"][0]["detail"].startswith("email: Field required")
+
+    contacts = client.get(BASE_CONTACT_URL, params={"all": "true"}).json()
+    assert len(contacts) == 1200
+    assert "bad" not in {contact["name"] for contact in contacts}
+
+
+def test_bulk_delete_contacts(client: TestClient):
+    """
+    Should return 202 status code, delete the existing contacts and report missing ids
+    """
+    new_data = [
+        {
+            "name": Faker().name(),
+            "address": Faker().address(),
+            "email": Faker().email(),
+            "phone": Faker().phone_number(),
+        }
+        for _ in range(3)
+    ]
+    created_ids = client.post(f"{BASE_CONTACT_URL}/bulk", json=new_data).json()["ids"]
+    missing_id = str(uuid4())
+
+    response = client.post(
+        f"{BASE_CONTACT_URL}/bulk/delete",
+        json={"ids": [created_ids[0], missing_id, created_ids[2]]},
+    )
+
+    assert response.status_code == 202
+    assert response.json() == {
+        "found": [created_ids[0], created_ids[2]],
+        "missing": [missing_id],
+    }
+    contacts = client.get(BASE_CONTACT_URL, params={"all": "true"}).json()
+    assert [contact["id"] for contact in contacts] == [created_ids[1]]
+
+
+def test_bulk_update_contacts(client: TestClient):
+    """
+    Should return 202 status code, update the existing contacts and report missing ids
+    """
+    new_data = [
+        {
+            "name": Faker().name(),
+            "address": Faker().address(),
+            "email": Faker().email(),
+            "phone": Faker().phone_number(),
+        }
+        for _ in range(2)
+    ]
+    created_ids = client.post(f"{BASE_CONTACT_URL}/bulk", json=new_data).json()["ids"]
+    missing_id = str(uuid4())
+    update_data = {
+        contact_id: {
+            "name": f"updated {index}",
+            "address": Faker().address(),
+            "email": Faker().email(),
+            "phone": Faker().phone_number(),
+        }
+        for index, contact_id in enumerate([*created_ids, missing_id])
+    }
+
+    response = client.put(f"{BASE_CONTACT_URL}/bulk", json=update_data)
+
+    assert response.status_code == 202
+    assert response.json() == {"found": created_ids, "missing": [missing_id]}
+    for index, contact_id in enumerate(created_ids):
+        contact = client.get(f"{BASE_CONTACT_URL}/{contact_id}").json()
+        assert contact["name"] == f"updated {index}"
+
+
+def test_search_contacts(client: TestClient):
+    """
+    Should find contacts by name, email fragment and address, and follow changes
+    """
+    new_data = [
+        {
+            "name": "Margaret Thatcher",
+            "address": "10 Downing Street, London",
+            "email": "maggie@gov.uk",
+            "phone": "01234567890",
+        },
+        {
+            "name": "Winston Churchill",
+            "address": "Chartwell, Kent",
+            "email": "winston.churchill@gov.uk",
+            "phone": "01234567891",
+        },
+    ]
+    ids = client.post(f"{BASE_CONTACT_URL}/bulk", json=new_data).json()["ids"]
+
+    def search(query, **params):
+        response = client.get(
+            f"{BASE_CONTACT_URL}/search", params={"q": query, **params}
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    assert [c["id"] for c in search("marg")["items"]] == [ids[0]]
+    assert [c["id"] for c in search("churchill")["items"]] == [ids[1]]
+    assert [c["id"] for c in search("downing lond")["items"]] == [ids[0]]
+    assert search("nobody")["items"] == []
+
+    page = search("gov", limit=1)
+    assert len(page["items"]) == 1
+    assert page["next_offset"] == 1
+    assert search("gov", limit=1, offset=1)["next_offset"] is None
+
+    client.put(
+        f"{BASE_CONTACT_URL}/{ids[0]}", json={**new_data[0], "name": "Clement Attlee"}
+    )
+    assert search("marg")["items"] == []
+    assert [c["id"] for c in search("clem")["items"]] == [ids[0]]
+
+    client.delete(f"{BASE_CONTACT_URL}/{ids[1]}")
+    assert search("churchill")["items"] == []
+
+
+def test_search_survives_renumbered_rowids(client: TestClient):
+    """
+    Should keep matching the right contacts after their rowids change, as a
+    VACUUM may renumber them
+    """
+    new_data = [
+        {
+            "name": name,
+            "address": Faker().address(),
+            "email": Faker().email(),
+            "phone": Faker().phone_number(),
+        }
+        for name in ["Ada Lovelace", "Alan Turing", "Grace Hopper"]
+    ]
+    ids = client.post(f"{BASE_CONTACT_URL}/bulk", json=new_data).json()["ids"]
+    client.delete(f"{BASE_CONTACT_URL}/{ids[0]}")
+    with test_engine.begin() as conn:
+        # what VACUUM does to a table without an INTEGER PRIMARY KEY
+        conn.exec_driver_sql("UPDATE contacts SET rowid = rowid - 1")
+    new_id = client.post(
+        f"{BASE_CONTACT_URL}/", json={**new_data[0], "name": "Alan Kay"}
+    ).json()["id"]
+
+    response = client.get(f"{BASE_CONTACT_URL}/search", params={"q": "alan"})
+    assert {c["id"] for c in response.json()["items"]} == {ids[1], new_id}
+    response = client.get(f"{BASE_CONTACT_URL}/search", params={"q": "grace"})
+    assert [c["id"] for c in response.json()["items"]] == [ids[2]]
+
+
+def test_autocomplete_contacts(client: TestClient):
+    """
+    Should suggest contacts by name or email prefix using the search key indexes
+    """
+    new_data = [
+        {
+            "name": "Johnny Cash",
+            "address": Faker().address(),
+            "email": "cash@example.com",
+            "phone": Faker().phone_number(),
+        },
+        {
+            "name": "Ada Lovelace",
+            "address": Faker().address(),
+            "email": "JOHN.ada@example.com",
+            "phone": Faker().phone_number(),
+        },
+        {
+            "name": "Alan Turing",
+            "address": Faker().address(),
+            "email": "alan@example.com",
+            "phone": Faker().phone_number(),
+        },
+    ]
+    ids = client.post(f"{BASE_CONTACT_URL}/bulk", json=new_data).json()["ids"]
+
+    statements = []
+
+    def record_select(_conn, _cursor, statement, parameters, _context, _executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(test_engine, "before_cursor_execute", record_select)
+    try:
+        response = client.get(
+            f"{BASE_CONTACT_URL}/autocomplete", params={"prefix": "John"}
+        )
+    finally:
+        event.remove(test_engine, "before_cursor_execute", record_select)
+
+    assert response.status_code == 200
+    assert statements
+    assert response.json() == [
+        {"id": ids[0], "name": "Johnny Cash", "email": "cash@example.com"},
+        {"id": ids[1], "name": "Ada Lovelace", "email": "JOHN.ada@example.com"},
+    ]
+
+    with test_engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).fetchall()
+            details = " ".join(row[-1] for row in plan)
+            assert "SEARCH contacts USING INDEX ix_contacts_" in details
+            assert "USE TEMP B-TREE" not in details
+
+    response = client.get(
+        f"{BASE_CONTACT_URL}/autocomplete", params={"prefix": "john", "limit": 1}
+    )
+    assert [contact["id"] for contact in response.json()] == [ids[0]]
+
+
+def test_autocomplete_contacts_non_ascii(client: TestClient):
+    """
+    Should match non-ASCII prefixes whatever their case, after updates too
+    """
+    new_data = {
+        "name": "Émile Zola",
+        "address": Faker().address(),
+        "email": "zola@example.com",
+        "phone": Faker().phone_number(),
+    }
+    contact_id = client.post(f"{BASE_CONTACT_URL}/", json=new_data).json()["id"]
+
+    for prefix in ("Émi", "émile", "ÉMILE Z"):
+        response = client.get(
+            f"{BASE_CONTACT_URL}/autocomplete", params={"prefix": prefix}
+        )
+        assert [contact["id"] for contact in response.json()] == [contact_id]
+
+    client.patch(f"{BASE_CONTACT_URL}/{contact_id}", json={"name": "Ångström"})
+    response = client.get(f"{BASE_CONTACT_URL}/autocomplete", params={"prefix": "ÅNG"})
+    assert [contact["id"] for contact in response.json()] == [contact_id]
+    response = client.get(f"{BASE_CONTACT_URL}/autocomplete", params={"prefix": "émi"})
+    assert response.json() == []
+
+
+def test_autocomplete_contacts_last_code_point(client: TestClient):
+    """
+    Should answer a prefix ending in U+10FFFF instead of failing
+    """
+    for prefix in (chr(0x10FFFF), f"jo{chr(0x10FFFF)}"):
+        response = client.get(
+            f"{BASE_CONTACT_URL}/autocomplete", params={"prefix": prefix}
+        )
+        assert response.status_code == 200
+        assert response.json() == []
@@ -1,18 +1,39 @@
 """Unit tests for contacts route"""
 
+import asyncio
+import json
 from uuid import uuid4
 import pytest
 from faker import Faker
 from fastapi import HTTPException
 from routes.v1.endpoints.contacts import (
+    autocomplete_contacts_route,
+    bulk_create_contacts_route,
+    bulk_delete_contacts_route,
+    bulk_update_contacts_route,
+    contact_cache_stats_route,
+    contact_changes_route,
+    contact_events_route,
     contact_list_route,
+    export_contacts_route,
     create_contact_route,
     delete_contact_route,
     update_contact_route,
     get_contact_by_id_route,
+    patch_contact_route,
+    search_contacts_route,
+)
+from models.errors import (
+    DatabaseOperationError,
+    InvalidCursorError,
+    VersionConflictError,
+)
+from models.contact import (
+    InsertContactModel,
+    ContactModel,
+    BulkDeleteContactsModel,
+    PatchContactModel,
 )
-from models.errors import DatabaseOperationError
-from models.contact import InsertContactModel, ContactModel
 
 FAKE_ERROR_MESSAGE = Faker().sentence()
 FAKE_NAME = Faker().name()
@@ -21,65 +42,531 @@ FAKE_NUMBER = Faker().phone_number()
 FAKE_EMAIL = Faker().email()
 
 
+def fake_contact(**changes) -> dict:
+    """A contact as the service returns it"""
+
+    return {
+        "id": uuid4(),
+        "name": FAKE_NAME,
+        "email": FAKE_EMAIL,
+        "phone": FAKE_NUMBER,
+        "address": FAKE_ADDRESS,
+        "version": 1,
+        **changes,
+    }
+
+
+def fake_row(**changes) -> dict:
+    """A contact as list queries return it, a dict of every column"""
+
+    return fake_contact(created_at=None, updated_at=None, **changes)
+
+
+def as_json(contact: dict) -> dict:
+    """The contact as it is serialised in a response body"""
+
+    return {
+        "created_at": None,
+        "updated_at": None,
+        **contact,
+        "id": str(contact["id"]),
+    }
+
+
 class TestGetContactsRoute:
     """Test class for GET /contacts endpoint"""
 
     def test_get_contacts_route(self, mocker):
         """
-        Should return a list of contacts when the service returns a list
+        Should return a page of contacts when the service returns a page
         """
-        mock_service = mocker.Mock()
-        mock_service.get_all_contacts.return_value = []
+        mock_service = mocker.AsyncMock()
+        mock_service.get_contacts_page.return_value = ([], None)
+        mock_get_session = mocker.Mock()
+
+        response = asyncio.run(contact_list_route(mock_service, mock_get_session))
+        mock_service.get_contacts_page.assert_called_with(
+            mock_get_session, 50, None, None
+        )
+        mock_service.get_all_contacts.assert_not_called()
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {"items": [], "next_cursor": None}
+
+    def test_get_contacts_route_with_cursor(self, mocker):
+        """
+        Should pass the limit and cursor to the service and return the next cursor
+        """
+        contact = fake_row()
+        mock_service = mocker.AsyncMock()
+        mock_service.get_contacts_page.return_value = ([contact], "next")
         mock_get_session = mocker.Mock()
 
-        response = contact_list_route(mock_service, mock_get_session)
-        mock_service.get_all_contacts.assert_called_with(mock_get_session)
-        assert response == []
+        response = asyncio.run(
+            contact_list_route(
+                mock_service, mock_get_session, limit=1, cursor="current"
+            )
+        )
+        mock_service.get_contacts_page.assert_called_with(
+            mock_get_session, 1, "current", None
+        )
+        assert json.loads(response.body) == {
+            "items": [as_json(contact)],
+            "next_cursor": "next",
+        }
+
+    def test_get_all_contacts_route(self, mocker):
+        """
+        Should return the full list of contacts when all contacts are requested
+        """
+        contact = fake_row()
+        mock_service = mocker.AsyncMock()
+        mock_service.get_all_contacts.return_value = [contact]
+        mock_get_session = mocker.Mock()
+
+        response = asyncio.run(
+            contact_list_route(mock_service, mock_get_session, fetch_all=True)
+        )
+        mock_service.get_all_contacts.assert_called_with(mock_get_session, None)
+        mock_service.get_contacts_page.assert_not_called()
+        assert json.loads(response.body) == [as_json(contact)]
+
+    def test_get_contacts_route_with_etag(self, mocker):
+        """
+        Should set an ETag from the revision and return 304 when it still matches,
+        telling the revision either way
+        """
+        mock_service = mocker.AsyncMock()
+        mock_service.get_contacts_revision.return_value = 7
+        mock_service.get_contacts_page.return_value = ([], None)
+        mock_get_session = mocker.Mock()
+
+        response = asyncio.run(contact_list_route(mock_service, mock_get_session))
+        etag = response.headers["ETag"]
+        not_modified = asyncio.run(
+            contact_list_route(mock_service, mock_get_session, if_none_match=etag)
+        )
+        other_page = asyncio.run(
+            contact_list_route(mock_service, mock_get_session, limit=1)
+        )
+
+        assert not_modified.status_code == 304
+        assert not_modified.headers["ETag"] == etag
+        assert response.headers["X-Contacts-Revision"] == "7"
+        assert not_modified.headers["X-Contacts-Revision"] == "7"
+        assert mock_service.get_contacts_page.call_count == 2
+        assert other_page.headers["ETag"] != etag
+
+    def test_get_contacts_route_with_fields(self, mocker):
+        """
+        Should parse fields for the service and give the selection its own ETag
+        """
+        mock_service = mocker.AsyncMock()
+        mock_service.get_contacts_revision.return_value = 7
+        mock_service.get_contacts_page.return_value = ([{"name": "a"}], None)
+        mock_get_session = mocker.Mock()
+
+        narrowed = asyncio.run(
+            contact_list_route(mock_service, mock_get_session, fields="name,id")
+        )
+        mock_service.get_contacts_page.return_value = ([], None)
+        whole = asyncio.run(contact_list_route(mock_service, mock_get_session))
+
+        assert mock_service.get_contacts_page.call_args_list[0].args == (
+            mock_get_session,
+            50,
+            None,
+            ("name", "id"),
+        )
+        assert json.loads(narrowed.body) == {
+            "items": [{"name": "a"}],
+            "next_cursor": None,
+        }
+        assert narrowed.headers["ETag"] != whole.headers["ETag"]
+
+    def test_get_contacts_route_with_invalid_fields(self, mocker):
+        """
+        Should raise a HTTPException with 400 code when a field is unknown
+        """
+        mock_service = mocker.AsyncMock()
+        mock_get_session = mocker.Mock()
+
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(
+                contact_list_route(mock_service, mock_get_session, fields="password")
+            )
+
+        assert e.value.status_code == 400
+        assert e.value.detail.startswith("Invalid fields: password")
+        mock_service.get_contacts_page.assert_not_called()
+
+    def test_get_contacts_route_with_invalid_cursor(self, mocker):
+        """
+        Should raise a HTTPException with 400 code when the cursor is malformed
+        """
+        mock_service = mocker.AsyncMock()
+        mock_service.get_contacts_page.side_effect = InvalidCursorError(
+            "Invalid cursor: abc"
+        )
+        mock_get_session = mocker.Mock()
+
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(
+                contact_list_route(mock_service, mock_get_session, cursor="abc")
+            )
+
+        assert e.value.status_code == 400
+        assert e.value.detail == "Invalid cursor: abc"
 
     def test_get_contacts_route_with_error(self, mocker):
         """
         Should raise a HTTPException when the service raises an exception
         """
-        mock_service = mocker.Mock()
-        mock_service.get_all_contacts.side_effect = DatabaseOperationError(
+        mock_service = mocker.AsyncMock()
+        mock_service.get_contacts_page.side_effect = DatabaseOperationError(
             "get contacts error"
         )
         mock_get_session = mocker.Mock()
 
         with pytest.raises(HTTPException) as e:
-            contact_list_route(mock_service, mock_get_session)
+            asyncio.run(contact_list_route(mock_service, mock_get_session))
 
-        mock_service.get_all_contacts.assert_called_with(mock_get_session)
+        mock_service.get_contacts_page.assert_called_with(
+            mock_get_session, 50, None, None
+        )
         assert e.value.status_code == 500
         assert e.value.detail == "get contacts error"
 
 
+class TestExportContactsRoute:
+    """Test class for GET /contacts/export endpoint"""
+
+    def test_export_contacts_route(self, mocker):
+        """
+        Should stream the contacts and close the session once the stream is consumed
+        """
+        contact = fake_row()
+        mock_service = mocker.Mock()
+        mock_service.iter_contacts.return_value = iter([[contact]])
+        mock_get_session = mocker.Mock()
+
+        response = export_contacts_route(
+            mock_service, mock_get_session, export_format="ndjson", chunk_size=10
+        )
+        assert response.media_type == "application/x-ndjson"
+
+        async def consume():
+            return [chunk async for chunk in response.body_iterator]
+
+        body = asyncio.run(consume())
+        mock_service.iter_contacts.assert_called_with(mock_get_session, 10)
+        mock_get_session.close.assert_called_once()
+        assert body == [
+            ContactModel.model_validate(contact).model_dump_json().encode() + b"\n"
+        ]
+
+
+class TestSearchContactsRoute:
+    """Test class for GET /contacts/search endpoint"""
+
+    def test_search_contacts_route(self, mocker):
+        """
+        Should return a page of matching contacts
+        """
+        mock_service = mocker.AsyncMock()
+        contact = fake_row()
+        mock_service.search_contacts.return_value = ([contact], 20)
+        mock_get_session = mocker.Mock()
+
+        response = asyncio.run(
+            search_contacts_route(mock_service, mock_get_session, q="jo")
+        )
+        mock_service.search_contacts.assert_called_with("jo", mock_get_session, 20, 0)
+        assert json.loads(response.body) == {
+            "items": [as_json(contact)],
+            "next_offset": 20,
+        }
+
+    def test_search_contacts_route_with_error(self, mocker):
+        """
+        Should raise a HTTPException when the service raises an exception
+        """
+        mock_service = mocker.AsyncMock()
+        mock_service.search_contacts.side_effect = DatabaseOperationError(
+            "search contacts error"
+        )
+        mock_get_session = mocker.Mock()
+
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(search_contacts_route(mock_service, mock_get_session, q="jo"))
+
+        assert e.value.status_code == 500
+        assert e.value.detail == "search contacts error"
+
+
+class TestAutocompleteContactsRoute:
+    """Test class for GET /contacts/autocomplete endpoint"""
+
+    def test_autocomplete_contacts_route(self, mocker):
+        """
+        Should return the suggestions
+        """
+        mock_service = mocker.AsyncMock()
+        mock_service.autocomplete_contacts.return_value = ["suggestion"]
+        mock_get_session = mocker.Mock()
+
+        response = asyncio.run(
+            autocomplete_contacts_route(mock_service, mock_get_session, prefix="jo")
+        )
+        mock_service.autocomplete_contacts.assert_called_with(
+            "jo", mock_get_session, 10
+        )
+        assert response == ["suggestion"]
+
+    def test_autocomplete_contacts_route_with_error(self, mocker):
+        """
+        Should raise a HTTPException when the service raises an exception
+        """
+        mock_service = mocker.AsyncMock()
+        mock_service.autocomplete_contacts.side_effect = DatabaseOperationError(
+            "autocomplete error"
+        )
+        mock_get_session = mocker.Mock()
+
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(
+                autocomplete_contacts_route(mock_service, mock_get_session, prefix="jo")
+            )
+
+        assert e.value.status_code == 500
+        assert e.value.detail == "autocomplete error"
+
+
+class TestContactChangesRoute:
+    """Test class for GET /contacts/changes endpoint"""
+
+    def test_contact_changes_route(self, mocker):
+        """
+        Should pass the cursor and limit to the service and return the changes
+        """
+        changes = {
+            "items": [],
+            "created": [],
+            "deleted": [],
+            "next_since": 3,
+            "has_more": False,
+        }
+        mock_service = mocker.AsyncMock()
+        mock_service.get_changes.return_value = changes
+        mock_get_session = mocker.Mock()
+
+        response = asyncio.run(
+            contact_changes_route(mock_service, mock_get_session, since=3, limit=5)
+        )
+        mock_service.get_changes.assert_called_with(mock_get_session, 3, 5)
+        assert response == changes
+
+    def test_contact_changes_route_with_error(self, mocker):
+        """
+        Should raise a HTTPException when the service raises an exception
+        """
+        mock_service = mocker.AsyncMock()
+        mock_service.get_changes.side_effect = DatabaseOperationError("changes error")
+        mock_get_session = mocker.Mock()
+
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(contact_changes_route(mock_service, mock_get_session))
+
+        assert e.value.status_code == 500
+        assert e.value.detail == "changes error"
+
+
+class TestContactEventsRoute:
+    """Test class for GET /contacts/events endpoint"""
+
+    def test_contact_events_route(self, mocker):
+        """
+        Should stream the changes after the current revision, then keep the stream
+        alive while nothing changes. A contact created after the revision is sent
+        as created even when it has been updated since
+        """
+        mocker.patch("routes.v1.endpoints.contacts.SSE_KEEPALIVE_SECONDS", 0.01)
+        contact_id = uuid4()
+        new_id = uuid4()
+        deleted_id = uuid4()
+        contact = {
+            "id": contact_id,
+            "name": FAKE_NAME,
+            "email": FAKE_EMAIL,
+            "phone": FAKE_NUMBER,
+            "address": FAKE_ADDRESS,
+            "version": 2,
+            "updated_at": None,
+        }
+        mock_service = mocker.AsyncMock()
+        mock_service.get_contacts_revision.return_value = 4
+        mock_service.get_changes.side_effect = [
+            {
+                "items": [contact, {**contact, "id": new_id}],
+                "created": [new_id],
+                "deleted": [deleted_id],
+                "next_since": 6,
+                "has_more": False,
+            },
+            {
+                "items": [],
+                "created": [],
+                "deleted": [],
+                "next_since": 6,
+                "has_more": False,
+            },
+        ]
+        mock_get_session = mocker.AsyncMock()
+
+        async def read(count):
+            response = await contact_events_route(mock_service, mock_get_session)
+            chunks = [await anext(response.body_iterator) for _ in range(count)]
+            await response.body_iterator.aclose()
+            return response, chunks
+
+        response, chunks = asyncio.run(read(5))
+        assert response.media_type == "text/event-stream"
+        assert chunks[0].startswith("event: updated\ndata: {")
+        assert f'"id":"{contact_id}"' in chunks[0]
+        assert chunks[1].startswith("event: created\ndata: {")
+        assert f'"id":"{new_id}"' in chunks[1]
+        assert chunks[2] == f'id: 6\nevent: deleted\ndata: {{"id":"{deleted_id}"}}\n\n'
+        assert chunks[3] == chunks[4] == ": keep-alive\n\n"
+        assert mock_service.get_changes.call_args_list[0].args[1:] == (4, 100)
+        assert mock_service.get_changes.call_args_list[1].args[1:] == (6, 100)
+        mock_service.close.assert_awaited_with(mock_get_session)
+
+    def test_contact_events_route_resumes(self, mocker):
+        """
+        Should start after Last-Event-ID without reading the current revision
+        """
+        mock_service = mocker.AsyncMock()
+        mock_service.get_changes.side_effect = DatabaseOperationError("changes error")
+        mock_get_session = mocker.AsyncMock()
+
+        async def read():
+            response = await contact_events_route(
+                mock_service, mock_get_session, since=1, last_event_id=9
+            )
+            return [chunk async for chunk in response.body_iterator]
+
+        assert not asyncio.run(read())
+        mock_service.get_contacts_revision.assert_not_called()
+        assert mock_service.get_changes.call_args.args[1] == 9
+
+    def test_contact_events_route_with_error(self, mocker):
+        """
+        Should raise a HTTPException when the revision cannot be read
+        """
+        mock_service = mocker.AsyncMock()
+        mock_service.get_contacts_revision.side_effect = DatabaseOperationError(
+            "revision error"
+        )
+        mock_get_session = mocker.AsyncMock()
+
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(contact_events_route(mock_service, mock_get_session))
+
+        assert e.value.status_code == 500
+        assert e.value.detail == "revision error"
+
+
+class TestContactCacheStatsRoute:
+    """Test class for GET /contacts/cache/stats endpoint"""
+
+    def test_contact_cache_stats_route(self, mocker):
+        """
+        Should return the counters of the contact cache
+        """
+        mock_cache = mocker.patch("routes.v1.endpoints.contacts.contact_cache")
+        mock_cache.stats.return_value = {"hits": 1, "misses": 0}
+
+        response = asyncio.run(contact_cache_stats_route())
+        assert response == {"hits": 1, "misses": 0}
+
+
 class TestGetContactByIdRoute:
     """Test class for GET /contacts/:id endpoint"""
 
     def test_get_contact_by_id_route(self, mocker):
         """Should return the contact"""
-        uuid = uuid4()
-        fake_contact = {"message": "contact found"}
-        mock_service = mocker.Mock()
+        contact = fake_contact()
+        uuid = contact["id"]
+        mock_service = mocker.AsyncMock()
         mock_get_session = mocker.Mock()
-        mock_service.get_contact_by_id.return_value = fake_contact
+        mock_service.get_contact_by_id.return_value = contact
 
-        response = get_contact_by_id_route(mock_service, uuid, mock_get_session)
+        response = asyncio.run(
+            get_contact_by_id_route(mock_service, uuid, mock_get_session)
+        )
         mock_service.get_contact_by_id.assert_called_with(uuid, mock_get_session)
-        assert response == fake_contact
+        assert json.loads(response.body) == as_json(contact)
+        assert response.headers["ETag"] == '"1"'
+
+    def test_get_contact_by_id_route_with_fields(self, mocker):
+        """Should narrow the contact to the fields and keep its ETag"""
+        uuid = uuid4()
+        mock_service = mocker.AsyncMock()
+        mock_get_session = mocker.Mock()
+        mock_service.get_contact_by_id.return_value = fake_contact(id=uuid, version=3)
+
+        response = asyncio.run(
+            get_contact_by_id_route(mock_service, uuid, mock_get_session, fields="name")
+        )
+        assert json.loads(response.body) == {"name": FAKE_NAME}
+        assert response.headers["ETag"] == '"3"'
+
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(
+                get_contact_by_id_route(
+                    mock_service, uuid, mock_get_session, fields="x"
+                )
+            )
+        assert e.value.status_code == 400
+
+    def test_get_contact_by_id_route_with_etag(self, mocker):
+        """Should return 304 when If-None-Match holds the ETag of the contact"""
+        uuid = uuid4()
+        mock_service = mocker.AsyncMock()
+        mock_service.get_contact_by_id.return_value = fake_contact(id=uuid)
+        mock_get_session = mocker.Mock()
+
+        response = asyncio.run(
+            get_contact_by_id_route(mock_service, uuid, mock_get_session)
+        )
+        etag = response.headers["ETag"]
+        not_modified = asyncio.run(
+            get_contact_by_id_route(
+                mock_service, uuid, mock_get_session, if_none_match=etag
+            )
+        )
+        changed_contact = fake_contact(id=uuid, version=2)
+        mock_service.get_contact_by_id.return_value = changed_contact
+        changed = asyncio.run(
+            get_contact_by_id_route(
+                mock_service, uuid, mock_get_session, if_none_match=etag
+            )
+        )
+
+        assert not_modified.status_code == 304
+        assert etag == '"1"'
+        assert json.loads(changed.body) == as_json(changed_contact)
 
     def test_get_contact_by_id_route_with_500_error(self, mocker):
         """Should raise a HTTPException when the service raises an exception"""
         uuid = uuid4()
-        mock_service = mocker.Mock()
+        mock_service = mocker.AsyncMock()
         mock_service.get_contact_by_id.side_effect = DatabaseOperationError(
             "get contact by id error"
         )
         mock_get_session = mocker.Mock()
 
         with pytest.raises(HTTPException) as e:
-            get_contact_by_id_route(mock_service, uuid, mock_get_session)
+            asyncio.run(get_contact_by_id_route(mock_service, uuid, mock_get_session))
 
         mock_service.get_contact_by_id.assert_called_with(uuid, mock_get_session)
         assert e.value.status_code == 500
@@ -88,12 +575,12 @@ class TestGetContactByIdRoute:
     def test_get_contact_by_id_route_with_404_error(self, mocker):
         """Should raise a HTTPException with 404 code when the service couldn't find any record"""
         uuid = uuid4()
-        mock_service = mocker.Mock()
+        mock_service = mocker.AsyncMock()
         mock_service.get_contact_by_id.return_value = None
         mock_get_session = mocker.Mock()
 
         with pytest.raises(HTTPException) as e:
-            get_contact_by_id_route(mock_service, uuid, mock_get_session)
+            asyncio.run(get_contact_by_id_route(mock_service, uuid, mock_get_session))
 
         mock_service.get_contact_by_id.assert_called_with(uuid, mock_get_session)
         assert e.value.status_code == 404
@@ -114,16 +601,19 @@ class TestCreateContactRoute:
             email=FAKE_EMAIL,
             phone=FAKE_NUMBER,
         )
-        mock_service = mocker.Mock()
+        mock_service = mocker.AsyncMock()
         mock_service.create_contact.return_value = {"id": uuid, **new_data.model_dump()}
 
         mock_get_session = mocker.Mock()
 
-        response = create_contact_route(mock_service, new_data, mock_get_session)
+        response = asyncio.run(
+            create_contact_route(mock_service, new_data, mock_get_session)
+        )
 
         mock_service.create_contact.assert_called_with(new_data, mock_get_session)
-        assert response["id"] == uuid
-        assert response["name"] == FAKE_NAME
+        assert response.status_code == 201
+        assert json.loads(response.body)["id"] == str(uuid)
+        assert json.loads(response.body)["name"] == FAKE_NAME
 
     def test_post_contacts_route_with_error(self, mocker):
         """
@@ -135,20 +625,68 @@ class TestCreateContactRoute:
             email=FAKE_EMAIL,
             phone=FAKE_NUMBER,
         )
-        mock_service = mocker.Mock()
+        mock_service = mocker.AsyncMock()
         mock_service.create_contact.side_effect = DatabaseOperationError(
             "create contact error"
         )
         mock_get_session = mocker.Mock()
 
         with pytest.raises(HTTPException) as e:
-            create_contact_route(mock_service, new_data, mock_get_session)
+            asyncio.run(create_contact_route(mock_service, new_data, mock_get_session))
 
         mock_service.create_contact.assert_called_with(new_data, mock_get_session)
         assert e.value.status_code == 500
         assert e.value.detail == "create contact error"
 
 
+class TestBulkCreateContactsRoute:
+    """Test class for POST /contacts/bulk endpoint"""
+
+    def test_bulk_create_contacts_route(self, mocker):
+        """
+        Should return the result of the bulk create
+        """
+        new_data = [
+            {
+                "name": FAKE_NAME,
+                "address": FAKE_ADDRESS,
+                "email": FAKE_EMAIL,
+                "phone": FAKE_NUMBER,
+            }
+        ]
+        fake_result = {"ids": [uuid4()], "errors": [], "created": 1}
+        mock_service = mocker.AsyncMock()
+        mock_service.bulk_create_contacts.return_value = fake_result
+        mock_get_session = mocker.Mock()
+
+        response = asyncio.run(
+            bulk_create_contacts_route(
+                mock_service, new_data, mock_get_session, chunk_size=100
+            )
+        )
+
+        mock_service.bulk_create_contacts.assert_called_with(
+            new_data, mock_get_session, 100
+        )
+        assert response == fake_result
+
+    def test_bulk_create_contacts_route_with_error(self, mocker):
+        """
+        Should return a HTTPException when the service raises an exception
+        """
+        mock_service = mocker.AsyncMock()
+        mock_service.bulk_create_contacts.side_effect = DatabaseOperationError(
+            "bulk create error"
+        )
+        mock_get_session = mocker.Mock()
+
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(bulk_create_contacts_route(mock_service, [], mock_get_session))
+
+        assert e.value.status_code == 500
+        assert e.value.detail == "bulk create error"
+
+
 class TestDeleteContactRoute:
     """Test class for DELETE /contacts endpoint"""
 
@@ -165,35 +703,39 @@ class TestDeleteContactRoute:
             phone=FAKE_NUMBER,
         )
 
-        mock_service = mocker.Mock()
+        mock_service = mocker.AsyncMock()
         mock_service.delete_contact.return_value = fake_deleted_contact
         mock_get_session = mocker.Mock()
 
-        response = delete_contact_route(
-            service=mock_service, contact_id=uuid, session=mock_get_session
+        response = asyncio.run(
+            delete_contact_route(
+                service=mock_service, contact_id=uuid, session=mock_get_session
+            )
         )
-        mock_service.delete_contact.assert_called_with(uuid, mock_get_session)
+        mock_service.delete_contact.assert_called_with(uuid, mock_get_session, None)
 
-        dumped_contact = fake_deleted_contact.model_dump()
-        assert response.id == dumped_contact["id"]
-        assert response.name == dumped_contact["name"]
+        assert response.status_code == 202
+        assert json.loads(response.body)["id"] == str(uuid)
+        assert json.loads(response.body)["name"] == FAKE_NAME
 
     def test_delete_contact_route_with_500_error(self, mocker):
         """
         Should return a HTTPException when the service raises an exception
         """
         uuid = uuid4()
-        mock_service = mocker.Mock()
+        mock_service = mocker.AsyncMock()
         mock_service.delete_contact.side_effect = DatabaseOperationError(
             "delete contact error"
         )
         mock_get_session = mocker.Mock()
 
         with pytest.raises(HTTPException) as e:
-            delete_contact_route(
-                service=mock_service, contact_id=uuid, session=mock_get_session
+            asyncio.run(
+                delete_contact_route(
+                    service=mock_service, contact_id=uuid, session=mock_get_session
+                )
             )
-        mock_service.delete_contact.assert_called_with(uuid, mock_get_session)
+        mock_service.delete_contact.assert_called_with(uuid, mock_get_session, None)
         assert e.value.status_code == 500
         assert e.value.detail == "delete contact error"
 
@@ -202,16 +744,18 @@ class TestDeleteContactRoute:
         Should return a HTTPException with 404 code when the service couldn't find any record
         """
         uuid = uuid4()
-        mock_service = mocker.Mock()
+        mock_service = mocker.AsyncMock()
         mock_service.delete_contact.return_value = None
 
         mock_get_session = mocker.Mock()
 
         with pytest.raises(HTTPException) as e:
-            delete_contact_route(
-                service=mock_service, contact_id=uuid, session=mock_get_session
+            asyncio.run(
+                delete_contact_route(
+                    service=mock_service, contact_id=uuid, session=mock_get_session
+                )
             )
-        mock_service.delete_contact.assert_called_with(uuid, mock_get_session)
+        mock_service.delete_contact.assert_called_with(uuid, mock_get_session, None)
         assert e.value.status_code == 404
         assert e.value.detail == f"record with id {uuid} does not exist"
 
@@ -237,20 +781,60 @@ class TestUpdateContactRoute:
             name=FAKE_NAME,
             phone=FAKE_NUMBER,
         )
-        mock_service = mocker.Mock()
-        mock_service.update_contact.return_value = fake_updated_contact
+        mock_service = mocker.AsyncMock()
+        mock_service.update_contact.return_value = fake_updated_contact.model_dump()
         mock_get_session = mocker.Mock()
-        response = update_contact_route(mock_service, uuid, new_data, mock_get_session)
-        mock_service.update_contact.assert_called_with(uuid, new_data, mock_get_session)
-        assert response.id == uuid
-        assert response.name == FAKE_NAME
+        response = asyncio.run(
+            update_contact_route(mock_service, uuid, new_data, mock_get_session)
+        )
+        mock_service.update_contact.assert_called_with(
+            uuid, new_data, mock_get_session, None
+        )
+        assert response.status_code == 202
+        assert json.loads(response.body)["id"] == str(uuid)
+        assert json.loads(response.body)["name"] == FAKE_NAME
+        assert response.headers["ETag"] == '"1"'
+
+    def test_update_contact_route_with_412_error(self, mocker):
+        """
+        Should pass the If-Match versions on and return 412 on a version conflict
+        """
+        uuid = uuid4()
+        new_data = InsertContactModel(
+            name=FAKE_NAME,
+            address=FAKE_ADDRESS,
+            email=FAKE_EMAIL,
+            phone=FAKE_NUMBER,
+        )
+        mock_service = mocker.AsyncMock()
+        mock_service.update_contact.side_effect = VersionConflictError(
+            FAKE_ERROR_MESSAGE
+        )
+        mock_get_session = mocker.Mock()
+
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(
+                update_contact_route(
+                    mock_service,
+                    uuid,
+                    new_data,
+                    mock_get_session,
+                    if_match='"2", W/"3", "x", "4"',
+                )
+            )
+
+        mock_service.update_contact.assert_called_with(
+            uuid, new_data, mock_get_session, [2, 3, 4]
+        )
+        assert e.value.status_code == 412
+        assert e.value.detail == FAKE_ERROR_MESSAGE
 
     def test_update_contact_route_with_500_error(self, mocker):
         """
         Should return a HTTPException when the service raises an exception
         """
         uuid = uuid4()
-        mock_service = mocker.Mock()
+        mock_service = mocker.AsyncMock()
         mock_service.update_contact.side_effect = DatabaseOperationError(
             "update contact error"
         )
@@ -263,9 +847,13 @@ class TestUpdateContactRoute:
         )
 
         with pytest.raises(HTTPException) as e:
-            update_contact_route(mock_service, uuid, new_data, mock_get_session)
+            asyncio.run(
+                update_contact_route(mock_service, uuid, new_data, mock_get_session)
+            )
 
-        mock_service.update_contact.assert_called_with(uuid, new_data, mock_get_session)
+        mock_service.update_contact.assert_called_with(
+            uuid, new_data, mock_get_session, None
+        )
         assert e.value.status_code == 500
         assert e.value.detail == "update contact error"
 
@@ -274,7 +862,7 @@ class TestUpdateContactRoute:
         Should return a HTTPException with 404 code when the service couldn't find any record
         """
         uuid = uuid4()
-        mock_service = mocker.Mock()
+        mock_service = mocker.AsyncMock()
         mock_service.update_contact.return_value = None
         mock_get_session = mocker.Mock()
         new_data = InsertContactModel(
@@ -285,8 +873,147 @@ class TestUpdateContactRoute:
         )
 
         with pytest.raises(HTTPException) as e:
-            update_contact_route(mock_service, uuid, new_data, mock_get_session)
+            asyncio.run(
+                update_contact_route(mock_service, uuid, new_data, mock_get_session)
+            )
 
-        mock_service.update_contact.assert_called_with(uuid, new_data, mock_get_session)
+        mock_service.update_contact.assert_called_with(
+            uuid, new_data, mock_get_session, None
+        )
         assert e.value.status_code == 404
         assert e.value.detail == f"record with id {uuid} does not exist"
+
+
+class TestPatchContactRoute:
+    """Test class for PATCH /contacts/:id endpoint"""
+
+    def test_patch_contact_route(self, mocker):
+        """
+        Should pass the patch to the service and return the contact with its ETag
+        """
+        uuid = uuid4()
+        patch_data = PatchContactModel(phone=FAKE_NUMBER)
+        mock_service = mocker.AsyncMock()
+        updated_contact = fake_contact(id=uuid, phone=FAKE_NUMBER, version=2)
+        mock_service.update_contact.return_value = updated_contact
+        mock_get_session = mocker.Mock()
+
+        response = asyncio.run(
+            patch_contact_route(mock_service, uuid, patch_data, mock_get_session)
+        )
+
+        mock_service.update_contact.assert_called_with(
+            uuid, patch_data, mock_get_session, None
+        )
+        assert json.loads(response.body) == as_json(updated_contact)
+        assert response.headers["ETag"] == '"2"'
+
+    def test_patch_contact_route_with_404_error(self, mocker):
+        """
+        Should raise a HTTPException with 404 code when the contact does not exist
+        """
+        mock_service = mocker.AsyncMock()
+        mock_service.update_contact.return_value = None
+        mock_get_session = mocker.Mock()
+
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(
+                patch_contact_route(
+                    mock_service,
+                    uuid4(),
+                    PatchContactModel(name=FAKE_NAME),
+                    mock_get_session,
+                )
+            )
+
+        assert e.value.status_code == 404
+
+
+class TestBulkDeleteContactsRoute:
+    """Test class for POST /contacts/bulk/delete endpoint"""
+
+    def test_bulk_delete_contacts_route(self, mocker):
+        """
+        Should return the found and missing ids
+        """
+        uuid = uuid4()
+        fake_result = {"found": [uuid], "missing": []}
+        mock_service = mocker.AsyncMock()
+        mock_service.bulk_delete_contacts.return_value = fake_result
+        mock_get_session = mocker.Mock()
+
+        response = asyncio.run(
+            bulk_delete_contacts_route(
+                mock_service, BulkDeleteContactsModel(ids=[uuid]), mock_get_session
+            )
+        )
+
+        mock_service.bulk_delete_contacts.assert_called_with([uuid], mock_get_session)
+        assert response == fake_result
+
+    def test_bulk_delete_contacts_route_with_error(self, mocker):
+        """
+        Should return a HTTPException when the service raises an exception
+        """
+        mock_service = mocker.AsyncMock()
+        mock_service.bulk_delete_contacts.side_effect = DatabaseOperationError(
+            "bulk delete error"
+        )
+        mock_get_session = mocker.Mock()
+
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(
+                bulk_delete_contacts_route(
+                    mock_service, BulkDeleteContactsModel(ids=[]), mock_get_session
+                )
+            )
+
+        assert e.value.status_code == 500
+        assert e.value.detail == "bulk delete error"
+
+
+class TestBulkUpdateContactsRoute:
+    """Test class for PUT /contacts/bulk endpoint"""
+
+    def test_bulk_update_contacts_route(self, mocker):
+        """
+        Should return the found and missing ids
+        """
+        uuid = uuid4()
+        update_data = {
+            uuid: InsertContactModel(
+                name=FAKE_NAME,
+                address=FAKE_ADDRESS,
+                email=FAKE_EMAIL,
+                phone=FAKE_NUMBER,
+            )
+        }
+        fake_result = {"found": [uuid], "missing": []}
+        mock_service = mocker.AsyncMock()
+        mock_service.bulk_update_contacts.return_value = fake_result
+        mock_get_session = mocker.Mock()
+
+        response = asyncio.run(
+            bulk_update_contacts_route(mock_service, update_data, mock_get_session)
+        )
+
+        mock_service.bulk_update_contacts.assert_called_with(
+            update_data, mock_get_session
+        )
+        assert response == fake_result
+
+    def test_bulk_update_contacts_route_with_error(self, mocker):
+        """
+        Should return a HTTPException when the service raises an exception
+        """
+        mock_service = mocker.AsyncMock()
+        mock_service.bulk_update_contacts.side_effect = DatabaseOperationError(
+            "bulk update error"
+        )
+        mock_get_session = mocker.Mock()
+
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(bulk_update_contacts_route(mock_service, {}, mock_get_session))
+
+        assert e.value.status_code == 500
+        assert e.value.detail == "bulk update error"
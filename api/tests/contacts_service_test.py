@@ -1,12 +1,33 @@
 """Unit tests for contacts service"""
 
+import asyncio
+import threading
+from datetime import datetime
 from uuid import uuid4
 import pytest
 from faker import Faker
-from services.contact import ContactService
-from schemas.contact import Contact
-from models.errors import DatabaseOperationError
-from models.contact import InsertContactModel
+from sqlalchemy.exc import SQLAlchemyError
+from core.cache import contact_cache
+from core.db import TestSession
+from core.pagination import encode_cursor, decode_cursor
+from services.contact import (
+    AsyncContactService,
+    ThreadedContactService,
+    ContactService,
+    ID_CHUNK_SIZE,
+    fts_match_expression,
+    parse_fields,
+    prefix_upper_bound,
+    select_fields,
+)
+from schemas.contact import Contact, search_key
+from models.errors import (
+    DatabaseOperationError,
+    InvalidCursorError,
+    InvalidFieldsError,
+    VersionConflictError,
+)
+from models.contact import InsertContactModel, PatchContactModel
 
 FAKE_ERROR_MESSAGE = Faker().sentence()
 FAKE_NAME = Faker().name()
@@ -15,20 +36,44 @@ FAKE_NUMBER = Faker().phone_number()
 FAKE_EMAIL = Faker().email()
 
 
+def fake_result(mocker, rows: list[dict]):
+    """A result of a column select that returns rows, given as dicts"""
+
+    result = mocker.MagicMock()
+    result.keys.return_value = list(rows[0]) if rows else []
+    result.__iter__.side_effect = lambda: iter([tuple(row.values()) for row in rows])
+    return result
+
+
+def fake_row(**changes) -> dict:
+    """A contact as list queries return it, a dict of every column"""
+
+    return {
+        "id": uuid4(),
+        "name": FAKE_NAME,
+        "email": FAKE_EMAIL,
+        "phone": FAKE_NUMBER,
+        "address": FAKE_ADDRESS,
+        "created_at": datetime(2025, 1, 1),
+        **changes,
+    }
+
+
 class TestGetAllContacts:
     """Test class for get_all_contacts service"""
 
     def test_get_contacts(self, mocker):
         """
-        Should return a list of contacts when the service returns a list
+        Should return every contact as a dict of its columns, without ORM objects
         """
         service = ContactService()
-        mock_return_value = [{"id": 1, "name": "Test Contact"}]
+        rows = [fake_row(), fake_row()]
         mock_session = mocker.Mock()
-        mock_session.scalars.return_value.all.return_value = mock_return_value
+        mock_session.execute.return_value = fake_result(mocker, rows)
 
         result = service.get_all_contacts(mock_session)
-        assert result == mock_return_value
+        assert result == rows
+        mock_session.scalars.assert_not_called()
 
     def test_handle_error(self, mocker):
         """
@@ -36,7 +81,7 @@ class TestGetAllContacts:
         """
         service = ContactService()
         mock_session = mocker.Mock()
-        mock_session.scalars.side_effect = Exception(FAKE_ERROR_MESSAGE)
+        mock_session.execute.side_effect = Exception(FAKE_ERROR_MESSAGE)
 
         with pytest.raises(DatabaseOperationError) as e:
             service.get_all_contacts(mock_session)
@@ -44,6 +89,377 @@ class TestGetAllContacts:
         assert e.value.args[0] == f"Failed to get all contacts: {FAKE_ERROR_MESSAGE}"
 
 
+class TestGetChanges:
+    """Test class for get_changes service"""
+
+    def test_merge_contacts_and_tombstones(self, mocker):
+        """
+        Should interleave written contacts and deleted ids by revision up to limit
+        """
+        service = ContactService()
+        deleted_id = uuid4()
+        new, old, later = (mocker.Mock(id=uuid4()) for _ in range(3))
+        mock_session = mocker.Mock()
+        mock_session.execute.return_value.all.side_effect = [
+            [(new, 2, 2), (old, 5, 1), (later, 6, 6)],
+            [(3, deleted_id), (7, uuid4())],
+        ]
+
+        result = service.get_changes(mock_session, 1, 3)
+        assert result == {
+            "items": [new, old],
+            "created": [new.id],
+            "deleted": [deleted_id],
+            "next_since": 5,
+            "has_more": True,
+        }
+
+    def test_no_changes(self, mocker):
+        """
+        Should keep the cursor where it was when nothing changed after it
+        """
+        service = ContactService()
+        mock_session = mocker.Mock()
+        mock_session.execute.return_value.all.return_value = []
+
+        result = service.get_changes(mock_session, 9, 10)
+        assert result == {
+            "items": [],
+            "created": [],
+            "deleted": [],
+            "next_since": 9,
+            "has_more": False,
+        }
+
+    def test_handle_error(self, mocker):
+        """
+        Should throw database operation error
+        """
+        service = ContactService()
+        mock_session = mocker.Mock()
+        mock_session.execute.side_effect = Exception(FAKE_ERROR_MESSAGE)
+
+        with pytest.raises(DatabaseOperationError) as e:
+            service.get_changes(mock_session, 0, 10)
+
+        assert e.value.args[0] == f"Failed to get changes: {FAKE_ERROR_MESSAGE}"
+
+
+class TestGetContactsPage:
+    """Test class for get_contacts_page service"""
+
+    def test_get_last_page(self, mocker):
+        """
+        Should return the contacts without a next cursor when nothing is left
+        """
+        service = ContactService()
+        rows = [fake_row()]
+        mock_session = mocker.Mock()
+        mock_session.execute.return_value = fake_result(mocker, rows)
+
+        contacts, next_cursor = service.get_contacts_page(mock_session, 2)
+        assert contacts == rows
+        assert next_cursor is None
+
+    def test_get_page_with_next_cursor(self, mocker):
+        """
+        Should trim the extra row and return a cursor pointing at the last contact
+        """
+        service = ContactService()
+        rows = [
+            fake_row(created_at=datetime(2025, 1, 1, 0, 0, 3 - second))
+            for second in range(3)
+        ]
+        mock_session = mocker.Mock()
+        mock_session.execute.return_value = fake_result(mocker, rows)
+
+        contacts, next_cursor = service.get_contacts_page(mock_session, 2)
+        assert contacts == rows[:2]
+        assert decode_cursor(next_cursor) == (rows[1]["created_at"], rows[1]["id"])
+
+    def test_get_page_after_cursor(self, mocker):
+        """
+        Should filter the query by the cursor when one is given
+        """
+        service = ContactService()
+        mock_session = mocker.Mock()
+        mock_session.execute.return_value = fake_result(mocker, [])
+        cursor = encode_cursor(datetime(2025, 1, 1), uuid4())
+
+        contacts, next_cursor = service.get_contacts_page(mock_session, 2, cursor)
+        stmt = mock_session.execute.call_args.args[0]
+        assert stmt.whereclause is not None
+        assert contacts == []
+        assert next_cursor is None
+
+    def test_get_page_with_fields(self, mocker):
+        """
+        Should read only the fields and the sort key, and return dicts of the fields
+        """
+        service = ContactService()
+        rows = [
+            {
+                "name": FAKE_NAME,
+                "created_at": datetime(2025, 1, 1, 0, 0, 3 - second),
+                "id": uuid4(),
+            }
+            for second in range(3)
+        ]
+        mock_session = mocker.Mock()
+        mock_session.execute.return_value = fake_result(mocker, rows)
+
+        contacts, next_cursor = service.get_contacts_page(
+            mock_session, 2, fields=("name",)
+        )
+        stmt = mock_session.execute.call_args.args[0]
+        assert [column.name for column in stmt.selected_columns] == [
+            "name",
+            "created_at",
+            "id",
+        ]
+        assert contacts == [{"name": FAKE_NAME}, {"name": FAKE_NAME}]
+        assert decode_cursor(next_cursor) == (rows[1]["created_at"], rows[1]["id"])
+
+    def test_handle_invalid_cursor(self, mocker):
+        """
+        Should throw invalid cursor error without touching the database
+        """
+        service = ContactService()
+        mock_session = mocker.Mock()
+
+        with pytest.raises(InvalidCursorError):
+            service.get_contacts_page(mock_session, 2, "not-a-cursor")
+
+        mock_session.execute.assert_not_called()
+
+    def test_handle_error(self, mocker):
+        """
+        Should throw database operation error
+        """
+        service = ContactService()
+        mock_session = mocker.Mock()
+        mock_session.execute.side_effect = Exception(FAKE_ERROR_MESSAGE)
+
+        with pytest.raises(DatabaseOperationError) as e:
+            service.get_contacts_page(mock_session, 2)
+
+        assert e.value.args[0] == f"Failed to get contacts page: {FAKE_ERROR_MESSAGE}"
+
+
+class TestParseFields:
+    """Test class for parse_fields and select_fields"""
+
+    def test_parse_fields(self):
+        """
+        Should return the selected columns once each, in column order
+        """
+        assert parse_fields(None) is None
+        assert parse_fields(" id,name ,id,") == ("name", "id")
+
+    def test_parse_invalid_fields(self):
+        """
+        Should throw invalid fields error for unknown or no fields
+        """
+        for fields in ("name,password", ",", ""):
+            with pytest.raises(InvalidFieldsError):
+                parse_fields(fields)
+
+    def test_select_fields(self):
+        """
+        Should select every column without fields, and add the keys otherwise
+        """
+        assert [c.name for c in select_fields(None).selected_columns] == [
+            c.name
+            for c in Contact.__table__.columns
+            if c.name not in Contact.__mapper__.exclude_properties
+        ]
+        stmt = select_fields(("id", "email"), "created_at", "id")
+        assert [column.name for column in stmt.selected_columns] == [
+            "id",
+            "email",
+            "created_at",
+        ]
+
+
+class TestIterContacts:
+    """Test class for iter_contacts service"""
+
+    def test_iter_contacts(self, mocker):
+        """
+        Should yield the contacts chunk by chunk, as dicts of their columns
+        """
+        service = ContactService()
+        rows = [fake_row(), fake_row(), fake_row()]
+        mock_session = mocker.Mock()
+        mock_session.execute.return_value.keys.return_value = list(rows[0])
+        mock_session.execute.return_value.partitions.return_value = iter(
+            [[tuple(row.values()) for row in rows[:2]], [tuple(rows[2].values())]]
+        )
+
+        result = list(service.iter_contacts(mock_session, chunk_size=2))
+        stmt = mock_session.execute.call_args.args[0]
+        assert stmt.get_execution_options()["yield_per"] == 2
+        assert result == [rows[:2], rows[2:]]
+
+    def test_handle_error(self, mocker):
+        """
+        Should throw database operation error
+        """
+        service = ContactService()
+        mock_session = mocker.Mock()
+        mock_session.execute.side_effect = Exception(FAKE_ERROR_MESSAGE)
+
+        with pytest.raises(DatabaseOperationError) as e:
+            list(service.iter_contacts(mock_session))
+
+        assert e.value.args[0] == f"Failed to export contacts: {FAKE_ERROR_MESSAGE}"
+
+
+class TestSearchContacts:
+    """Test class for search_contacts service"""
+
+    def test_match_expression(self):
+        """
+        Should quote every word as a prefix query and drop FTS5 syntax
+        """
+        assert fts_match_expression('Jo "Smith" OR*') == '"jo"* "smith"* "or"*'
+        assert fts_match_expression("  -- ") is None
+
+    def test_search_contacts(self, mocker):
+        """
+        Should return the matches and the offset of the next page
+        """
+        service = ContactService()
+        rows = [fake_row(), fake_row(), fake_row()]
+        mock_session = mocker.Mock()
+        mock_session.execute.return_value = fake_result(mocker, rows)
+
+        contacts, next_offset = service.search_contacts("jo", mock_session, 2, 4)
+        assert contacts == rows[:2]
+        assert next_offset == 6
+
+    def test_search_last_page(self, mocker):
+        """
+        Should not return a next offset when there are no more matches
+        """
+        service = ContactService()
+        rows = [fake_row()]
+        mock_session = mocker.Mock()
+        mock_session.execute.return_value = fake_result(mocker, rows)
+
+        contacts, next_offset = service.search_contacts("jo", mock_session, 2)
+        assert contacts == rows
+        assert next_offset is None
+
+    def test_search_without_words(self, mocker):
+        """
+        Should not query the database when the query has no words
+        """
+        service = ContactService()
+        mock_session = mocker.Mock()
+
+        assert service.search_contacts("*", mock_session, 2) == ([], None)
+        mock_session.execute.assert_not_called()
+
+    def test_handle_error(self, mocker):
+        """
+        Should throw database operation error
+        """
+        service = ContactService()
+        mock_session = mocker.Mock()
+        mock_session.execute.side_effect = Exception(FAKE_ERROR_MESSAGE)
+
+        with pytest.raises(DatabaseOperationError) as e:
+            service.search_contacts("jo", mock_session, 2)
+
+        assert e.value.args[0] == f"Failed to search contacts: {FAKE_ERROR_MESSAGE}"
+
+
+class TestAutocompleteContacts:
+    """Test class for autocomplete_contacts service"""
+
+    def test_prefix_upper_bound(self):
+        """
+        Should return the first string after every string with the prefix
+        """
+        assert prefix_upper_bound("jo") == "jp"
+        assert "joz" < prefix_upper_bound("jo") <= "jp"
+
+    def test_prefix_upper_bound_last_code_point(self):
+        """
+        Should bump the character before trailing U+10FFFF, and return None
+        when nothing sorts after the prefix
+        """
+        top = chr(0x10FFFF)
+        assert prefix_upper_bound(f"jo{top}") == "jp"
+        assert prefix_upper_bound(f"jo{top}{top}") == "jp"
+        assert prefix_upper_bound(top) is None
+        assert prefix_upper_bound(chr(0xD7FF)) == chr(0xE000)
+
+    def test_search_key(self):
+        """
+        Should fold case beyond ASCII, so any spelling of a prefix finds the key
+        """
+        assert search_key("ÉMILE") == search_key("émile") == "émile"
+        assert search_key("Straße") == search_key("STRASSE")
+        assert search_key("Ｊｏ") == "jo"
+
+    def test_autocomplete_contacts(self, mocker):
+        """
+        Should put name matches first and not repeat a contact matched twice
+        """
+        service = ContactService()
+        first, second = uuid4(), uuid4()
+        mock_session = mocker.Mock()
+        mock_session.execute.return_value.mappings.side_effect = [
+            [{"id": first, "name": "Jo", "email": "jo@gov.uk"}],
+            [
+                {"id": second, "name": "Ann", "email": "jo.ann@gov.uk"},
+                {"id": first, "name": "Jo", "email": "jo@gov.uk"},
+            ],
+        ]
+
+        result = service.autocomplete_contacts(" JO ", mock_session, 10)
+        assert [contact["id"] for contact in result] == [first, second]
+
+    def test_autocomplete_blank_prefix(self, mocker):
+        """
+        Should not query the database for a blank prefix
+        """
+        service = ContactService()
+        mock_session = mocker.Mock()
+
+        assert service.autocomplete_contacts("  ", mock_session) == []
+        mock_session.execute.assert_not_called()
+
+    def test_autocomplete_without_upper_bound(self, mocker):
+        """
+        Should only bound the range from below when nothing sorts after the prefix
+        """
+        service = ContactService()
+        mock_session = mocker.Mock()
+        mock_session.execute.return_value.mappings.return_value = []
+
+        assert service.autocomplete_contacts(chr(0x10FFFF), mock_session) == []
+        stmt = mock_session.execute.call_args.args[0]
+        assert "<" not in str(stmt.whereclause).replace("<=", "")
+
+    def test_handle_error(self, mocker):
+        """
+        Should throw database operation error
+        """
+        service = ContactService()
+        mock_session = mocker.Mock()
+        mock_session.execute.side_effect = Exception(FAKE_ERROR_MESSAGE)
+
+        with pytest.raises(DatabaseOperationError) as e:
+            service.autocomplete_contacts("jo", mock_session)
+
+        assert (
+            e.value.args[0] == f"Failed to autocomplete contacts: {FAKE_ERROR_MESSAGE}"
+        )
+
+
 class TestGetContactById:
     """Test class for get_contact_by_id service"""
 
@@ -63,7 +479,49 @@ class TestGetContactById:
         mock_session.scalars.return_value.one_or_none.return_value = fake_contact
 
         result = service.get_contact_by_id(1, mock_session)
-        assert result == fake_contact.__dict__
+        assert result == {
+            key: value
+            for key, value in fake_contact.__dict__.items()
+            if key != "_sa_instance_state"
+        }
+
+    def test_serve_cached_contact(self, mocker):
+        """Should serve repeated reads from the cache until the contact is updated"""
+
+        contact_id = uuid4()
+        fake_contact = Contact(
+            id=contact_id,
+            name=FAKE_NAME,
+            address=FAKE_ADDRESS,
+            email=FAKE_EMAIL,
+            phone=FAKE_NUMBER,
+        )
+        service = ContactService()
+        mock_session = mocker.Mock()
+        mock_session.scalars.return_value.one_or_none.return_value = fake_contact
+
+        first = service.get_contact_by_id(contact_id, mock_session)
+        first["name"] = "changed by the caller"
+        second = service.get_contact_by_id(contact_id, mock_session)
+
+        mock_session.scalars.assert_called_once()
+        assert second["name"] == FAKE_NAME
+        assert contact_cache.stats()["hits"] == 1
+
+        service.update_contact(
+            contact_id,
+            InsertContactModel(
+                name=FAKE_NAME,
+                address=FAKE_ADDRESS,
+                email=FAKE_EMAIL,
+                phone=FAKE_NUMBER,
+            ),
+            mock_session,
+        )
+        service.get_contact_by_id(contact_id, mock_session)
+
+        assert mock_session.scalars.call_count == 3
+        assert contact_cache.stats()["misses"] == 2
 
     def test_handle_db_error(self, mocker):
         """Should throw database operation error"""
@@ -108,9 +566,10 @@ class TestCreateContact:
 
         mock_session.add.assert_called_once()
         mock_session.commit.assert_called_once()
-        mock_session.flush.assert_called_once()
-        assert result.name == new_data.name
-        assert result.address == new_data.address
+        mock_session.refresh.assert_called_once()
+        assert result["name"] == new_data.name
+        assert result["address"] == new_data.address
+        assert "_sa_instance_state" not in result
 
     def test_handle_db_error(self, mocker):
         """
@@ -130,11 +589,114 @@ class TestCreateContact:
             service.create_contact(new_data, mock_session)
 
         mock_session.add.assert_called_once()
-        mock_session.flush.assert_not_called()
+        mock_session.refresh.assert_not_called()
         mock_session.rollback.assert_called_once()
         assert e.value.args[0] == f"Failed to create new contact: {FAKE_ERROR_MESSAGE}"
 
 
+class TestBulkCreateContacts:
+    """Test class for bulk_create_contacts service"""
+
+    @staticmethod
+    def new_contacts(count):
+        """Helper to build a list of insert contact models"""
+        return [
+            InsertContactModel(
+                name=FAKE_NAME,
+                address=FAKE_ADDRESS,
+                email=FAKE_EMAIL,
+                phone=FAKE_NUMBER,
+            )
+            for _ in range(count)
+        ]
+
+    @staticmethod
+    def mock_session(mocker):
+        """Helper to build a session whose savepoints re-raise errors"""
+        mock_session = mocker.MagicMock()
+        mock_session.begin_nested.return_value.__exit__.return_value = False
+        return mock_session
+
+    def test_bulk_create_contacts(self, mocker):
+        """
+        Should insert the contacts chunk by chunk and commit once
+        """
+        service = ContactService()
+        mock_session = self.mock_session(mocker)
+
+        result = service.bulk_create_contacts(
+            self.new_contacts(5), mock_session, chunk_size=2
+        )
+
+        chunk_sizes = [len(c.args[1]) for c in mock_session.execute.call_args_list]
+        assert chunk_sizes == [2, 2, 1]
+        mock_session.commit.assert_called_once()
+        mock_session.rollback.assert_not_called()
+        assert result["created"] == 5
+        assert len(set(result["ids"])) == 5
+        assert result["errors"] == []
+        assert result["rows_per_second"] >= 0
+
+    def test_report_failed_items(self, mocker):
+        """
+        Should retry a failing chunk row by row and report only the failed item
+        """
+        service = ContactService()
+        mock_session = self.mock_session(mocker)
+
+        def execute(_stmt, rows):
+            if len(rows) > 1 or rows[0]["name"] == "bad":
+                raise SQLAlchemyError(FAKE_ERROR_MESSAGE)
+
+        mock_session.execute.side_effect = execute
+        new_contacts = self.new_contacts(3)
+        new_contacts[1].name = "bad"
+
+        result = service.bulk_create_contacts(new_contacts, mock_session)
+
+        mock_session.commit.assert_called_once()
+        assert result["created"] == 2
+        assert result["errors"] == [{"index": 1, "detail": FAKE_ERROR_MESSAGE}]
+
+    def test_report_invalid_items(self, mocker):
+        """
+        Should validate each item on its own, reporting the invalid ones by index
+        """
+        service = ContactService()
+        mock_session = self.mock_session(mocker)
+        new_contacts = [contact.model_dump() for contact in self.new_contacts(3)]
+        new_contacts[1] = {"name": "bad"}
+
+        result = service.bulk_create_contacts(new_contacts, mock_session)
+
+        inserted = mock_session.execute.call_args.args[1]
+        assert [row["name"] for row in inserted] == [FAKE_NAME, FAKE_NAME]
+        assert result["created"] == 2
+        assert result["errors"] == [
+            {
+                "index": 1,
+                "detail": "email: Field required; phone: Field required; "
+                "address: Field required",
+            }
+        ]
+
+    def test_handle_db_error(self, mocker):
+        """
+        Should throw database operation error and roll back the whole batch
+        """
+        service = ContactService()
+        mock_session = self.mock_session(mocker)
+        mock_session.commit.side_effect = Exception(FAKE_ERROR_MESSAGE)
+
+        with pytest.raises(DatabaseOperationError) as e:
+            service.bulk_create_contacts(self.new_contacts(2), mock_session)
+
+        mock_session.rollback.assert_called_once()
+        assert (
+            e.value.args[0] == f"Failed to bulk create contacts: {FAKE_ERROR_MESSAGE}"
+        )
+
+
 class TestDeleteService:
     """Test class for delete_contact service"""
 
@@ -194,6 +756,22 @@ class TestDeleteService:
         mock_session.rollback.assert_not_called()
         assert response is None
 
+    def test_version_conflict(self, mocker):
+        """
+        Should raise a version conflict error when the contact is at another version
+        """
+        service = ContactService()
+        fake_contact_id = uuid4()
+        mock_session = mocker.Mock()
+        mock_session.scalars.return_value.one_or_none.side_effect = [None, 5]
+
+        with pytest.raises(VersionConflictError):
+            service.delete_contact(fake_contact_id, mock_session, [4])
+
+        stmt = str(mock_session.scalars.call_args_list[0].kwargs["statement"])
+        assert "contacts.version IN" in stmt
+        mock_session.commit.assert_not_called()
+
 
 class TestUpdateContact:
     """Test class for update_contact service"""
@@ -252,6 +830,63 @@ class TestUpdateContact:
         mock_session.rollback.assert_called_once()
         assert e.value.args[0] == f"Failed to update contact: {FAKE_ERROR_MESSAGE}"
 
+    def test_patch_contact(self, mocker):
+        """Should only write the fields set on a patch, and bump the version"""
+        service = ContactService()
+        fake_contact_id = uuid4()
+        mock_session = mocker.Mock()
+        mock_session.scalars.return_value.one_or_none.return_value = Contact(
+            id=fake_contact_id,
+            address=FAKE_ADDRESS,
+            email=FAKE_EMAIL,
+            name=FAKE_NAME,
+            phone=FAKE_NUMBER,
+        )
+
+        service.update_contact(
+            fake_contact_id, PatchContactModel(phone=FAKE_NUMBER), mock_session
+        )
+
+        stmt = mock_session.scalars.call_args.kwargs["statement"]
+        assert set(stmt.compile().params) == {"phone", "version_1", "id_1"}
+        mock_session.commit.assert_called_once()
+
+    def test_version_conflict(self, mocker):
+        """
+        Should update in one statement guarded by the version and raise a version
+        conflict error only when the contact exists at another version
+        """
+        service = ContactService()
+        fake_contact_id = uuid4()
+        fake_insert_contact = InsertContactModel(
+            address=FAKE_ADDRESS,
+            email=FAKE_EMAIL,
+            name=FAKE_NAME,
+            phone=FAKE_NUMBER,
+        )
+        mock_session = mocker.Mock()
+        mock_session.scalars.return_value.one_or_none.side_effect = [
+            None,
+            3,
+            None,
+            None,
+        ]
+
+        with pytest.raises(VersionConflictError) as e:
+            service.update_contact(
+                fake_contact_id, fake_insert_contact, mock_session, [2]
+            )
+        missing = service.update_contact(
+            fake_contact_id, fake_insert_contact, mock_session, [2]
+        )
+
+        stmt = str(mock_session.scalars.call_args_list[0].kwargs["statement"])
+        assert "version=(contacts.version + " in stmt
+        assert "contacts.version IN" in stmt
+        assert e.value.args[0] == f"record with id {fake_contact_id} is at version 3"
+        assert missing is None
+        mock_session.commit.assert_not_called()
+
     def test_handle_contact_not_found(self, mocker):
         """Should throw database not found error"""
         service = ContactService()
@@ -274,3 +909,244 @@ class TestUpdateContact:
         mock_session.rollback.assert_not_called()
         mock_session.commit.assert_not_called()
         assert response is None
+
+
+class TestBulkDeleteContacts:
+    """Test class for bulk_delete_contacts service"""
+
+    def test_bulk_delete_contacts(self, mocker):
+        """
+        Should delete the contacts with one statement and split found and missing ids
+        """
+        service = ContactService()
+        found_id, missing_id = uuid4(), uuid4()
+        mock_session = mocker.Mock()
+        mock_session.scalars.return_value.all.return_value = [found_id]
+
+        result = service.bulk_delete_contacts(
+            [found_id, missing_id, found_id], mock_session
+        )
+
+        mock_session.scalars.assert_called_once()
+        mock_session.commit.assert_called_once()
+        assert result == {"found": [found_id], "missing": [missing_id]}
+
+    def test_delete_in_chunks(self, mocker):
+        """
+        Should split a long list of ids into several statements
+        """
+        service = ContactService()
+        contact_ids = [uuid4() for _ in range(ID_CHUNK_SIZE + 1)]
+        mock_session = mocker.Mock()
+        mock_session.scalars.return_value.all.return_value = []
+
+        result = service.bulk_delete_contacts(contact_ids, mock_session)
+
+        assert mock_session.scalars.call_count == 2
+        assert result["missing"] == contact_ids
+
+    def test_handle_db_error(self, mocker):
+        """
+        Should throw database operation error
+        """
+        service = ContactService()
+        mock_session = mocker.Mock()
+        mock_session.scalars.side_effect = Exception(FAKE_ERROR_MESSAGE)
+
+        with pytest.raises(DatabaseOperationError) as e:
+            service.bulk_delete_contacts([uuid4()], mock_session)
+
+        mock_session.rollback.assert_called_once()
+        assert (
+            e.value.args[0] == f"Failed to bulk delete contacts: {FAKE_ERROR_MESSAGE}"
+        )
+
+
+class TestBulkUpdateContacts:
+    """Test class for bulk_update_contacts service"""
+
+    def test_bulk_update_contacts(self, mocker):
+        """
+        Should write every contact of a chunk with one UPDATE ... FROM (VALUES ...)
+        RETURNING, without reading first
+        """
+        service = ContactService()
+        found_id, missing_id = uuid4(), uuid4()
+        update_data = InsertContactModel(
+            name=FAKE_NAME,
+            address=FAKE_ADDRESS,
+            email=FAKE_EMAIL,
+            phone=FAKE_NUMBER,
+        )
+        mock_session = mocker.Mock()
+        mock_session.execute.return_value.scalars.return_value.all.return_value = [
+            found_id
+        ]
+
+        result = service.bulk_update_contacts(
+            {found_id: update_data, missing_id: update_data}, mock_session
+        )
+
+        mock_session.execute.assert_called_once()
+        stmt = mock_session.execute.call_args.args[0]
+        params = stmt.compile().params
+        assert params["id_0"] == found_id
+        assert params["id_1"] == missing_id
+        assert params["name_key_1"] == FAKE_NAME.casefold()
+        assert params["email_key_1"] == FAKE_EMAIL.casefold()
+        assert "FROM (VALUES (" in str(stmt)
+        assert "version=(contacts.version + " in str(stmt)
+        assert "RETURNING contacts.id" in str(stmt)
+        mock_session.scalars.assert_not_called()
+        mock_session.commit.assert_called_once()
+        assert result == {"found": [found_id], "missing": [missing_id]}
+
+    def test_bulk_update_contacts_in_chunks(self, mocker):
+        """
+        Should send one statement per chunk of ids
+        """
+        service = ContactService()
+        update_data = InsertContactModel(
+            name=FAKE_NAME,
+            address=FAKE_ADDRESS,
+            email=FAKE_EMAIL,
+            phone=FAKE_NUMBER,
+        )
+        updates = {uuid4(): update_data for _ in range(ID_CHUNK_SIZE + 1)}
+        mock_session = mocker.Mock()
+        mock_session.execute.return_value.scalars.return_value.all.side_effect = [
+            list(updates)[:ID_CHUNK_SIZE],
+            list(updates)[ID_CHUNK_SIZE:],
+        ]
+
+        result = service.bulk_update_contacts(updates, mock_session)
+
+        assert mock_session.execute.call_count == 2
+        assert result == {"found": list(updates), "missing": []}
+
+    def test_handle_db_error(self, mocker):
+        """
+        Should throw database operation error
+        """
+        service = ContactService()
+        mock_session = mocker.Mock()
+        mock_session.execute.side_effect = Exception(FAKE_ERROR_MESSAGE)
+        update_data = InsertContactModel(
+            name=FAKE_NAME,
+            address=FAKE_ADDRESS,
+            email=FAKE_EMAIL,
+            phone=FAKE_NUMBER,
+        )
+
+        with pytest.raises(DatabaseOperationError) as e:
+            service.bulk_update_contacts({uuid4(): update_data}, mock_session)
+
+        mock_session.rollback.assert_called_once()
+        assert (
+            e.value.args[0] == f"Failed to bulk update contacts: {FAKE_ERROR_MESSAGE}"
+        )
+
+
+class TestAsyncContactService:
+    """Test class for AsyncContactService"""
+
+    @pytest.fixture
+    def sessions(self, mocker):
+        """An async session whose run_sync calls through with a sync session"""
+
+        sync_session = mocker.Mock()
+        async_session = mocker.Mock()
+        async_session.run_sync = mocker.AsyncMock(
+            side_effect=lambda fn, *args: fn(sync_session, *args)
+        )
+        return async_session, sync_session
+
+    def test_delegate_to_sync_service(self, mocker, sessions):
+        """
+        Should run the sync service method with the sync session through run_sync
+        """
+        async_session, sync_session = sessions
+        service = AsyncContactService()
+        service.service = mocker.Mock()
+        service.service.get_contacts_page.return_value = (["contact"], "next")
+        service.service.search_contacts.return_value = (["contact"], None)
+
+        page = asyncio.run(service.get_contacts_page(async_session, 10, "cursor"))
+        found = asyncio.run(service.search_contacts("jo", async_session, 5, 20))
+
+        service.service.get_contacts_page.assert_called_with(
+            sync_session, 10, "cursor", None
+        )
+        service.service.search_contacts.assert_called_with("jo", sync_session, 5, 20)
+        assert page == (["contact"], "next")
+        assert found == (["contact"], None)
+        assert async_session.run_sync.await_count == 2
+
+    def test_handle_db_error(self, mocker, sessions):
+        """
+        Should raise the database operation error of the sync service
+        """
+        async_session, sync_session = sessions
+        sync_session.scalars.side_effect = Exception(FAKE_ERROR_MESSAGE)
+        service = AsyncContactService()
+
+        with pytest.raises(DatabaseOperationError) as e:
+            asyncio.run(service.delete_contact(uuid4(), async_session))
+
+        sync_session.rollback.assert_called_once()
+        assert e.value.args[0] == f"Failed to delete a contact: {FAKE_ERROR_MESSAGE}"
+
+
+class TestThreadedContactService:
+    """Test class for ThreadedContactService"""
+
+    def test_delegate_to_sync_service(self, mocker):
+        """
+        Should run the sync service method with the session off the event loop
+        """
+        session = mocker.Mock()
+        service = ThreadedContactService()
+        service.service = mocker.Mock()
+        threads = []
+
+        def search_contacts(*_args):
+            threads.append(threading.get_ident())
+            return (["contact"], None)
+
+        service.service.search_contacts.side_effect = search_contacts
+
+        found = asyncio.run(service.search_contacts("jo", session, 5, 20))
+
+        service.service.search_contacts.assert_called_with("jo", session, 5, 20)
+        assert found == (["contact"], None)
+        assert threads != [threading.get_ident()]
+
+    def test_close(self, mocker):
+        """
+        Should close the sync session
+        """
+        session = mocker.Mock()
+
+        asyncio.run(ThreadedContactService().close(session))
+
+        session.close.assert_called_once()
+
+    def test_create_contact_after_release(self):
+        """
+        Should return a contact that can be read once the session is closed
+        """
+        new_data = InsertContactModel(
+            name=FAKE_NAME,
+            address=FAKE_ADDRESS,
+            email=FAKE_EMAIL,
+            phone=FAKE_NUMBER,
+        )
+
+        with TestSession() as session:
+            created = asyncio.run(
+                ThreadedContactService().create_contact(new_data, session)
+            )
+
+        assert created["name"] == FAKE_NAME
+        assert created["version"] == 1
+        assert created["created_at"] is not None
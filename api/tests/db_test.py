@@ -0,0 +1,145 @@
+"""Unit tests for the database engine profile"""
+
+import asyncio
+import pytest
+from sqlalchemy import text
+from core.db import EngineProfile, create_async_profile_engine, create_profile_engine
+
+
+class TestEngineProfile:
+    """Test class for EngineProfile"""
+
+    def test_defaults(self, monkeypatch):
+        """Should use the tuned defaults when no environment variable is set"""
+
+        for name in (
+            "DATABASE_URL",
+            "DB_ECHO",
+            "DB_JOURNAL_MODE",
+            "DB_POOL_SIZE",
+            "DB_ASYNC",
+        ):
+            monkeypatch.delenv(name, raising=False)
+
+        profile = EngineProfile.from_env()
+        assert profile == EngineProfile()
+        assert profile.echo is False
+        assert profile.pragmas["journal_mode"] == "WAL"
+        assert profile.pragmas["synchronous"] == "NORMAL"
+        assert profile.async_sessions is False
+
+    def test_from_env(self, monkeypatch):
+        """Should read every setting from the environment"""
+
+        monkeypatch.setenv("DATABASE_URL", "sqlite:///other.sqlite3")
+        monkeypatch.setenv("DB_ECHO", "true")
+        monkeypatch.setenv("DB_JOURNAL_MODE", "delete")
+        monkeypatch.setenv("DB_SYNCHRONOUS", "full")
+        monkeypatch.setenv("DB_MMAP_SIZE", "0")
+        monkeypatch.setenv("DB_CACHE_SIZE", "-2000")
+        monkeypatch.setenv("DB_BUSY_TIMEOUT", "100")
+        monkeypatch.setenv("DB_POOL_SIZE", "3")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "1")
+        monkeypatch.setenv("DB_POOL_TIMEOUT", "2.5")
+        monkeypatch.setenv("DB_ASYNC", "true")
+
+        assert EngineProfile.from_env() == EngineProfile(
+            url="sqlite:///other.sqlite3",
+            echo=True,
+            journal_mode="delete",
+            synchronous="full",
+            mmap_size=0,
+            cache_size=-2000,
+            busy_timeout=100,
+            pool_size=3,
+            max_overflow=1,
+            pool_timeout=2.5,
+            async_sessions=True,
+        )
+
+    def test_reject_unknown_modes(self):
+        """Should refuse journal and synchronous modes SQLite does not know"""
+
+        with pytest.raises(ValueError):
+            EngineProfile(journal_mode="fast")
+        with pytest.raises(ValueError):
+            EngineProfile(synchronous="sometimes")
+
+    def test_async_url(self):
+        """Should swap SQLite onto aiosqlite and leave other drivers alone"""
+
+        assert (
+            EngineProfile(url="sqlite:///db.sqlite3").async_url.render_as_string()
+            == "sqlite+aiosqlite:///db.sqlite3"
+        )
+        assert (
+            EngineProfile(url="sqlite+aiosqlite:///a.db").async_url.drivername
+            == "sqlite+aiosqlite"
+        )
+        assert (
+            EngineProfile(url="postgresql+asyncpg://u@h/db").async_url.drivername
+            == "postgresql+asyncpg"
+        )
+
+
+class TestCreateProfileEngine:
+    """Test class for create_profile_engine"""
+
+    def test_apply_pragmas_and_pool_size(self, tmp_path):
+        """Should size the pool and run the pragmas on every new connection"""
+
+        profile = EngineProfile(
+            url=f"sqlite:///{tmp_path / 'profile.sqlite3'}",
+            busy_timeout=1234,
+            cache_size=-4096,
+            mmap_size=1024 * 1024,
+            pool_size=2,
+            max_overflow=3,
+        )
+        engine = create_profile_engine(profile)
+
+        with engine.connect() as conn:
+
+            def pragma(name):
+                return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+            assert pragma("journal_mode") == "wal"
+            assert pragma("synchronous") == 1  # NORMAL
+            assert pragma("busy_timeout") == 1234
+            assert pragma("cache_size") == -4096
+            assert pragma("mmap_size") == 1024 * 1024
+
+        assert engine.echo is False
+        assert engine.pool.size() == 2
+        assert engine.pool._max_overflow == 3  # pylint: disable=protected-access
+        engine.dispose()
+
+
+class TestCreateAsyncProfileEngine:
+    """Test class for create_async_profile_engine"""
+
+    def test_apply_pragmas_and_pool_size(self, tmp_path):
+        """Should size the pool and run the pragmas on every new async connection"""
+
+        profile = EngineProfile(
+            url=f"sqlite:///{tmp_path / 'profile.sqlite3'}",
+            busy_timeout=1234,
+            pool_size=2,
+            max_overflow=3,
+        )
+        engine = create_async_profile_engine(profile)
+
+        async def pragmas():
+            async with engine.connect() as conn:
+                journal_mode = (
+                    await conn.execute(text("PRAGMA journal_mode"))
+                ).scalar()
+                busy_timeout = (
+                    await conn.execute(text("PRAGMA busy_timeout"))
+                ).scalar()
+            await engine.dispose()
+            return journal_mode, busy_timeout
+
+        assert asyncio.run(pragmas()) == ("wal", 1234)
+        assert engine.dialect.driver == "aiosqlite"
+        assert engine.pool.size() == 2
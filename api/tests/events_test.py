@@ -0,0 +1,71 @@
+"""Unit tests for contact change notifications"""
+
+import asyncio
+import threading
+from core.events import ChangeNotifier, format_sse
+
+
+class TestChangeNotifier:
+    """Test class for ChangeNotifier"""
+
+    def test_wake_subscribers_from_another_thread(self):
+        """Should set every subscribed event when a write on any thread notifies"""
+
+        notifier = ChangeNotifier()
+
+        async def scenario():
+            first = notifier.subscribe()
+            second = notifier.subscribe()
+            writer = threading.Thread(target=notifier.notify)
+            writer.start()
+            writer.join()
+            await asyncio.wait_for(first.wait(), 1)
+            await asyncio.wait_for(second.wait(), 1)
+
+        asyncio.run(scenario())
+
+    def test_unsubscribe(self):
+        """Should no longer wake an unsubscribed event"""
+
+        notifier = ChangeNotifier()
+
+        async def scenario():
+            wake = notifier.subscribe()
+            notifier.unsubscribe(wake)
+            notifier.notify()
+            await asyncio.sleep(0)
+            return wake.is_set()
+
+        assert asyncio.run(scenario()) is False
+        assert len(notifier) == 0
+
+    def test_drop_subscribers_of_closed_loops(self):
+        """Should drop a subscriber whose event loop has closed instead of failing"""
+
+        notifier = ChangeNotifier()
+
+        async def scenario():
+            notifier.subscribe()
+
+        asyncio.run(scenario())
+        notifier.notify()
+        assert len(notifier) == 0
+
+
+class TestFormatSSE:
+    """Test class for format_sse"""
+
+    def test_format_json_event(self):
+        """Should serialise data as JSON with the event name and optional id"""
+
+        assert format_sse("deleted", {"id": "a"}, 7) == (
+            'id: 7\nevent: deleted\ndata: {"id":"a"}\n\n'
+        )
+        assert format_sse("created", "{}") == "event: created\ndata: {}\n\n"
+
+    def test_format_multiline_data(self):
+        """Should send every line of the data in its own data field"""
+
+        assert format_sse("card", "<div>\n</div>") == (
+            "event: card\ndata: <div>\ndata: </div>\n\n"
+        )
@@ -0,0 +1,48 @@
+"""Unit tests for serialising contact responses"""
+
+import json
+from datetime import datetime
+from uuid import uuid4
+from models.contact import ContactPageModel
+from core.responses import dump_contact, dump_rows
+
+CONTACT = {
+    "id": uuid4(),
+    "name": "John Doe",
+    "email": "john@example.com",
+    "phone": "07123456789",
+    "address": "1 Test Street",
+    "version": 1,
+}
+
+
+def test_dump_contact():
+    """Should serialise a contact as its response model would"""
+
+    body = json.loads(dump_contact(CONTACT))
+
+    assert body == {
+        **CONTACT,
+        "id": str(CONTACT["id"]),
+        "created_at": None,
+        "updated_at": None,
+    }
+
+
+def test_dump_contact_fields():
+    """Should serialise only the given fields of a contact"""
+
+    assert json.loads(dump_contact(CONTACT, ("id", "name"))) == {
+        "id": str(CONTACT["id"]),
+        "name": "John Doe",
+    }
+
+
+def test_dump_rows():
+    """Should serialise a page of rows in the shape of ContactPageModel"""
+
+    row = {**CONTACT, "created_at": datetime(2025, 1, 1), "updated_at": None}
+    body = dump_rows({"items": [row], "next_cursor": "cursor"})
+    expected = ContactPageModel(items=[row], next_cursor="cursor")
+
+    assert json.loads(body) == json.loads(expected.model_dump_json())
@@ -0,0 +1,115 @@
+"""
+Latency and throughput of rendering the index page: the sync view with a
+connection per backend call, the sync view on the pooled keep-alive session in
+web/utils/data.py, and the async view on the async client. Needs the backend
+running at backend_url; run from the frontend directory:
+
+    python -m benchmarks.index_page_bench --requests 200 --concurrency 8
+
+The views are called in process, so the times are those of the view and its
+backend calls, without a browser, middleware or the frontend server. Sync views
+get a thread per concurrent user, as a threaded WSGI server would give them;
+async views all share one event loop, as under ASGI.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import threading
+import time
+import django
+import requests
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+# pylint: disable=wrong-import-position
+from django.test import RequestFactory
+from django.test.utils import setup_test_environment
+from web import views
+from web.utils import data
+
+factory = RequestFactory()
+
+
+def fresh_session() -> requests.Session:
+    """A session of its own per call, as module-level requests.get gives"""
+
+    return requests.Session()
+
+
+def run_sync(view, total: int, concurrency: int) -> list[float]:
+    """Render the index page from concurrency threads, timing each render in ms"""
+
+    latencies = []
+    lock = threading.Lock()
+
+    def render():
+        for _ in range(total // concurrency):
+            start = time.perf_counter()
+            response = view(factory.get("/"))
+            elapsed = (time.perf_counter() - start) * 1000
+            assert response.status_code == 200
+            with lock:
+                latencies.append(elapsed)
+
+    workers = [threading.Thread(target=render) for _ in range(concurrency)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return latencies
+
+
+def run_async(view, total: int, concurrency: int) -> list[float]:
+    """Render the index page from concurrency tasks, timing each render in ms"""
+
+    latencies = []
+
+    async def render():
+        for _ in range(total // concurrency):
+            start = time.perf_counter()
+            response = await view(factory.get("/"))
+            latencies.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200
+
+    async def main():
+        await asyncio.gather(*(render() for _ in range(concurrency)))
+
+    asyncio.run(main())
+    return latencies
+
+
+def main():
+    """Compare the index page latency of each way of calling the backend"""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    pooled_session = data.get_session
+    scenarios = (
+        ("connection per call", fresh_session, run_sync, views.IndexView),
+        ("pooled keep-alive", pooled_session, run_sync, views.IndexView),
+        ("async client", pooled_session, run_async, views.AsyncIndexView),
+    )
+    for name, get_session, run, view_class in scenarios:
+        data.get_session = get_session
+        view = view_class.as_view()
+        run(view, 5, 1)  # warm up templates and the pool
+        start = time.perf_counter()
+        latencies = sorted(run(view, args.requests, args.concurrency))
+        throughput = len(latencies) / (time.perf_counter() - start)
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(
+            f"{name:>20}: mean {statistics.mean(latencies):7.2f} ms "
+            f"p50 {statistics.median(latencies):7.2f} ms p95 {p95:7.2f} ms "
+            f"{throughput:6.1f} pages/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
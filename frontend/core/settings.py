@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -44,6 +45,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # before anything that reads or writes the response body
+    "web.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -53,6 +56,19 @@ MIDDLEWARE = [
     "django_htmx.middleware.HtmxMiddleware",
 ]
 
+# Responses smaller than this many bytes are sent uncompressed, and these content
+# types never are: an event stream must reach the browser one event at a time
+COMPRESSION_MINIMUM_SIZE = 500
+COMPRESSION_EXCLUDED_TYPES = ("text/event-stream",)
+
+# Serve the async views, which await the backend instead of blocking a worker
+# thread on it. core/asgi.py turns them on, as they only pay off under ASGI
+ASYNC_VIEWS = os.getenv("async_views", "false").lower() == "true"
+
+# Seconds between the index page's polls for contact changes, when the sync
+# views are served. The async views stream them instead
+CONTACTS_POLL_SECONDS = int(os.getenv("contacts_poll_seconds", "5"))
+
 ROOT_URLCONF = "core.urls"
 
 TEMPLATES = [
@@ -84,6 +100,18 @@ DATABASES = {
     }
 }
 
+# Holds the contact list between requests. The default is local to each process;
+# cache_backend can name a shared one, e.g. the file based cache with
+# cache_location set to a directory, so every worker sees the same list
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "cache_backend", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("cache_location", "contact-book"),
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
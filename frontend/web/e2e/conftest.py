@@ -14,11 +14,23 @@ fake = Faker(["en_GB"])
 dotenv.load_dotenv()
 
 
-@pytest.fixture(scope="session")
-def frontend_url():
-    """Fixture for getting frontend URL"""
+def frontend_urls() -> list[str]:
+    """
+    Frontends to test: the one at frontend_url, and the ASGI app serving the
+    async views at frontend_asgi_url when it is set
+    """
 
-    return os.getenv("frontend_url") or "http://localhost:8000"
+    urls = [os.getenv("frontend_url") or "http://localhost:8000"]
+    if os.getenv("frontend_asgi_url"):
+        urls.append(os.getenv("frontend_asgi_url"))
+    return urls
+
+
+@pytest.fixture(scope="session", params=frontend_urls())
+def frontend_url(request: pytest.FixtureRequest):
+    """Fixture for getting frontend URL, running each test against every frontend"""
+
+    return request.param
 
 
 @pytest.fixture(scope="session", name="backend_url")
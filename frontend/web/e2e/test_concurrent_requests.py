@@ -0,0 +1,73 @@
+"""E2E stress tests for requests served at the same time"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from faker import Faker
+from playwright.sync_api import APIRequestContext
+
+fake = Faker(["en_GB"])
+
+MESSAGES = {
+    "contact-created-success": "Contact created successfully.",
+    "contact-updated-success": "Contact updated successfully.",
+    "contact-not-found": "Contact not found. Please try again.",
+    None: None,
+}
+ROUNDS = 25
+
+
+def test_concurrent_index_pages_keep_their_own_message(frontend_url: str):
+    """Test if parallel index page loads each show only their own message"""
+
+    params = list(MESSAGES) * ROUNDS
+
+    def load(message: str | None) -> str:
+        query = {"message": message} if message else {}
+        return requests.get(frontend_url, params=query, timeout=30).text
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        pages = list(pool.map(load, params))
+
+    for message, page in zip(params, pages):
+        for other, text in MESSAGES.items():
+            if text is not None:
+                assert (text in page) == (other == message), (message, other)
+
+
+def test_concurrent_edit_pages_show_their_own_contact(
+    api_request_context: APIRequestContext,
+    frontend_url: str,
+    backend_url: str,
+):
+    """Test if parallel edit page loads each show the contact they asked for"""
+
+    contacts = []
+    for _ in range(4):
+        response = api_request_context.post(
+            f"{backend_url}/contacts",
+            data={
+                "name": fake.name(),
+                "email": fake.email(),
+                "address": fake.address(),
+                "phone": re.sub(r"\D", "", fake.phone_number()),
+            },
+        )
+        assert response.ok
+        contacts.append(response.json())
+
+    def load(contact: dict) -> str:
+        return requests.get(f"{frontend_url}/edit/{contact['id']}", timeout=30).text
+
+    try:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            pages = list(pool.map(load, contacts * ROUNDS))
+
+        for contact, page in zip(contacts * ROUNDS, pages):
+            assert contact["email"] in page
+            for other in contacts:
+                if other is not contact:
+                    assert other["email"] not in page
+    finally:
+        for contact in contacts:
+            api_request_context.delete(f"{backend_url}/contacts/{contact['id']}")
@@ -0,0 +1,159 @@
+"""E2E tests for the frontend's cache of the first page of contacts"""
+
+import html
+import os
+import re
+import time
+
+import dotenv
+from faker import Faker
+from playwright.sync_api import APIRequestContext, Page, expect
+
+fake = Faker(["en_GB"])
+
+dotenv.load_dotenv()
+
+# seconds the frontend shows its cached first page without asking the backend
+CACHE_FRESH = float(os.getenv("contacts_cache_fresh") or "5")
+
+
+def new_contact() -> dict:
+    """Details of a contact that passes the form validation"""
+
+    return {
+        "name": fake.name(),
+        "email": fake.email(),
+        "address": fake.address(),
+        "phone": re.sub(r"\D", "", fake.phone_number()),
+    }
+
+
+def index_html(api_request_context: APIRequestContext, frontend_url: str) -> str:
+    """
+    The index page as the frontend renders it. Live updates are left out, as
+    the browser would swap in the changes the cached page is missing
+    """
+
+    response = api_request_context.get(frontend_url)
+    assert response.ok
+    return response.text()
+
+
+def card_ids(page_html: str) -> list[str]:
+    """Ids of the contact cards on a rendered page"""
+
+    return re.findall(r'id="contact-([0-9a-f-]{36})"', page_html)
+
+
+def prime_cache(api_request_context: APIRequestContext, frontend_url: str) -> str:
+    """Let the cached page go stale, then load it again so it is fresh for a while"""
+
+    time.sleep(CACHE_FRESH + 0.5)
+    return index_html(api_request_context, frontend_url)
+
+
+def test_fresh_page_is_served_from_cache(
+    api_request_context: APIRequestContext, frontend_url: str, backend_url: str
+):
+    """Test if a write made elsewhere only shows once the cached page is stale"""
+
+    prime_cache(api_request_context, frontend_url)
+    create_response = api_request_context.post(
+        f"{backend_url}/contacts", data=new_contact()
+    )
+    assert create_response.ok
+    contact_id = create_response.json()["id"]
+
+    try:
+        assert contact_id not in card_ids(index_html(api_request_context, frontend_url))
+
+        time.sleep(CACHE_FRESH + 0.5)
+        assert contact_id in card_ids(index_html(api_request_context, frontend_url))
+    finally:
+        api_request_context.delete(f"{backend_url}/contacts/{contact_id}")
+
+
+def test_unchanged_page_is_revalidated(
+    api_request_context: APIRequestContext, frontend_url: str
+):
+    """Test if a stale page the backend answers 304 for is shown from the cache"""
+
+    cached = prime_cache(api_request_context, frontend_url)
+
+    time.sleep(CACHE_FRESH + 0.5)
+    revalidated = index_html(api_request_context, frontend_url)
+
+    assert card_ids(revalidated) == card_ids(cached)
+    assert re.search(r"since=\d+", revalidated).group() == (
+        re.search(r"since=\d+", cached).group()
+    )
+
+
+def test_create_drops_cached_page(
+    page: Page,
+    api_request_context: APIRequestContext,
+    frontend_url: str,
+    backend_url: str,
+):
+    """Test if a contact created through the frontend shows while the page is fresh"""
+
+    user = new_contact()
+    prime_cache(api_request_context, frontend_url)
+
+    page.goto(f"{frontend_url}/create-contact")
+    for field, value in user.items():
+        page.get_by_role("textbox", name=field).fill(value)
+    page.get_by_role("button", name="submit").click()
+    expect(page).to_have_url(re.compile(r"/\?message=contact-created-success"))
+
+    assert user["email"] in index_html(api_request_context, frontend_url)
+
+    suggestions = api_request_context.get(
+        f"{backend_url}/contacts/autocomplete", params={"prefix": user["email"]}
+    ).json()
+    for contact in suggestions:
+        api_request_context.delete(f"{backend_url}/contacts/{contact['id']}")
+
+
+def test_edit_drops_cached_page(
+    contact_id: str,
+    page: Page,
+    api_request_context: APIRequestContext,
+    frontend_url: str,
+):
+    """Test if a contact edited through the frontend shows while the page is fresh"""
+
+    new_name = fake.name()
+    prime_cache(api_request_context, frontend_url)
+
+    page.goto(f"{frontend_url}/edit/{contact_id}")
+    page.get_by_role("textbox", name="name").fill(new_name)
+    page.get_by_role("button", name="submit").click()
+    expect(page).to_have_url(re.compile(r"/\?message=contact-updated-success"))
+
+    assert html.escape(new_name) in index_html(api_request_context, frontend_url)
+
+
+def test_delete_drops_cached_page(
+    page: Page,
+    api_request_context: APIRequestContext,
+    frontend_url: str,
+    backend_url: str,
+):
+    """Test if a contact deleted through the frontend goes while the page is fresh"""
+
+    create_response = api_request_context.post(
+        f"{backend_url}/contacts", data=new_contact()
+    )
+    assert create_response.ok
+    contact_id = create_response.json()["id"]
+    prime_cache(api_request_context, frontend_url)
+
+    page.goto(frontend_url)
+    page.once("dialog", lambda dialog: dialog.accept())
+    page.locator(f"#contact-{contact_id}").get_by_role("button", name="Delete").click()
+    expect(page.get_by_role("alert", name="message-box")).to_have_text(
+        "Contact deleted successfully.", ignore_case=True
+    )
+
+    assert contact_id not in card_ids(index_html(api_request_context, frontend_url))
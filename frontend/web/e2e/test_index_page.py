@@ -1,7 +1,18 @@
 """E2E tests for the index page"""
 
+import os
 import re
-from playwright.sync_api import Page, expect
+import uuid
+import dotenv
+from faker import Faker
+from playwright.sync_api import APIRequestContext, Page, expect
+
+fake = Faker(["en_GB"])
+
+dotenv.load_dotenv()
+
+# milliseconds a change made elsewhere may take to show, a poll of the page and more
+LIVE_TIMEOUT = (float(os.getenv("contacts_poll_seconds") or "5") + 5) * 1000
 
 
 def test_index_page_has_correct_title(page: Page, frontend_url: str):
@@ -34,3 +45,160 @@ def test_random_message_should_not_be_shown(page: Page, frontend_url: str):
 
     page.goto(f"{frontend_url}/?message=random-message")
     expect(page.get_by_role("alert", name="message-box")).not_to_be_visible()
+
+
+def test_index_page_is_compressed(page: Page, frontend_url: str):
+    """Test if the index page is sent compressed to the browser"""
+
+    response = page.goto(frontend_url)
+    assert response.header_value("content-encoding") in ("gzip", "br")
+    assert "Accept-Encoding" in response.header_value("vary")
+
+
+def test_contact_changes_are_shown_live(
+    page: Page,
+    frontend_url: str,
+    backend_url: str,
+    api_request_context: APIRequestContext,
+):
+    """Test if contacts written elsewhere are swapped into the open index page"""
+
+    # the page asks for the changes after the revision it was rendered at, by
+    # polling under WSGI or by an event stream under ASGI, so none are missed
+    page.goto(frontend_url)
+
+    name = fake.name()
+    create_response = api_request_context.post(
+        f"{backend_url}/contacts",
+        data={
+            "name": name,
+            "email": fake.email(),
+            "address": fake.address(),
+            "phone": re.sub(r"\D", "", fake.phone_number()),
+        },
+    )
+    assert create_response.ok
+    contact_id = create_response.json()["id"]
+    card = page.locator(f"#contact-{contact_id}")
+    expect(card.get_by_role("heading", name=name)).to_be_visible(timeout=LIVE_TIMEOUT)
+
+    new_name = fake.name()
+    api_request_context.patch(
+        f"{backend_url}/contacts/{contact_id}", data={"name": new_name}
+    )
+    expect(card.get_by_role("heading", name=new_name)).to_be_visible(
+        timeout=LIVE_TIMEOUT
+    )
+
+    api_request_context.delete(f"{backend_url}/contacts/{contact_id}")
+    expect(card).to_have_count(0, timeout=LIVE_TIMEOUT)
+
+
+def test_more_contacts_load_on_scroll(
+    page: Page,
+    frontend_url: str,
+    backend_url: str,
+    api_request_context: APIRequestContext,
+):
+    """Test if the contacts after the first page are loaded as the list is scrolled"""
+
+    contact_ids = []
+    for _ in range(25):  # one more than a page
+        create_response = api_request_context.post(
+            f"{backend_url}/contacts",
+            data={
+                "name": fake.name(),
+                "email": fake.email(),
+                "address": fake.address(),
+                "phone": re.sub(r"\D", "", fake.phone_number()),
+            },
+        )
+        assert create_response.ok
+        contact_ids.append(create_response.json()["id"])
+
+    page.goto(frontend_url)
+    newest_card = page.locator(f"#contact-{contact_ids[-1]}")
+    # the first page may come from the frontend's cache for a few seconds
+    for _ in range(10):
+        if newest_card.count():
+            break
+        page.wait_for_timeout(1000)
+        page.reload()
+    expect(newest_card).to_be_visible()
+
+    # newest first, so the first one created is on the second page
+    oldest_card = page.locator(f"#contact-{contact_ids[0]}")
+    expect(oldest_card).to_have_count(0)
+
+    page.locator("#contact-list-more").scroll_into_view_if_needed()
+    expect(oldest_card).to_be_visible()
+
+    for contact_id in contact_ids:
+        api_request_context.delete(f"{backend_url}/contacts/{contact_id}")
+
+
+def test_delete_removes_only_its_card(
+    page: Page,
+    frontend_url: str,
+    backend_url: str,
+    api_request_context: APIRequestContext,
+):
+    """Test if deleting a contact removes its card and leaves the rest of the list"""
+
+    contact_ids = []
+    for _ in range(2):
+        create_response = api_request_context.post(
+            f"{backend_url}/contacts",
+            data={
+                "name": fake.name(),
+                "email": fake.email(),
+                "address": fake.address(),
+                "phone": re.sub(r"\D", "", fake.phone_number()),
+            },
+        )
+        assert create_response.ok
+        contact_ids.append(create_response.json()["id"])
+
+    page.goto(frontend_url)
+    deleted_card = page.locator(f"#contact-{contact_ids[0]}")
+    kept_card = page.locator(f"#contact-{contact_ids[1]}")
+    expect(deleted_card).to_be_visible()
+    expect(kept_card).to_be_visible()
+    # a list rendered again would lose this mark along with the old element
+    kept_card.evaluate("card => card.dataset.kept = 'true'")
+
+    page.once("dialog", lambda dialog: dialog.accept())
+    deleted_card.get_by_role("button", name="Delete").click()
+
+    expect(page.get_by_role("alert", name="message-box")).to_have_text(
+        "Contact deleted successfully.", ignore_case=True
+    )
+    expect(deleted_card).to_have_count(0)
+    expect(kept_card).to_have_attribute("data-kept", "true")
+
+    api_request_context.delete(f"{backend_url}/contacts/{contact_ids[1]}")
+
+
+def test_failed_delete_keeps_the_card(
+    contact_id: str,
+    page: Page,
+    frontend_url: str,
+):
+    """Test if a delete the backend refuses shows the error and keeps the card"""
+
+    page.goto(frontend_url)
+    card = page.locator(f"#contact-{contact_id}")
+    expect(card).to_be_visible()
+
+    # the frontend asks the backend to delete a contact that does not exist
+    page.route(
+        re.compile(r".*\?contact_id=.*"),
+        lambda route: route.continue_(url=f"{frontend_url}/?contact_id={uuid.uuid4()}"),
+    )
+    page.once("dialog", lambda dialog: dialog.accept())
+    card.get_by_role("button", name="Delete").click()
+
+    message = page.get_by_role("alert", name="message-box")
+    expect(message).to_contain_text("failed to delete contact", ignore_case=True)
+    expect(message).to_have_class(re.compile(r"alert-error"))
+    expect(card).to_be_visible()
@@ -0,0 +1,86 @@
+"""Middleware for the web app"""
+
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+
+try:
+    import brotli
+except ImportError:  # optional, br is only offered when it is installed
+    brotli = None
+
+re_accepts_brotli = _lazy_re_compile(r"\bbr\b(?!\s*;\s*q=0(\.0*)?\s*(,|$))")
+
+BROTLI_QUALITY = 4
+
+
+def brotli_sequence(chunks):
+    """Compress chunks as one brotli stream, flushing after every chunk"""
+
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    for chunk in chunks:
+        yield compressor.process(chunk) + compressor.flush()
+    yield compressor.finish()
+
+
+async def abrotli_sequence(chunks):
+    """Compress async chunks as one brotli stream, flushing after every chunk"""
+
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    async for chunk in chunks:
+        yield compressor.process(chunk) + compressor.flush()
+    yield compressor.finish()
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware with the size threshold in COMPRESSION_MINIMUM_SIZE, brotli
+    when it is installed and the browser accepts it, and no compression of the
+    content types in COMPRESSION_EXCLUDED_TYPES, such as Server-Sent Events
+    """
+
+    def process_response(self, request, response):
+        media_type = response.get("Content-Type", "").split(";")[0].strip()
+        if media_type in settings.COMPRESSION_EXCLUDED_TYPES:
+            return response
+
+        if (
+            not response.streaming
+            and len(response.content) < settings.COMPRESSION_MINIMUM_SIZE
+        ):
+            return response
+
+        accept_encoding = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if (
+            brotli is None
+            or response.has_header("Content-Encoding")
+            or not re_accepts_brotli.search(accept_encoding)
+        ):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = abrotli_sequence(
+                    response.streaming_content
+                )
+            else:
+                response.streaming_content = brotli_sequence(response.streaming_content)
+            del response.headers["Content-Length"]
+        else:
+            compressed_content = brotli.compress(
+                response.content, quality=BROTLI_QUALITY
+            )
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers["Content-Length"] = str(len(response.content))
+
+        # a strong ETag names one encoding of the body, as GZipMiddleware notes
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+
+        return response
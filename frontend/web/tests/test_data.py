@@ -0,0 +1,158 @@
+"""Unit tests for the backend client in web.utils.data"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import requests
+
+from web.utils import data
+
+
+def run_request(monkeypatch, method: str, outcomes: list) -> tuple:
+    """
+    Send method through arequest to a backend answering with outcomes in turn,
+    each a status code or an exception to raise, and return what arequest
+    returned or raised with the number of attempts it made
+    """
+
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = outcomes[min(len(attempts), len(outcomes) - 1)]
+        attempts.append(request)
+        if isinstance(outcome, int):
+            return httpx.Response(outcome)
+        raise outcome("backend error", request=request)
+
+    async def send():
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="http://backend"
+        ) as client:
+            monkeypatch.setattr(data, "get_async_client", lambda: client)
+            try:
+                return await data.arequest(method, "/contacts/")
+            except httpx.HTTPError as e:
+                return e
+
+    monkeypatch.setattr(data, "BACKOFF_FACTOR", 0)
+    return asyncio.run(send()), len(attempts)
+
+
+class TestArequest:
+    """Test class for arequest"""
+
+    @pytest.mark.parametrize("method", ["GET", "POST"])
+    def test_retry_connect_error(self, monkeypatch, method):
+        """Should retry a connection failure whatever the method"""
+
+        result, attempts = run_request(monkeypatch, method, [httpx.ConnectError, 200])
+
+        assert result.status_code == 200
+        assert attempts == 2
+
+    def test_give_up_on_connect_error(self, monkeypatch):
+        """Should raise the connection failure once the retries are spent"""
+
+        result, attempts = run_request(monkeypatch, "POST", [httpx.ConnectError])
+
+        assert isinstance(result, httpx.ConnectError)
+        assert attempts == data.BACKEND_RETRIES + 1
+
+    def test_retry_other_error_when_idempotent(self, monkeypatch):
+        """Should retry an error after connecting when the method is idempotent"""
+
+        result, attempts = run_request(monkeypatch, "PUT", [httpx.ReadError, 200])
+
+        assert result.status_code == 200
+        assert attempts == 2
+
+    @pytest.mark.parametrize("method", ["POST", "PATCH"])
+    def test_raise_other_error_when_not_idempotent(self, monkeypatch, method):
+        """Should not retry an error after connecting, as the write may have landed"""
+
+        result, attempts = run_request(monkeypatch, method, [httpx.ReadError, 200])
+
+        assert isinstance(result, httpx.ReadError)
+        assert attempts == 1
+
+    @pytest.mark.parametrize("status", data.RETRY_STATUSES)
+    def test_retry_status_when_idempotent(self, monkeypatch, status):
+        """Should retry a 502, 503 or 504 when the method is idempotent"""
+
+        result, attempts = run_request(monkeypatch, "DELETE", [status, 200])
+
+        assert result.status_code == 200
+        assert attempts == 2
+
+    def test_return_status_when_not_idempotent(self, monkeypatch):
+        """Should return a 503 to a POST as it is, without retrying"""
+
+        result, attempts = run_request(monkeypatch, "POST", [503, 200])
+
+        assert result.status_code == 503
+        assert attempts == 1
+
+    def test_return_last_status(self, monkeypatch):
+        """Should return the last answer once the retries are spent"""
+
+        result, attempts = run_request(monkeypatch, "GET", [503])
+
+        assert result.status_code == 503
+        assert attempts == data.BACKEND_RETRIES + 1
+
+    def test_return_other_status(self, monkeypatch):
+        """Should not retry a status outside the retried ones"""
+
+        result, attempts = run_request(monkeypatch, "GET", [404, 200])
+
+        assert result.status_code == 404
+        assert attempts == 1
+
+
+class TestGetContactChanges:
+    """Test class for get_contact_changes"""
+
+    def test_get_changes_after_since(self, monkeypatch):
+        """Should ask the change feed for a batch after since"""
+
+        calls = []
+        feed = {"items": [], "created": [], "deleted": [], "next_since": 7}
+
+        class Session:
+            """Backend session answering every GET with the feed"""
+
+            def get(self, url, **kwargs):
+                calls.append((url, kwargs["params"]))
+                response = requests.Response()
+                response.status_code = 200
+                response._content = json.dumps(feed).encode()
+                return response
+
+        monkeypatch.setattr(data, "backend_url", "http://backend")
+        monkeypatch.setattr(data, "get_session", Session)
+
+        assert data.get_contact_changes("5") == feed
+        assert calls == [
+            (
+                "http://backend/contacts/changes",
+                {"since": "5", "limit": data.CONTACT_CHANGES_LIMIT},
+            )
+        ]
+
+    def test_raise_error_status(self, monkeypatch):
+        """Should raise an error answer, so the page polls from the same revision"""
+
+        class Session:
+            """Backend session answering every GET with a 500"""
+
+            def get(self, url, **kwargs):
+                response = requests.Response()
+                response.status_code = 500
+                return response
+
+        monkeypatch.setattr(data, "get_session", Session)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            data.get_contact_changes("5")
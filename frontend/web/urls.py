@@ -1,14 +1,33 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
 app_name = "web"
 
+if settings.ASYNC_VIEWS:
+    index_view = views.AsyncIndexView
+    create_contact_view = views.AsyncCreateContactView
+    edit_contact_view = views.AsyncEditContactView
+    # streaming changes holds a worker for as long as the page is open, which
+    # only an async view can afford
+    contact_updates_path = path(
+        "events", views.AsyncContactEventsView.as_view(), name="contact_events"
+    )
+else:
+    index_view = views.IndexView
+    create_contact_view = views.CreateContactView
+    edit_contact_view = views.EditContactView
+    contact_updates_path = path(
+        "changes", views.ContactChangesView.as_view(), name="contact_changes"
+    )
+
 urlpatterns = [
-    path("", views.IndexView.as_view(), name="index"),
-    path("create-contact", views.CreateContactView.as_view(), name="create_contact"),
+    path("", index_view.as_view(), name="index"),
+    contact_updates_path,
+    path("create-contact", create_contact_view.as_view(), name="create_contact"),
     path(
         "edit/<uuid:contact_id>",
-        views.EditContactView.as_view(),
+        edit_contact_view.as_view(),
         name="edit_contact",
     ),
 ]
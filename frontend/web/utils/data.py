@@ -1,47 +1,398 @@
 """Data Functions that handle CRUD actions with endpoints"""
 
+import asyncio
 import os
+import threading
+import time
+import weakref
+import httpx
 import requests
 import dotenv
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 dotenv.load_dotenv()
 
 backend_url = os.getenv("backend_url")
 
+# Seconds to wait for the backend to accept a connection, then for each read
+BACKEND_TIMEOUT = (
+    float(os.getenv("backend_connect_timeout", "3")),
+    float(os.getenv("backend_read_timeout", "10")),
+)
 
-def get_contacts():
-    """Get all contacts from the backend"""
+BACKEND_POOL_SIZE = int(os.getenv("backend_pool_size", "10"))
 
-    response = requests.get(f"{backend_url}/contacts/", timeout=10)
-    return response.json()
+# Only idempotent requests are retried, with exponential backoff, on connection
+# errors and on the statuses a restarting or overloaded backend answers with
+BACKEND_RETRIES = int(os.getenv("backend_retries", "3"))
+BACKOFF_FACTOR = 0.2
+RETRY_STATUSES = (502, 503, 504)
+IDEMPOTENT_METHODS = Retry.DEFAULT_ALLOWED_METHODS
+
+# One pool of keep-alive connections to the backend, shared by every thread.
+# Connections beyond the pool size are opened when needed and closed after use
+backend_adapter = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=BACKEND_POOL_SIZE,
+    max_retries=Retry(
+        total=BACKEND_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+    ),
+)
+
+_local = threading.local()
+
+
+def get_session() -> requests.Session:
+    """
+    Session of the current thread, on the shared connection pool
+    Sessions are per thread as a requests.Session is not thread-safe, while the
+    adapter they mount, and its pool, is
+    """
+
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.mount("http://", backend_adapter)
+        session.mount("https://", backend_adapter)
+        _local.session = session
+    return session
+
+
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Async client of the running event loop, with its own keep-alive pool
+    Connections can only be awaited on the loop that opened them, so every loop
+    gets a client, which under ASGI means one per process
+    """
+
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            base_url=backend_url or "",
+            limits=httpx.Limits(max_keepalive_connections=BACKEND_POOL_SIZE),
+            timeout=httpx.Timeout(BACKEND_TIMEOUT[1], connect=BACKEND_TIMEOUT[0]),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def arequest(method: str, path: str, **kwargs) -> httpx.Response:
+    """
+    Send a request to the backend on the async client, retried like the pooled
+    session: connection failures always, other errors and statuses only when
+    the request is idempotent
+    """
+
+    client = get_async_client()
+    for attempt in range(BACKEND_RETRIES + 1):
+        retryable = attempt < BACKEND_RETRIES
+        try:
+            response = await client.request(method, path, **kwargs)
+        except httpx.ConnectError:
+            if not retryable:
+                raise
+        except httpx.TransportError:
+            if not retryable or method not in IDEMPOTENT_METHODS:
+                raise
+        else:
+            if (
+                not retryable
+                or method not in IDEMPOTENT_METHODS
+                or response.status_code not in RETRY_STATUSES
+            ):
+                return response
+        await asyncio.sleep(BACKOFF_FACTOR * 2**attempt)
+
+
+# Fields shown by components/contact_card.html
+CARD_FIELDS = "id,name,email,phone,address"
+
+# Contacts on the index page, and in each page loaded as the list is scrolled
+CONTACTS_PAGE_SIZE = int(os.getenv("contacts_page_size", "24"))
+
+# The first page of contacts is kept in the Django cache with the backend's
+# ETag. For contacts_cache_fresh seconds it is served without asking the backend
+# at all, then it is revalidated with If-None-Match. Writes through the frontend
+# drop it
+CONTACTS_CACHE_KEY = "contacts:first-page"
+CONTACTS_CACHE_FRESH = float(os.getenv("contacts_cache_fresh", "5"))
+
+
+def is_fresh(cached: dict | None) -> bool:
+    """Whether a cached contact list can be used without revalidating it"""
+
+    return (
+        cached is not None and time.time() - cached["checked_at"] < CONTACTS_CACHE_FRESH
+    )
+
+
+def revalidation_headers(cached: dict | None) -> dict:
+    """Headers asking the backend for the contact list only if it changed"""
+
+    return {"If-None-Match": cached["etag"]} if cached else {}
+
+
+def page_params(cursor: str | None) -> dict:
+    """Query of the page of contact cards after cursor, or of the first page"""
+
+    params = {"limit": CONTACTS_PAGE_SIZE, "fields": CARD_FIELDS}
+    if cursor:
+        params["cursor"] = cursor
+    return params
+
+
+def read_contacts(cached: dict | None, response) -> tuple[dict, dict | None]:
+    """
+    Contacts of a list response, or of the cache when the backend answered 304,
+    with the cache entry to store for them, if any. The page keeps the change
+    feed revision it was read at, for the events stream to start from
+    """
+
+    if response.status_code >= 400:
+        response.raise_for_status()
+
+    if response.status_code == 304 and cached:
+        contacts = cached["contacts"]
+    else:
+        contacts = {
+            **response.json(),
+            "revision": response.headers.get("X-Contacts-Revision"),
+        }
+
+    etag = response.headers.get("ETag")
+    if etag is None:
+        return contacts, None
+
+    return contacts, {
+        "etag": etag,
+        "contacts": contacts,
+        "checked_at": time.time(),
+    }
+
+
+def invalidate_contacts():
+    """Drop the cached first page of contacts after a write"""
+
+    cache.delete(CONTACTS_CACHE_KEY)
+
+
+async def ainvalidate_contacts():
+    """Drop the cached first page of contacts after a write, without blocking"""
+
+    await cache.adelete(CONTACTS_CACHE_KEY)
+
+
+def get_contacts_page(cursor: str | None = None) -> dict:
+    """
+    Get a page of contacts from the backend, newest first, with only the fields
+    of a contact card, as its items and the next_cursor of the page after it.
+    The first page is taken from the cache while it is fresh
+    """
+
+    if cursor:
+        response = get_session().get(
+            f"{backend_url}/contacts/",
+            params=page_params(cursor),
+            timeout=BACKEND_TIMEOUT,
+        )
+        return read_contacts(None, response)[0]
+
+    cached = cache.get(CONTACTS_CACHE_KEY)
+    if is_fresh(cached):
+        return cached["contacts"]
+
+    response = get_session().get(
+        f"{backend_url}/contacts/",
+        params=page_params(None),
+        headers=revalidation_headers(cached),
+        timeout=BACKEND_TIMEOUT,
+    )
+    contacts, entry = read_contacts(cached, response)
+    if entry is not None:
+        cache.set(CONTACTS_CACHE_KEY, entry)
+    return contacts
 
 
 def get_contact_by_id(contact_id: str):
     """Send GET request to /contacts"""
 
-    response = requests.get(f"{backend_url}/contacts/{contact_id}", timeout=10)
+    response = get_session().get(
+        f"{backend_url}/contacts/{contact_id}", timeout=BACKEND_TIMEOUT
+    )
     return response.json()
 
 
 def create_contact(contact):
     """Send POST request to /contacts"""
 
-    response = requests.post(f"{backend_url}/contacts/", json=contact, timeout=10)
+    response = get_session().post(
+        f"{backend_url}/contacts/", json=contact, timeout=BACKEND_TIMEOUT
+    )
+    invalidate_contacts()
     return response.json()
 
 
 def delete_contact(contact_id: str):
     """Send DELETE request to /contacts"""
 
-    response = requests.delete(f"{backend_url}/contacts/{contact_id}", timeout=10)
+    response = get_session().delete(
+        f"{backend_url}/contacts/{contact_id}", timeout=BACKEND_TIMEOUT
+    )
+    invalidate_contacts()
     response.raise_for_status()
     return response.json()
 
 
-def update_contact(contact_id: str, contact: dict):
-    """Send PUT request to /contacts"""
+def patch_contact(contact_id: str, changes: dict):
+    """Send PATCH request to /contacts with only the changed fields"""
+
+    response = get_session().patch(
+        f"{backend_url}/contacts/{contact_id}", json=changes, timeout=BACKEND_TIMEOUT
+    )
+    invalidate_contacts()
+    return response.json()
+
+
+# Changes read from the backend per poll of the index page
+CONTACT_CHANGES_LIMIT = 100
+
+
+def get_contact_changes(since: str) -> dict:
+    """
+    Send GET request to /contacts/changes for the contacts created, updated or
+    deleted after revision since, oldest first
+    """
 
-    response = requests.put(
-        f"{backend_url}/contacts/{contact_id}", json=contact, timeout=10
+    response = get_session().get(
+        f"{backend_url}/contacts/changes",
+        params={"since": since, "limit": CONTACT_CHANGES_LIMIT},
+        timeout=BACKEND_TIMEOUT,
     )
+    response.raise_for_status()
+    return response.json()
+
+
+async def aget_contacts_page(cursor: str | None = None) -> dict:
+    """Get a page of contacts, like get_contacts_page, without blocking"""
+
+    if cursor:
+        response = await arequest("GET", "/contacts/", params=page_params(cursor))
+        return read_contacts(None, response)[0]
+
+    cached = await cache.aget(CONTACTS_CACHE_KEY)
+    if is_fresh(cached):
+        return cached["contacts"]
+
+    response = await arequest(
+        "GET",
+        "/contacts/",
+        params=page_params(None),
+        headers=revalidation_headers(cached),
+    )
+    contacts, entry = read_contacts(cached, response)
+    if entry is not None:
+        await cache.aset(CONTACTS_CACHE_KEY, entry)
+    return contacts
+
+
+async def aget_contact_by_id(contact_id: str):
+    """Send GET request to /contacts without blocking"""
+
+    response = await arequest("GET", f"/contacts/{contact_id}")
+    return response.json()
+
+
+async def acreate_contact(contact):
+    """Send POST request to /contacts without blocking"""
+
+    response = await arequest("POST", "/contacts/", json=contact)
+    await ainvalidate_contacts()
+    return response.json()
+
+
+async def adelete_contact(contact_id: str):
+    """Send DELETE request to /contacts without blocking"""
+
+    response = await arequest("DELETE", f"/contacts/{contact_id}")
+    await ainvalidate_contacts()
+    response.raise_for_status()
     return response.json()
+
+
+async def apatch_contact(contact_id: str, changes: dict):
+    """Send PATCH request to /contacts with only the changed fields, without blocking"""
+
+    response = await arequest("PATCH", f"/contacts/{contact_id}", json=changes)
+    await ainvalidate_contacts()
+    return response.json()
+
+
+class EventStreamParser:
+    """Builds Server-Sent Events from the lines of a stream, one line at a time"""
+
+    def __init__(self):
+        self.event = {}
+
+    def feed(self, line: str) -> list[dict | None]:
+        """
+        Take one line, returning the events it completes as dicts of event, data
+        and id, or None for a keep-alive comment
+        """
+
+        if line.startswith(":"):
+            return [None]
+
+        if line:
+            field, _, value = line.partition(":")
+            value = value.removeprefix(" ")
+            if field == "data" and "data" in self.event:
+                value = f"{self.event['data']}\n{value}"
+            self.event[field] = value
+            return []
+
+        event, self.event = self.event, {}
+        return [event] if event else []
+
+
+def event_stream_params(since: str | None) -> dict:
+    """Query starting /contacts/events after revision since, if it is one"""
+
+    return {"since": since} if since and since.isdigit() else {}
+
+
+async def astream_contact_events(
+    last_event_id: str | None = None, since: str | None = None
+):
+    """
+    Send GET request to /contacts/events and yield its Server-Sent Events as
+    dicts of event, data and id as they arrive, or None for a keep-alive.
+    The stream resumes after last_event_id, or else starts after since
+    """
+
+    headers = {"Last-Event-ID": last_event_id} if last_event_id else {}
+    # the stream holds its connection for as long as the page is open, so it
+    # gets a client of its own instead of keeping one of the pool from other
+    # requests. The backend sends a keep-alive well within the read timeout
+    async with httpx.AsyncClient(
+        base_url=backend_url or "", timeout=httpx.Timeout(60, connect=10)
+    ) as client:
+        async with client.stream(
+            "GET",
+            "/contacts/events",
+            params=event_stream_params(since),
+            headers=headers,
+        ) as response:
+            response.raise_for_status()
+            parser = EventStreamParser()
+            async for line in response.aiter_lines():
+                for event in parser.feed(line):
+                    yield event
@@ -21,3 +21,16 @@ class ContactForm(forms.Form):
         validators=[phone_validator],
         help_text="Phone number must be 10-15 digits long, e.g. 08882459444",
     )
+
+
+class EditContactForm(ContactForm):
+    """
+    Contact form for editing an existing contact
+    Renders the initial values as hidden inputs too, so that changed_data can tell
+    which fields were edited when the form is posted back
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for field in self.fields.values():
+            field.show_hidden_initial = True
@@ -1,56 +1,128 @@
 """Views for the frontend"""
 
+import copy
+import json
+
+import httpx
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import render, redirect
+from django.template.loader import render_to_string
 from django.urls import reverse
 from django.views import View
-from django_htmx.http import retarget
+from django_htmx.http import reswap, retarget
 
 import requests
 
 from web.utils.data import (
-    get_contacts,
+    get_contacts_page,
     create_contact,
     delete_contact,
     get_contact_by_id,
-    update_contact,
+    get_contact_changes,
+    patch_contact,
+    aget_contacts_page,
+    acreate_contact,
+    adelete_contact,
+    aget_contact_by_id,
+    apatch_contact,
+    astream_contact_events,
 )
-from web.utils.form import ContactForm
+from web.utils.form import ContactForm, EditContactForm
+
+
+class RequestContextMixin:
+    """
+    Gives every request its own self.context, copied from initial_context
+    Django builds a view instance per request, but class attributes are shared
+    by all of them, so a context mutated at class level would leak between
+    requests served at the same time
+    """
+
+    initial_context = {}
+
+    def setup(self, request, *args, **kwargs):
+        """Initialize the context of this request"""
+
+        super().setup(request, *args, **kwargs)
+        self.context = copy.deepcopy(self.initial_context)
 
 
-class IndexView(View):
-    """Index view for the frontend"""
+class IndexView(RequestContextMixin, View):
+    """
+    Index view for the frontend
+    The page polls for contact changes, as a stream would hold a worker thread
+    of a WSGI server for as long as the page is open
+    """
 
     base_template = "index.html"
-    context = {"contacts": [], "error": None, "message": None}
+    page_template = "partials/contact_page.html"
+    delete_template = "partials/contact_deleted.html"
+    initial_context = {
+        "contacts": [],
+        "next_cursor": None,
+        "revision": None,
+        "error": None,
+        "message": None,
+        "live_updates": "poll",
+        "poll_seconds": settings.CONTACTS_POLL_SECONDS,
+    }
 
     def get(self, request):
-        """Get request for the index view"""
+        """
+        Get request for the index view
+        The page shows the newest contacts, and the sentinel below them loads the
+        page after its cursor once scrolled into view, rendering only its cards
+        """
 
-        self.context["message"] = None  # make sure message on every fetch is cleared
-        self.get_contacts_from_api()
-        self.get_message_params()
-        return render(request, self.base_template, self.context)
+        cursor = self.request.GET.get("cursor")
+        self.get_contacts_from_api(cursor)
+        return self.render_contacts(request, cursor)
 
     def delete(self, request):
-        """Delete request for the index view"""
+        """
+        Delete request for the index view
+        The card swaps itself out for the empty response, while the message is
+        swapped in out of band, so the rest of the list is left as it is
+        """
 
         contact_id = self.request.GET.get("contact_id")
-        if contact_id is not None:
-            try:
-                delete_contact(contact_id)
-                self.context["message"] = "Contact deleted successfully."
-            except requests.exceptions.RequestException as e:
-                self.context["message"] = f"failed to delete contact: {str(e)}"
+        if contact_id is None:
+            self.get_contacts_from_api()
+            return render(request, self.base_template, self.context)
 
-        self.get_contacts_from_api()
+        try:
+            delete_contact(contact_id)
+            self.context["message"] = "Contact deleted successfully."
+        except requests.exceptions.RequestException as e:
+            self.context["message"] = f"failed to delete contact: {str(e)}"
+            return self.render_delete_failed(request)
+
+        return render(request, self.delete_template, self.context)
+
+    def render_delete_failed(self, request):
+        """Helper method to show the failure message, keeping the card"""
+
+        response = render(request, self.delete_template, self.context)
+        return reswap(response, "none")
+
+    def render_contacts(self, request, cursor: str | None):
+        """Helper method to render the index page, or the page after cursor"""
+
+        if cursor is not None:
+            return render(request, self.page_template, self.context)
+
+        self.get_message_params()
         return render(request, self.base_template, self.context)
 
-    def get_contacts_from_api(self):
-        """Helper method to get contacts from the API"""
+    def get_contacts_from_api(self, cursor: str | None = None):
+        """Helper method to get a page of contacts from the API"""
 
         try:
-            contacts = get_contacts()
-            self.context["contacts"] = contacts
+            page = get_contacts_page(cursor)
+            self.context["contacts"] = page["items"]
+            self.context["next_cursor"] = page["next_cursor"]
+            self.context["revision"] = page.get("revision")
         except requests.exceptions.RequestException as e:
             self.context["error"] = (
                 f"Failed to fetch contacts list from backend: {str(e)}"
@@ -78,11 +150,56 @@ class IndexView(View):
                     self.context["message"] = "Contact not found. Please try again."
 
 
-class CreateContactView(View):
+class AsyncIndexView(IndexView):
+    """
+    Index view awaiting the backend instead of blocking a worker thread, for
+    ASGI deployments, where the page streams contact changes instead of polling
+    """
+
+    initial_context = {**IndexView.initial_context, "live_updates": "events"}
+
+    async def get(self, request):
+        """Get request for the async index view"""
+
+        cursor = self.request.GET.get("cursor")
+        await self.aget_contacts_from_api(cursor)
+        return self.render_contacts(request, cursor)
+
+    async def delete(self, request):
+        """Delete request for the async index view"""
+
+        contact_id = self.request.GET.get("contact_id")
+        if contact_id is None:
+            await self.aget_contacts_from_api()
+            return render(request, self.base_template, self.context)
+
+        try:
+            await adelete_contact(contact_id)
+            self.context["message"] = "Contact deleted successfully."
+        except httpx.HTTPError as e:
+            self.context["message"] = f"failed to delete contact: {str(e)}"
+            return self.render_delete_failed(request)
+
+        return render(request, self.delete_template, self.context)
+
+    async def aget_contacts_from_api(self, cursor: str | None = None):
+        """Helper method to get a page of contacts from the API without blocking"""
+
+        try:
+            page = await aget_contacts_page(cursor)
+            self.context["contacts"] = page["items"]
+            self.context["next_cursor"] = page["next_cursor"]
+            self.context["revision"] = page.get("revision")
+        except httpx.HTTPError as e:
+            self.context["error"] = (
+                f"Failed to fetch contacts list from backend: {str(e)}"
+            )
+
+
+class CreateContactView(RequestContextMixin, View):
     """Create contact view for the frontend"""
 
     base_template = "create_contact.html"
-    context = {}
 
     def get(self, request):
         """Get request for the create contact view"""
@@ -114,11 +231,41 @@ class CreateContactView(View):
         return retarget(response, "#create_contact_form")
 
 
-class EditContactView(View):
+class AsyncCreateContactView(CreateContactView):
+    """Create contact view awaiting the backend, for ASGI deployments"""
+
+    async def get(self, request):
+        """Get request for the async create contact view"""
+
+        return super().get(request)
+
+    async def post(self, request):
+        """Post request for the async create contact view"""
+
+        form = ContactForm(request.POST)
+
+        if form.is_valid():
+            try:
+                await acreate_contact(form.cleaned_data)
+                return redirect(
+                    f"{reverse('web:index')}?message=contact-created-success"
+                )
+            except httpx.HTTPError as e:
+                self.context["message"] = (
+                    f"failed to create new contact: {str(e)}. Please try again."
+                )
+
+        self.context["form"] = form
+        response = render(
+            request, "partials/create_contact_form.html", self.context
+        )  # partial rendering
+        return retarget(response, "#create_contact_form")
+
+
+class EditContactView(RequestContextMixin, View):
     """Edit contact view for the frontend"""
 
     base_template = "edit_contact.html"
-    context = {}
 
     def get(self, request, contact_id):
         """Get request for the edit contact view"""
@@ -128,7 +275,7 @@ class EditContactView(View):
         if data.get("id") is None:
             return redirect(f"{reverse('web:index')}?message=contact-not-found")
 
-        form = ContactForm(data=data)
+        form = EditContactForm(data=data)
         self.context["form"] = form
         self.context["contact"] = data
         return render(request, self.base_template, self.context)
@@ -136,9 +283,11 @@ class EditContactView(View):
     def post(self, request, contact_id):
         """Post request for the edit contact view"""
 
-        form = ContactForm(request.POST)
+        form = EditContactForm(request.POST)
         if form.is_valid():
-            update_contact(contact_id, form.cleaned_data)
+            changes = {field: form.cleaned_data[field] for field in form.changed_data}
+            if changes:
+                patch_contact(contact_id, changes)
             return redirect(f"{reverse('web:index')}?message=contact-updated-success")
 
         self.context["form"] = form
@@ -146,3 +295,125 @@ class EditContactView(View):
             request, "partials/edit_contact_form.html", self.context
         )  # partial rendering
         return retarget(response, "#edit_contact_form")
+
+
+class AsyncEditContactView(EditContactView):
+    """Edit contact view awaiting the backend, for ASGI deployments"""
+
+    async def get(self, request, contact_id):
+        """Get request for the async edit contact view"""
+
+        data = await aget_contact_by_id(contact_id)
+
+        if data.get("id") is None:
+            return redirect(f"{reverse('web:index')}?message=contact-not-found")
+
+        form = EditContactForm(data=data)
+        self.context["form"] = form
+        self.context["contact"] = data
+        return render(request, self.base_template, self.context)
+
+    async def post(self, request, contact_id):
+        """Post request for the async edit contact view"""
+
+        form = EditContactForm(request.POST)
+        if form.is_valid():
+            changes = {field: form.cleaned_data[field] for field in form.changed_data}
+            if changes:
+                await apatch_contact(contact_id, changes)
+            return redirect(f"{reverse('web:index')}?message=contact-updated-success")
+
+        self.context["form"] = form
+        response = render(
+            request, "partials/edit_contact_form.html", self.context
+        )  # partial rendering
+        return retarget(response, "#edit_contact_form")
+
+
+class ContactChangesView(View):
+    """
+    Contact changes for the index page polling under WSGI. Each poll passes the
+    revision the page is up to as since, and gets the changes after it as
+    out-of-band swaps of the affected cards, with the poll moved on past them
+    """
+
+    changes_template = "partials/contact_changes.html"
+
+    def get(self, request):
+        """Get request for the contact changes view"""
+
+        since = request.GET.get("since", "")
+        if not since.isdigit():
+            return HttpResponseBadRequest("since must be a revision")
+
+        try:
+            changes = get_contact_changes(since)
+        except requests.exceptions.RequestException:
+            # keep the poll as it is, so it asks from the same revision again
+            return reswap(HttpResponse(), "none")
+
+        # a contact created after since is new to the page, even when it was
+        # updated again before this poll
+        created = set(changes["created"])
+        events = [
+            ("created" if contact["id"] in created else "updated", contact)
+            for contact in changes["items"]
+        ] + [("deleted", {"id": contact_id}) for contact_id in changes["deleted"]]
+        context = {
+            "events": events,
+            "since": changes["next_since"],
+            "has_more": changes["has_more"],
+            "poll_seconds": settings.CONTACTS_POLL_SECONDS,
+        }
+        return render(request, self.changes_template, context)
+
+
+class AsyncContactEventsView(View):
+    """
+    Server-Sent Events for the index page under ASGI, relaying contact changes
+    from the backend as out-of-band swaps of the affected contact card. The page
+    passes the revision its list was read at as since, so no change made in
+    between is missed. Only routed with the async views: a stream read by a sync
+    view would hold a worker thread of a WSGI server for as long as the page is
+    open, and under ASGI would be read to the end before anything is sent
+    """
+
+    event_template = "partials/contact_event.html"
+
+    async def get(self, request):
+        """Get request for the contact events view"""
+
+        response = StreamingHttpResponse(
+            self.render_events(
+                request.headers.get("Last-Event-ID"), request.GET.get("since")
+            ),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def render_events(self, last_event_id: str | None, since: str | None):
+        """Helper method to render every backend event as a contact event"""
+
+        try:
+            async for event in astream_contact_events(last_event_id, since):
+                yield self.render_event(event)
+        except httpx.HTTPError:
+            # the browser reconnects on its own, resuming from the last event id
+            return
+
+    def render_event(self, event: dict | None) -> str:
+        """Helper method to render a backend event, or a keep-alive for None"""
+
+        if event is None:
+            return ": keep-alive\n\n"
+
+        html = render_to_string(
+            self.event_template,
+            {"event": event["event"], "contact": json.loads(event["data"])},
+        )
+        lines = [f"id: {event['id']}"] if "id" in event else []
+        lines.append("event: contact")
+        lines += [f"data: {line}" for line in html.strip().splitlines()]
+        return "\n".join(lines) + "\n\n"